@@ -4,9 +4,18 @@ import datetime
 import logging
 import os
 from pathlib import Path
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
+from pages.page_cache import CACHE_STATS
+from utils.cassettes import save_all as save_cassettes
+from utils.config import api_circuit_action, base_url, data_shard, data_validation
+from utils.data_validation import validate_data
+from utils.datos import DATA_CACHE_STATS, DataLoader, DataShard, TestDataHelper
+from utils.api_utils import APIClientRegistry
+from utils.driver_factory import DriverFactory
+from utils.driver_pool import DriverPool
+from utils.http_cache import HTTP_CACHE_STATS
+from utils.payloads import payload_pool
+from utils.retries import RETRY_STATS, CircuitOpenError
+from utils.timing import TIMING_STATS
 
 
 # Configuración de logging
@@ -25,6 +34,41 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Pool de navegadores de la sesión (se crea con el fixture driver_pool)
+_driver_pool = None
+# Clientes API compartidos de la sesión (se crea con el fixture api_clients)
+_api_registry = None
+
+
+def pytest_addoption(parser):
+    """Opciones de línea de comandos del proyecto"""
+    parser.addoption(
+        "--driver-pool-size",
+        action="store",
+        default=os.environ.get("DRIVER_POOL_SIZE", "auto"),
+        help="Navegadores a precalentar en segundo plano: 'auto' (según CPU y memoria) o un número, 0 lo desactiva",
+    )
+    parser.addoption(
+        "--data-shard",
+        action="store",
+        default=data_shard(),
+        help="Porción i/n de las filas de datos/ a ejecutar (tests marcados con @pytest.mark.datos)",
+    )
+
+
+def _driver_pool_size(config):
+    """Tamaño del pool de --driver-pool-size ('auto' o un entero >= 0)"""
+    value = str(config.getoption("--driver-pool-size")).strip().lower()
+    if value == "auto":
+        return DriverPool.auto_size()
+    try:
+        size = int(value)
+    except ValueError:
+        size = -1
+    if size < 0:
+        raise pytest.UsageError(f"--driver-pool-size inválido: {value!r} (se espera 'auto' o un número >= 0)")
+    return size
+
 
 def pytest_configure(config):
     """Configuración de marcadores personalizados y metadata"""
@@ -40,6 +84,24 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "e2e: Pruebas end-to-end del ciclo completo"
     )
+    config.addinivalue_line(
+        "markers", "fresh_browser: El test recibe un navegador nuevo en lugar de uno del pool"
+    )
+    config.addinivalue_line(
+        "markers", "full_fidelity: El test usa un navegador con carga completa (sin perfil lean)"
+    )
+    config.addinivalue_line(
+        "markers", "datos(archivo, argname, key, section, id_field): Parametriza el test con las filas del archivo"
+    )
+    # Validar el tamaño del pool antes de recolectar (--driver-pool-size / DRIVER_POOL_SIZE)
+    _driver_pool_size(config)
+
+    # Resolver el shard una sola vez, antes de recolectar (un error en pytest_generate_tests
+    # se repetiría por test); queda como shard por defecto de DataLoader.iter_rows
+    try:
+        DataShard.set_current(DataShard.parse(config.getoption("--data-shard")))
+    except ValueError as e:
+        raise pytest.UsageError(str(e)) from None
 
     # Agregar metadata al reporte HTML
     config._metadata = {
@@ -69,6 +131,20 @@ def pytest_html_results_summary(prefix, summary, postfix):
     """Agregar información adicional al resumen del reporte"""
     prefix.extend([html.p("Proyecto: Automation Testing Framework")])
     prefix.extend([html.p("Autor: Luciano Moliterno - QA Automation Engineer")])
+    if _driver_pool is not None:
+        prefix.extend([html.p(f"Pool de navegadores: {_driver_pool.resumen()}")])
+    if CACHE_STATS.hits or CACHE_STATS.misses:
+        prefix.extend([html.p(f"Caché de Page Objects: {CACHE_STATS.resumen()}")])
+    if DATA_CACHE_STATS.active:
+        prefix.extend([html.p(f"Caché de datos: {DATA_CACHE_STATS.resumen()}")])
+    if _api_registry is not None:
+        prefix.extend([html.p(f"Clientes API: {_api_registry.resumen()}")])
+    if HTTP_CACHE_STATS.active:
+        prefix.extend([html.p(f"Caché HTTP: {HTTP_CACHE_STATS.resumen()}")])
+    if TIMING_STATS.active:
+        prefix.extend([html.p(f"Tiempos API (ms) {line}") for line in TIMING_STATS.resumen_por_endpoint()])
+    if RETRY_STATS.active:
+        prefix.extend([html.p(f"Reintentos API: {RETRY_STATS.resumen()}")])
 
 
 def pytest_html_results_table_header(cells):
@@ -110,8 +186,25 @@ def pytest_runtest_makereport(item, call):
     """
     outcome = yield
     report = outcome.get_result()
+    # Un host con el circuit breaker abierto saltea el test en lugar de fallarlo (API_CIRCUIT_ACTION)
+    if (call.excinfo is not None and call.excinfo.errisinstance(CircuitOpenError)
+            and api_circuit_action() == "skip"):
+        report.outcome = "skipped"
+        report.longrepr = (str(item.path), item.location[1] or 0, f"Skipped: {call.excinfo.value}")
+    # Guardar el resultado de cada fase para que los fixtures puedan consultarlo
+    setattr(item, f"rep_{report.when}", report)
     report.description = str(item.function.__doc__) if item.function.__doc__ else item.name
 
+    # Tiempos de las requests API del test (fases por request) en el reporte
+    if report.when == "call" and TIMING_STATS.test_timings:
+        timings = [timing.as_dict() for timing in TIMING_STATS.test_timings]
+        report.user_properties.append(("api_timings", timings))
+        try:
+            import pytest_html  # type: ignore
+            report.extra = getattr(report, "extra", []) + [pytest_html.extras.json(timings, name="Tiempos API")]
+        except Exception:
+            pass
+
     # Logging de inicio/fin de tests
     if report.when == "call":
         test_name = item.nodeid
@@ -162,12 +255,53 @@ def pytest_runtest_makereport(item, call):
                 logger.error(f"Error al capturar screenshot: {e}")
 
 
+def pytest_generate_tests(metafunc):
+    """
+    Parametriza los tests marcados con @pytest.mark.datos("archivo") con las filas
+    del shard de este proceso, leídas de a una (ver DataLoader.iter_rows)
+    """
+    marker = metafunc.definition.get_closest_marker("datos")
+    if marker is None:
+        return
+    argname = marker.kwargs.get("argname", "test_data")
+    rows = list(DataLoader.iter_rows(marker.args[0], key=marker.kwargs.get("key"),
+                                     section=marker.kwargs.get("section")))
+    metafunc.parametrize(argname, rows,
+                         ids=TestDataHelper.prepare_test_ids(rows, marker.kwargs.get("id_field", "test_case")))
+
+
 def pytest_sessionstart(session):
     """Hook ejecutado al inicio de la sesión de pruebas"""
     logger.info("Sesión de pruebas iniciada")
     logger.info(f"Directorio de trabajo: {os.getcwd()}")
     logger.info(f"Total de tests a ejecutar: {session.testscollected}")
 
+    # Validar datos/ antes de recolectar (incremental: los archivos sin cambios no se revalidan)
+    if data_validation() and not hasattr(session.config, "workerinput"):
+        report = validate_data()
+        logger.info(f"Validación de datos: {report.resumen()}")
+        for warning in report.warnings:
+            logger.warning(f"  {warning}")
+        if not report.ok:
+            for error in report.errors:
+                logger.error(f"  {error}")
+            pytest.exit("Hay datos de prueba inválidos en datos/ (ver el log). DATA_VALIDATION=off omite el chequeo",
+                        returncode=pytest.ExitCode.USAGE_ERROR)
+
+
+def pytest_collection_finish(session):
+    """Precalienta navegadores en segundo plano solo si algún test recolectado usa el navegador"""
+    global _driver_pool
+    if not any("driver" in getattr(item, "fixturenames", ()) for item in session.items):
+        return
+    # Ni --collect-only ni el coordinador de pytest-xdist ejecutan tests: no precalientan
+    is_xdist_controller = (getattr(session.config.option, "numprocesses", None)
+                           and not hasattr(session.config, "workerinput"))
+    if session.config.option.collectonly or is_xdist_controller:
+        return
+    _driver_pool = DriverPool(DriverFactory.create_driver, size=_driver_pool_size(session.config))
+    _driver_pool.prewarm()
+
 
 def pytest_sessionfinish(session, exitstatus):
     """Hook ejecutado al final de la sesión de pruebas (tolerante a streams cerrados)"""
@@ -180,6 +314,34 @@ def pytest_sessionfinish(session, exitstatus):
         if hasattr(session, 'testscollected'):
             logger.info(f"Total de tests ejecutados: {session.testscollected}")
 
+        if _driver_pool is not None:
+            _driver_pool.close()
+            DriverFactory.shutdown()
+            logger.info(_driver_pool.resumen())
+
+        if CACHE_STATS.hits or CACHE_STATS.misses:
+            logger.info(f"Caché de Page Objects: {CACHE_STATS.resumen()}")
+
+        if DATA_CACHE_STATS.active:
+            logger.info(f"Caché de datos: {DATA_CACHE_STATS.resumen()}")
+
+        if _api_registry is not None:
+            logger.info(f"Clientes API: {_api_registry.resumen()}")
+            _api_registry.close()
+
+        if HTTP_CACHE_STATS.active:
+            logger.info(f"Caché HTTP: {HTTP_CACHE_STATS.resumen()}")
+
+        if TIMING_STATS.active:
+            logger.info("Tiempos API por endpoint (ms):")
+            for line in TIMING_STATS.resumen_por_endpoint():
+                logger.info(f"  {line}")
+
+        if RETRY_STATS.active:
+            logger.info(f"Reintentos API: {RETRY_STATS.resumen()}")
+
+        save_cassettes()
+
         if exitstatus == 0:
             logger.info("Todos los tests pasaron exitosamente")
         else:
@@ -191,81 +353,94 @@ def pytest_sessionfinish(session, exitstatus):
         pass
 
 
+@pytest.fixture(scope="session")
+def driver_pool():
+    """Pool de navegadores compartido por todos los tests UI de la sesión (o del worker)"""
+    global _driver_pool
+    if _driver_pool is None:
+        _driver_pool = DriverPool(DriverFactory.create_driver)
+    return _driver_pool
+
+
 @pytest.fixture
-def driver():
-    """Fixture para configurar el WebDriver con logging mejorado"""
+def driver(request, driver_pool):
+    """
+    Fixture para obtener un WebDriver del pool con logging mejorado.
+    Los tests marcados con @pytest.mark.fresh_browser reciben un navegador
+    nuevo que se cierra al terminar, sin pasar por el pool.
+    Los marcados con @pytest.mark.full_fidelity reciben un navegador nuevo
+    con el perfil 'full' (carga normal, imágenes y fuentes).
+    """
     logger.info("-" * 60)
     logger.info("Iniciando WebDriver para test UI")
 
-    chrome_options = Options()
-    chrome_options.add_argument("--start-maximized")
-    chrome_options.add_argument("--disable-notifications")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")  # Para CI
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
+    full = request.node.get_closest_marker("full_fidelity") is not None
+    fresh = full or request.node.get_closest_marker("fresh_browser") is not None
+    driver = driver_pool.acquire(fresh=fresh, profile="full" if full else None)
+    failed = True
 
-    # Detectar si estamos en CI (GitHub Actions)
-    is_ci = os.environ.get('CI') == 'true' or os.environ.get('GITHUB_ACTIONS') == 'true' or os.environ.get('HEADLESS') == 'true'
+    try:
+        # Navegar a la página inicial
+        logger.info(f"Navegando a {base_url()}...")
+        driver.get(base_url())
+        logger.info(f"Página cargada: {driver.current_url}")
 
-    if is_ci:
-        logger.info("Ejecutando en entorno CI - Configurando modo headless")
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--window-size=1920,1080")
+        yield driver
 
-    logger.info("Configurando ChromeDriver...")
+        rep_call = getattr(request.node, "rep_call", None)
+        failed = rep_call is None or rep_call.failed
 
-    driver = None
-    try:
-        # Inicializar el WebDriver
-        if is_ci:
-            # En CI, usar el driver del sistema
-            driver = webdriver.Chrome(options=chrome_options)
-        else:
-            # En local, usar la ruta específica
-            logger.info("Ejecutando en entorno local")
-            CHROME_DRIVER_PATH = r"C:\chromedriver\chromedriver.exe"
-            driver = webdriver.Chrome(
-                service=Service(CHROME_DRIVER_PATH),
-                options=chrome_options
-            )
+    finally:
+        # Limpieza después de cada test: el navegador vuelve al pool
+        # salvo que el test haya fallado (queda en cuarentena y se reemplaza)
+        logger.info("Liberando navegador...")
+        driver_pool.release(driver, reusable=not fresh, quarantine=failed)
+        logger.info("WebDriver liberado exitosamente")
+        logger.info("-" * 60)
 
-        driver.implicitly_wait(10)
 
-        logger.info("ChromeDriver iniciado exitosamente")
+@pytest.fixture(autouse=True)
+def _reset_payloads(request):
+    """
+    Cada test toma los payloads del pool desde una posición que depende de su nodeid
+    (los mismos en cada ejecución, sin importar el orden): con cassettes activos los
+    bodies coinciden con los grabados
+    """
+    payload_pool().reset(request.node.nodeid)
 
-        # Navegar a la página inicial
-        logger.info("Navegando a saucedemo.com...")
-        driver.get("https://www.saucedemo.com/")
-        logger.info(f"Página cargada: {driver.current_url}")
 
-        yield driver
+@pytest.fixture(scope="session")
+def api_clients():
+    """Registro de APIClient compartidos (uno por URL base) para toda la sesión"""
+    global _api_registry
+    if _api_registry is None:
+        _api_registry = APIClientRegistry()
+    return _api_registry
 
-    except Exception as e:
-        logger.error(f"Error al inicializar WebDriver: {e}")
-        raise
 
-    finally:
-        # Cleanup después de cada test
-        if driver:
-            logger.info("Cerrando navegador...")
-            driver.quit()
-            logger.info("WebDriver cerrado exitosamente")
-            logger.info("-" * 60)
+@pytest.fixture(autouse=True)
+def _isolate_api_clients():
+    """Cada test arranca con los clientes API compartidos sin cookies del test anterior"""
+    TIMING_STATS.begin_test()
+    if _api_registry is not None:
+        _api_registry.begin_test()
 
 
 @pytest.fixture
-def api_client():
-    """Fixture para tests API con logging"""
-    from utils.api_utils import APIClient
+def api_client(request, api_clients):
+    """
+    Fixture para tests API con logging
+    Entrega el cliente compartido para la BASE_URL del módulo de test
+    (las conexiones keep-alive se reutilizan entre tests)
+    """
+    base_url = getattr(request.module, "BASE_URL", None)
+    if base_url is None:
+        pytest.skip("El módulo de test no define BASE_URL")
 
     logger.info("-" * 60)
-    logger.info("Iniciando cliente API para test")
-
-    # Este fixture puede ser usado por tests que necesiten un cliente API genérico
-    # Los tests específicos pueden tener sus propios fixtures
+    logger.info(f"Cliente API compartido para {base_url}")
 
-    yield None
+    yield api_clients.get(base_url)
 
     logger.info("Finalizando test API")
     logger.info("-" * 60)
@@ -4,12 +4,9 @@ Autor: Luciano Moliterno
 Hooks globales para WebDriver, screenshots y logging
 """
 import logging
-import os
 from pathlib import Path
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
+from utils.driver_factory import DriverFactory
 
 # Configurar logging
 logging.basicConfig(
@@ -34,38 +31,9 @@ def before_all(context):
     screenshots_dir.mkdir(parents=True, exist_ok=True)
     logger.info(f"Directorio de screenshots: {screenshots_dir}")
 
-    # Configurar opciones de Chrome
-    chrome_options = Options()
-    chrome_options.add_argument("--start-maximized")
-    chrome_options.add_argument("--disable-notifications")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")  # Para CI
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
-
-    # Detectar si estamos en CI (GitHub Actions)
-    is_ci = os.environ.get('CI') == 'true' or os.environ.get('GITHUB_ACTIONS') == 'true' or os.environ.get('HEADLESS') == 'true'
-
-    if is_ci:
-        logger.info("Ejecutando en entorno CI - Configurando modo headless")
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--window-size=1920,1080")
-
     try:
         logger.info("Inicializando WebDriver...")
-        if is_ci:
-            # En CI, usar el driver del sistema
-            context.driver = webdriver.Chrome(options=chrome_options)
-        else:
-            # En local, usar la ruta específica
-            logger.info("Ejecutando en entorno local")
-            CHROME_DRIVER_PATH = r"C:\chromedriver\chromedriver.exe"
-            context.driver = webdriver.Chrome(
-                service=Service(CHROME_DRIVER_PATH),
-                options=chrome_options
-            )
-
-        context.driver.implicitly_wait(10)
+        context.driver = DriverFactory.create_driver()
         logger.info("WebDriver iniciado exitosamente")
     except Exception as e:
         logger.error(f"Error al inicializar WebDriver: {e}")
@@ -163,6 +131,8 @@ def after_all(context):
         except Exception as e:
             logger.error(f"Error al cerrar WebDriver: {e}")
 
+    DriverFactory.shutdown()
+
     # Resumen de screenshots capturados
     if hasattr(context, 'screenshots') and context.screenshots:
         logger.info(f"\nTotal de screenshots capturados: {len(context.screenshots)}")
@@ -5,6 +5,7 @@ Integración con Page Object Model
 """
 import logging
 from behave import given, when, then
+from utils.config import base_url
 from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
 from pages.cart_page import CartPage
@@ -17,13 +18,11 @@ logger = logging.getLogger(__name__)
 def step_impl(context, username, password):
     """Autenticar usuario automáticamente"""
     logger.info(f"Step: Autenticando usuario '{username}'")
-    context.driver.get("https://www.saucedemo.com/")
+    context.driver.get(base_url())
 
-    # Usar LoginPage para autenticarse
+    # Autenticar con la cookie de sesión (el login por UI se valida en login.feature)
     login_page = LoginPage(context.driver)
-    login_page.set_username(username)
-    login_page.set_password(password)
-    login_page.click_login()
+    login_page.authenticate(username, password)
 
     # Inicializar páginas
     context.inventory_page = InventoryPage(context.driver)
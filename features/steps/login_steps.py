@@ -5,6 +5,7 @@ Integración con Page Object Model
 """
 import logging
 from behave import given, when, then
+from utils.config import base_url
 from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
 
@@ -16,7 +17,7 @@ logger = logging.getLogger(__name__)
 def step_impl(context):
     """Navegar a la página de login"""
     logger.info("Step: Navegando a la página de login de SauceDemo")
-    context.driver.get("https://www.saucedemo.com/")
+    context.driver.get(base_url())
     context.login_page = LoginPage(context.driver)
     logger.info("Página de login cargada exitosamente")
 
@@ -0,0 +1,393 @@
+/*
+ * Réplica local de SauceDemo (login, inventario, carrito y checkout)
+ * Mantiene los mismos ids, clases y data-test que usan los Page Objects,
+ * la cookie "session-username" y el carrito en localStorage ("cart-contents")
+ */
+(function () {
+    "use strict";
+
+    var PASSWORD = "secret_sauce";
+    var USERS = ["standard_user", "locked_out_user", "problem_user",
+                 "performance_glitch_user", "error_user", "visual_user"];
+    var LOCKED_USERS = ["locked_out_user"];
+    var SESSION_COOKIE = "session-username";
+    var CART_KEY = "cart-contents";
+    var LOGIN_ERROR_KEY = "login-error";
+
+    var PRODUCTS = [
+        {id: 4, name: "Sauce Labs Backpack", price: 29.99,
+         desc: "carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising style with unequaled laptop and tablet protection."},
+        {id: 0, name: "Sauce Labs Bike Light", price: 9.99,
+         desc: "A red light isn't the desired state in testing but it sure helps when riding your bike at night. Water-resistant with 3 lighting modes, 1 AAA battery included."},
+        {id: 1, name: "Sauce Labs Bolt T-Shirt", price: 15.99,
+         desc: "Get your testing superhero on with the Sauce Labs bolt T-shirt. From American Apparel, 100% ringspun combed cotton, heather gray with red bolt."},
+        {id: 5, name: "Sauce Labs Fleece Jacket", price: 49.99,
+         desc: "It's not every day that you come across a midweight quarter-zip fleece jacket capable of handling everything from a relaxing day outdoors to a busy day at the office."},
+        {id: 2, name: "Sauce Labs Onesie", price: 7.99,
+         desc: "Rib snap infant onesie for the junior automation engineer in development. Reinforced 3-snap bottom closure, two-needle hemmed sleeved and bottom won't unravel."},
+        {id: 3, name: "Test.allTheThings() T-Shirt (Red)", price: 15.99,
+         desc: "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to automate a few tests. Super-soft and comfy ringspun combed cotton."}
+    ];
+
+    var SORTERS = {
+        az: function (a, b) { return a.name.localeCompare(b.name); },
+        za: function (a, b) { return b.name.localeCompare(a.name); },
+        lohi: function (a, b) { return a.price - b.price || a.name.localeCompare(b.name); },
+        hilo: function (a, b) { return b.price - a.price || a.name.localeCompare(b.name); }
+    };
+
+    var root = document.getElementById("root");
+
+    // ---------- Estado ----------
+
+    function currentUser() {
+        var match = document.cookie.match(new RegExp("(?:^|; )" + SESSION_COOKIE + "=([^;]*)"));
+        return match ? decodeURIComponent(match[1]) : null;
+    }
+
+    function setUser(username) {
+        document.cookie = SESSION_COOKIE + "=" + encodeURIComponent(username) + "; path=/";
+    }
+
+    function clearUser() {
+        document.cookie = SESSION_COOKIE + "=; path=/; expires=Thu, 01 Jan 1970 00:00:00 GMT";
+    }
+
+    function getCart() {
+        try {
+            var ids = JSON.parse(window.localStorage.getItem(CART_KEY));
+            return Array.isArray(ids) ? ids : [];
+        } catch (e) {
+            return [];
+        }
+    }
+
+    function saveCart(ids) {
+        if (ids.length) {
+            window.localStorage.setItem(CART_KEY, JSON.stringify(ids));
+        } else {
+            window.localStorage.removeItem(CART_KEY);
+        }
+    }
+
+    function findProduct(id) {
+        for (var i = 0; i < PRODUCTS.length; i++) {
+            if (PRODUCTS[i].id === id) { return PRODUCTS[i]; }
+        }
+        return null;
+    }
+
+    // ---------- Utilidades de DOM ----------
+
+    function el(tag, attrs, children) {
+        var node = document.createElement(tag);
+        Object.keys(attrs || {}).forEach(function (key) {
+            if (key === "text") {
+                node.textContent = attrs[key];
+            } else {
+                node.setAttribute(key, attrs[key]);
+            }
+        });
+        (children || []).forEach(function (child) {
+            if (child) { node.appendChild(child); }
+        });
+        return node;
+    }
+
+    function slug(name) {
+        return name.toLowerCase().replace(/ /g, "-");
+    }
+
+    function formatPrice(price) {
+        return "$" + price.toFixed(2);
+    }
+
+    function go(page) {
+        window.location.href = page;
+    }
+
+    // ---------- Login ----------
+
+    function renderLogin() {
+        var username = el("input", {"class": "input_error form_input", placeholder: "Username", type: "text",
+                                    "data-test": "username", id: "user-name", name: "user-name",
+                                    autocorrect: "off", autocapitalize: "none"});
+        var password = el("input", {"class": "input_error form_input", placeholder: "Password", type: "password",
+                                    "data-test": "password", id: "password", name: "password",
+                                    autocorrect: "off", autocapitalize: "none"});
+        var errorContainer = el("div", {"class": "error-message-container"});
+        var submit = el("input", {type: "submit", "class": "submit-button btn_action", "data-test": "login-button",
+                                  id: "login-button", name: "login-button", value: "Login"});
+        var form = el("form", {}, [
+            el("div", {"class": "form_group"}, [username]),
+            el("div", {"class": "form_group"}, [password]),
+            errorContainer,
+            submit
+        ]);
+
+        function showError(message) {
+            errorContainer.innerHTML = "";
+            errorContainer.className = "error-message-container error";
+            var close = el("button", {"class": "error-button", "data-test": "error-button", type: "button"});
+            close.addEventListener("click", function () {
+                errorContainer.innerHTML = "";
+                errorContainer.className = "error-message-container";
+            });
+            var heading = el("h3", {"data-test": "error"}, [close]);
+            heading.appendChild(document.createTextNode("Epic sadface: " + message));
+            errorContainer.appendChild(heading);
+        }
+
+        form.addEventListener("submit", function (event) {
+            event.preventDefault();
+            var user = username.value;
+            if (!user) { return showError("Username is required"); }
+            if (!password.value) { return showError("Password is required"); }
+            if (USERS.indexOf(user) === -1 || password.value !== PASSWORD) {
+                return showError("Username and password do not match any user in this service");
+            }
+            if (LOCKED_USERS.indexOf(user) !== -1) {
+                return showError("Sorry, this user has been locked out.");
+            }
+            setUser(user);
+            go("inventory.html");
+        });
+
+        root.appendChild(el("div", {"class": "login_container"}, [
+            el("div", {"class": "login_logo", text: "Swag Labs"}),
+            el("div", {"class": "login_wrapper"}, [
+                el("div", {"class": "login_wrapper-inner"}, [
+                    el("div", {id: "login_button_container", "class": "form_column"}, [
+                        el("div", {"class": "login-box"}, [form])
+                    ])
+                ])
+            ])
+        ]));
+
+        var pendingError = window.sessionStorage.getItem(LOGIN_ERROR_KEY);
+        if (pendingError) {
+            window.sessionStorage.removeItem(LOGIN_ERROR_KEY);
+            showError(pendingError);
+        }
+    }
+
+    // ---------- Encabezado común ----------
+
+    function renderHeader(title, secondary) {
+        var menu = el("div", {"class": "bm-menu-wrap", "aria-hidden": "true", hidden: "hidden"}, [
+            el("nav", {"class": "bm-item-list"}, [
+                el("a", {id: "inventory_sidebar_link", "class": "bm-item menu-item", href: "inventory.html", text: "All Items"}),
+                el("a", {id: "about_sidebar_link", "class": "bm-item menu-item", href: "https://saucelabs.com/", text: "About"}),
+                el("a", {id: "logout_sidebar_link", "class": "bm-item menu-item", href: "#", text: "Logout"}),
+                el("a", {id: "reset_sidebar_link", "class": "bm-item menu-item", href: "#", text: "Reset App State"})
+            ]),
+            el("button", {id: "react-burger-cross-btn", type: "button", text: "Close Menu"})
+        ]);
+        var burger = el("button", {id: "react-burger-menu-btn", type: "button", text: "Open Menu"});
+        burger.addEventListener("click", function () {
+            menu.removeAttribute("hidden");
+            menu.setAttribute("aria-hidden", "false");
+        });
+        menu.querySelector("#react-burger-cross-btn").addEventListener("click", function () {
+            menu.setAttribute("hidden", "hidden");
+            menu.setAttribute("aria-hidden", "true");
+        });
+        menu.querySelector("#logout_sidebar_link").addEventListener("click", function (event) {
+            event.preventDefault();
+            clearUser();
+            go("./");
+        });
+        menu.querySelector("#reset_sidebar_link").addEventListener("click", function (event) {
+            event.preventDefault();
+            saveCart([]);
+            window.location.reload();
+        });
+
+        var cartLink = el("a", {"class": "shopping_cart_link", "data-test": "shopping-cart-link", href: "cart.html"});
+
+        root.appendChild(el("div", {id: "page_wrapper", "class": "page_wrapper"}, [
+            el("div", {id: "menu_button_container"}, [
+                el("div", {"class": "bm-burger-button"}, [burger]),
+                menu
+            ]),
+            el("div", {"class": "header_container", "data-test": "primary-header"}, [
+                el("div", {"class": "primary_header"}, [
+                    el("div", {"class": "header_label"}, [el("div", {"class": "app_logo", text: "Swag Labs"})]),
+                    el("div", {id: "shopping_cart_container", "class": "shopping_cart_container"}, [cartLink])
+                ]),
+                el("div", {"class": "header_secondary_container", "data-test": "secondary-header"}, [
+                    el("span", {"class": "title", "data-test": "title", text: title}),
+                    secondary
+                ])
+            ]),
+            el("div", {id: "contents_wrapper"}, [el("div", {id: "content"})])
+        ]));
+        updateBadge();
+        return document.getElementById("content");
+    }
+
+    function updateBadge() {
+        var link = document.querySelector(".shopping_cart_link");
+        if (!link) { return; }
+        link.innerHTML = "";
+        var count = getCart().length;
+        if (count) {
+            link.appendChild(el("span", {"class": "shopping_cart_badge", "data-test": "shopping-cart-badge",
+                                         text: String(count)}));
+        }
+    }
+
+    function cartButton(product, inCart, extraClass) {
+        var button = el("button", {
+            "class": "btn " + (inCart ? "btn_secondary" : "btn_primary") + " btn_small " + extraClass,
+            id: (inCart ? "remove-" : "add-to-cart-") + slug(product.name),
+            name: (inCart ? "remove-" : "add-to-cart-") + slug(product.name),
+            "data-test": (inCart ? "remove-" : "add-to-cart-") + slug(product.name),
+            type: "button",
+            text: inCart ? "Remove" : "Add to cart"
+        });
+        return button;
+    }
+
+    function itemLabel(product) {
+        return [
+            el("a", {href: "#", id: "item_" + product.id + "_title_link", "data-test": "item-" + product.id + "-title-link"}, [
+                el("div", {"class": "inventory_item_name", "data-test": "inventory-item-name", text: product.name})
+            ]),
+            el("div", {"class": "inventory_item_desc", "data-test": "inventory-item-desc", text: product.desc})
+        ];
+    }
+
+    // ---------- Inventario ----------
+
+    function renderInventory() {
+        var sort = el("select", {"class": "product_sort_container", "data-test": "product-sort-container"}, [
+            el("option", {value: "az", text: "Name (A to Z)"}),
+            el("option", {value: "za", text: "Name (Z to A)"}),
+            el("option", {value: "lohi", text: "Price (low to high)"}),
+            el("option", {value: "hilo", text: "Price (high to low)"})
+        ]);
+        var content = renderHeader("Products", el("div", {"class": "right_component"}, [
+            el("span", {"class": "select_container"}, [sort])
+        ]));
+        var list = el("div", {"class": "inventory_list", "data-test": "inventory-list"});
+        content.appendChild(el("div", {id: "inventory_container", "class": "inventory_container"}, [list]));
+
+        function renderItems() {
+            var cart = getCart();
+            list.innerHTML = "";
+            PRODUCTS.slice().sort(SORTERS[sort.value]).forEach(function (product) {
+                var button = cartButton(product, cart.indexOf(product.id) !== -1, "btn_inventory");
+                button.addEventListener("click", function () {
+                    var ids = getCart();
+                    var position = ids.indexOf(product.id);
+                    if (position === -1) {
+                        ids.push(product.id);
+                    } else {
+                        ids.splice(position, 1);
+                    }
+                    saveCart(ids);
+                    renderItems();
+                    updateBadge();
+                });
+                list.appendChild(el("div", {"class": "inventory_item", "data-test": "inventory-item"}, [
+                    el("div", {"class": "inventory_item_description"}, [
+                        el("div", {"class": "inventory_item_label"}, itemLabel(product)),
+                        el("div", {"class": "pricebar"}, [
+                            el("div", {"class": "inventory_item_price", "data-test": "inventory-item-price",
+                                       text: formatPrice(product.price)}),
+                            button
+                        ])
+                    ])
+                ]));
+            });
+        }
+
+        sort.addEventListener("change", renderItems);
+        renderItems();
+    }
+
+    // ---------- Carrito ----------
+
+    function renderCart() {
+        var content = renderHeader("Your Cart", null);
+        var list = el("div", {"class": "cart_list", "data-test": "cart-list"}, [
+            el("div", {"class": "cart_quantity_label", "data-test": "cart-quantity-label", text: "QTY"}),
+            el("div", {"class": "cart_desc_label", "data-test": "cart-desc-label", text: "Description"})
+        ]);
+        getCart().forEach(function (id) {
+            var product = findProduct(id);
+            if (!product) { return; }
+            var button = cartButton(product, true, "cart_button");
+            var item = el("div", {"class": "cart_item", "data-test": "inventory-item"}, [
+                el("div", {"class": "cart_quantity", "data-test": "item-quantity", text: "1"}),
+                el("div", {"class": "cart_item_label"}, itemLabel(product).concat([
+                    el("div", {"class": "item_pricebar"}, [
+                        el("div", {"class": "inventory_item_price", "data-test": "inventory-item-price",
+                                   text: formatPrice(product.price)}),
+                        button
+                    ])
+                ]))
+            ]);
+            button.addEventListener("click", function () {
+                saveCart(getCart().filter(function (cartId) { return cartId !== product.id; }));
+                list.removeChild(item);
+                updateBadge();
+            });
+            list.appendChild(item);
+        });
+
+        var continueShopping = el("button", {"class": "btn btn_secondary back btn_medium", id: "continue-shopping",
+                                             "data-test": "continue-shopping", type: "button", text: "Continue Shopping"});
+        continueShopping.addEventListener("click", function () { go("inventory.html"); });
+        var checkout = el("button", {"class": "btn btn_action btn_medium checkout_button", id: "checkout",
+                                     "data-test": "checkout", type: "button", text: "Checkout"});
+        checkout.addEventListener("click", function () { go("checkout-step-one.html"); });
+
+        content.appendChild(el("div", {id: "cart_contents_container", "class": "cart_contents_container"}, [
+            list,
+            el("div", {"class": "cart_footer"}, [continueShopping, checkout])
+        ]));
+    }
+
+    // ---------- Checkout (paso 1) ----------
+
+    function renderCheckout() {
+        var content = renderHeader("Checkout: Your Information", null);
+        var cancel = el("button", {"class": "btn btn_secondary back btn_medium cart_cancel_link", id: "cancel",
+                                   "data-test": "cancel", type: "button", text: "Cancel"});
+        cancel.addEventListener("click", function () { go("cart.html"); });
+        content.appendChild(el("div", {id: "checkout_info_container", "class": "checkout_info_container"}, [
+            el("form", {}, [
+                el("div", {"class": "checkout_info"}, [
+                    el("input", {"class": "input_error form_input", placeholder: "First Name", type: "text",
+                                 id: "first-name", name: "firstName", "data-test": "firstName"}),
+                    el("input", {"class": "input_error form_input", placeholder: "Last Name", type: "text",
+                                 id: "last-name", name: "lastName", "data-test": "lastName"}),
+                    el("input", {"class": "input_error form_input", placeholder: "Zip/Postal Code", type: "text",
+                                 id: "postal-code", name: "postalCode", "data-test": "postalCode"})
+                ]),
+                el("div", {"class": "checkout_buttons"}, [cancel])
+            ])
+        ]));
+    }
+
+    // ---------- Router ----------
+
+    var PAGES = {
+        login: {render: renderLogin, path: "/"},
+        inventory: {render: renderInventory, path: "/inventory.html"},
+        cart: {render: renderCart, path: "/cart.html"},
+        checkout: {render: renderCheckout, path: "/checkout-step-one.html"}
+    };
+
+    var page = PAGES[document.body.getAttribute("data-page")] || PAGES.login;
+    if (page !== PAGES.login && !currentUser()) {
+        // Igual que SauceDemo: las páginas internas exigen sesión y vuelven al login con error
+        window.sessionStorage.setItem(LOGIN_ERROR_KEY,
+            "You can only access '" + page.path + "' when you are logged in.");
+        window.location.replace("./");
+    } else {
+        page.render();
+    }
+}());
@@ -1,8 +1,11 @@
 """
 Clase base para todos los Page Objects
 """
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from pages.page_cache import CACHE_STATS, mark_settled, read_script, track_mutations
+from utils.waits import POLL_FREQUENCY, PRESENCE_TIMEOUT, WaitEngine, without_implicit_wait
 import os
 import time
 
@@ -12,7 +15,44 @@ class BasePage:
 
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 15)
+        # Caché de lecturas: se vacía cuando el driver registra cualquier mutación y
+        # solo guarda lo leído después de que la última acción se asentó
+        track_mutations(driver)
+        self.waits = WaitEngine(driver, on_settle=lambda: mark_settled(driver))
+        self.wait = self.waits.wait
+        self._cache = {}
+        self._cache_generation = None
+
+    def cached(self, key, loader):
+        """
+        Devuelve una lectura cacheada mientras no haya mutaciones en la página
+        (click, send_keys, get, back, execute_script...)
+        El valor se guarda solo si se leyó con la página asentada: después de la espera
+        de postcondición de la última acción (ver WaitEngine.settle) y sin mutaciones
+        en el medio. Tras un driver.get directo se lee del navegador hasta la próxima acción
+        :param key: Clave de la lectura
+        :param loader: Callable que obtiene el valor desde el navegador
+        """
+        generation = getattr(self.driver, "_pom_mutations", None)
+        if generation is None or generation != self._cache_generation:
+            if self._cache:
+                CACHE_STATS.invalidations += 1
+            self._cache = {}
+            self._cache_generation = generation
+
+        if key in self._cache:
+            CACHE_STATS.hits += 1
+            return self._cache[key]
+
+        CACHE_STATS.misses += 1
+        value = loader()
+        if generation is not None and generation == self.driver._pom_settled == self.driver._pom_mutations:
+            self._cache[key] = value
+        return value
+
+    def invalidate_cache(self):
+        """Descarta las lecturas cacheadas de esta página"""
+        self._cache = {}
 
     def find_element(self, locator):
         """Encuentra un elemento en la página"""
@@ -22,24 +62,39 @@ class BasePage:
         """Encuentra múltiples elementos en la página"""
         return self.driver.find_elements(*locator)
 
-    def click(self, locator):
-        """Hace clic en un elemento"""
+    def click(self, locator, expect=None):
+        """
+        Hace clic en un elemento
+        :param expect: Postcondición a esperar después del clic (ver utils.waits.Expect)
+        """
         element = self.wait.until(EC.element_to_be_clickable(locator))
         element.click()
-        time.sleep(1)
+        self.waits.settle(expect, demo_seconds=1)
 
-    def send_keys(self, locator, text):
-        """Envía texto a un campo de entrada"""
+    def send_keys(self, locator, text, expect=None):
+        """
+        Envía texto a un campo de entrada
+        :param expect: Postcondición a esperar después de escribir (ver utils.waits.Expect)
+        """
         element = self.find_element(locator)
         element.clear()
         element.send_keys(text)
-        time.sleep(0.5)
+        self.waits.settle(expect, demo_seconds=0.5)
 
     def get_text(self, locator):
         """Obtiene el texto de un elemento"""
         element = self.find_element(locator)
         return element.text
 
+    def take_snapshot(self, script):
+        """
+        Lee el estado de la página en un solo round-trip (execute_script)
+        :param script: JavaScript que devuelve estructuras planas, o null si la página aún no está lista
+        :return: Estructuras de Python (dict/list) devueltas por el script
+        """
+        return self.waits.until(lambda driver: read_script(driver, script),
+                                "La página no quedó lista para tomar el snapshot")
+
     def get_current_url(self):
         """Obtiene la URL actual"""
         return self.driver.current_url
@@ -64,10 +119,39 @@ class BasePage:
             print(f"[ERROR] Error al guardar captura: {e}")
             return None
 
-    def is_element_present(self, locator):
-        """Verifica si un elemento está presente"""
-        try:
-            self.driver.find_element(*locator)
-            return True
-        except:
-            return False
+    def find_elements_now(self, locator):
+        """Elementos presentes en este momento, sin esperar a que aparezcan"""
+        with without_implicit_wait(self.driver):
+            return self.driver.find_elements(*locator)
+
+    def is_element_present(self, locator, timeout=0):
+        """
+        Verifica si un elemento está presente
+        :param timeout: Segundos a esperar que aparezca (0 = responde con el DOM actual,
+                        solo para comprobar ausencias; ver wait_until_present)
+        """
+        return self._wait_presence(locator, True, timeout)
+
+    def wait_until_present(self, locator, timeout=PRESENCE_TIMEOUT):
+        """Verifica que un elemento está presente, dándole unos segundos para aparecer"""
+        return self._wait_presence(locator, True, timeout)
+
+    def is_element_absent(self, locator, timeout=0):
+        """
+        Verifica si un elemento no está presente
+        :param timeout: Segundos a esperar que desaparezca (0 = responde con el DOM actual)
+        """
+        return self._wait_presence(locator, False, timeout)
+
+    def _wait_presence(self, locator, present, timeout):
+        with without_implicit_wait(self.driver):
+            def _answer(driver):
+                return (len(driver.find_elements(*locator)) > 0) == present
+
+            if not timeout:
+                return _answer(self.driver)
+            try:
+                WebDriverWait(self.driver, timeout, poll_frequency=POLL_FREQUENCY).until(_answer)
+                return True
+            except TimeoutException:
+                return False
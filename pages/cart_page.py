@@ -3,6 +3,8 @@ Page Object para la página del Carrito de Compras
 """
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from selenium.common.exceptions import TimeoutException
+from utils.waits import Expect
 
 
 class CartPage(BasePage):
@@ -18,39 +20,71 @@ class CartPage(BasePage):
     CHECKOUT_BUTTON = (By.ID, "checkout")
     CART_QUANTITY = (By.CLASS_NAME, "cart_quantity")
 
+    # Estado completo del carrito en un solo execute_script (null hasta que se renderiza la lista)
+    SNAPSHOT_SCRIPT = """
+        if (!document.querySelector('.cart_list')) { return null; }
+        const text = (root, selector) => {
+            const el = root.querySelector(selector);
+            return el ? el.innerText.trim() : null;
+        };
+        const items = Array.from(document.querySelectorAll('.cart_item')).map((item, index) => {
+            const link = item.querySelector('[id$="_title_link"]');
+            const match = link ? link.id.match(/item_(\\d+)_title_link/) : null;
+            const quantity = text(item, '.cart_quantity');
+            return {
+                index: index,
+                id: match ? parseInt(match[1], 10) : null,
+                name: text(item, '.inventory_item_name'),
+                price: text(item, '.inventory_item_price'),
+                quantity: quantity ? parseInt(quantity, 10) : null,
+            };
+        });
+        const badge = text(document, '.shopping_cart_badge');
+        return {title: text(document, '.title'), items: items, badge: badge ? parseInt(badge, 10) : 0};
+    """
+
     def __init__(self, driver):
         super().__init__(driver)
 
+    def snapshot(self):
+        """
+        Obtiene nombres, precios, cantidades, ids de producto y contador del
+        carrito en un solo round-trip
+        :return: dict con 'title', 'items' (lista de dicts) y 'badge'
+        """
+        return self.cached("snapshot", lambda: self.take_snapshot(self.SNAPSHOT_SCRIPT))
+
     def get_page_title(self):
         """Obtiene el título de la página del carrito"""
-        return self.get_text(self.PAGE_TITLE)
+        return self.cached("title", lambda: self.get_text(self.PAGE_TITLE))
 
     def get_cart_items_count(self):
         """Obtiene la cantidad de items en el carrito"""
-        items = self.find_elements(self.CART_ITEMS)
-        return len(items)
+        return len(self.snapshot()["items"])
 
     def get_cart_item_names(self):
         """Obtiene los nombres de todos los productos en el carrito"""
-        items = self.find_elements(self.CART_ITEM_NAMES)
-        return [item.text for item in items]
+        return [item["name"] for item in self.snapshot()["items"]]
 
     def get_first_item_name(self):
         """Obtiene el nombre del primer item en el carrito"""
-        items = self.find_elements(self.CART_ITEM_NAMES)
-        if items:
-            return items[0].text
-        return None
+        items = self.snapshot()["items"]
+        return items[0]["name"] if items else None
 
     def remove_item(self, item_index=0):
         """Remueve un item del carrito por índice"""
         try:
-            buttons = self.find_elements(self.REMOVE_BUTTONS)
+            buttons = self.find_elements_now(self.REMOVE_BUTTONS)
             if buttons and item_index < len(buttons):
                 print(f"[OK] Removiendo item {item_index + 1} del carrito")
                 buttons[item_index].click()
+                # Postcondición: el carrito tiene un botón "Remove" menos
+                self.waits.settle(Expect.element_count_changes(self.REMOVE_BUTTONS, len(buttons)))
                 return True
             return False
+        except TimeoutException:
+            print("[ERROR] El item no se removió del carrito")
+            return False
         except Exception as e:
             print(f"[ERROR] Error al remover item: {e}")
             return False
@@ -58,12 +92,12 @@ class CartPage(BasePage):
     def click_continue_shopping(self):
         """Hace clic en el botón 'Continue Shopping'"""
         print("[OK] Continuando con las compras")
-        self.click(self.CONTINUE_SHOPPING_BUTTON)
+        self.click(self.CONTINUE_SHOPPING_BUTTON, expect=Expect.url_contains("inventory.html"))
 
     def click_checkout(self):
         """Hace clic en el botón 'Checkout'"""
         print("[OK] Procediendo al checkout")
-        self.click(self.CHECKOUT_BUTTON)
+        self.click(self.CHECKOUT_BUTTON, expect=Expect.url_contains("checkout-step-one.html"))
 
     def verify_page_loaded(self):
         """Verifica que la página del carrito se haya cargado correctamente"""
@@ -3,8 +3,9 @@ Page Object para la página de Inventario/Catálogo
 """
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support import expected_conditions as EC
+from utils.waits import Expect
 
 
 class InventoryPage(BasePage):
@@ -22,46 +23,71 @@ class InventoryPage(BasePage):
     MENU_BUTTON = (By.ID, "react-burger-menu-btn")
     PRODUCT_SORT = (By.CLASS_NAME, "product_sort_container")
 
+    # Estado completo del catálogo en un solo execute_script (null hasta que se renderiza la lista)
+    SNAPSHOT_SCRIPT = """
+        if (!document.querySelector('.inventory_list')) { return null; }
+        const text = (root, selector) => {
+            const el = root.querySelector(selector);
+            return el ? el.innerText.trim() : null;
+        };
+        const items = Array.from(document.querySelectorAll('.inventory_item')).map((item, index) => {
+            const link = item.querySelector('[id$="_title_link"]');
+            const match = link ? link.id.match(/item_(\\d+)_title_link/) : null;
+            const button = item.querySelector('button');
+            return {
+                index: index,
+                id: match ? parseInt(match[1], 10) : null,
+                name: text(item, '.inventory_item_name'),
+                price: text(item, '.inventory_item_price'),
+                button: button ? button.innerText.trim() : null,
+            };
+        });
+        const badge = text(document, '.shopping_cart_badge');
+        return {title: text(document, '.title'), items: items, badge: badge ? parseInt(badge, 10) : 0};
+    """
+
     def __init__(self, driver):
         super().__init__(driver)
 
+    def snapshot(self):
+        """
+        Obtiene nombres, precios, estado de los botones, ids de producto y contador
+        del carrito en un solo round-trip
+        :return: dict con 'title', 'items' (lista de dicts) y 'badge'
+        """
+        return self.cached("snapshot", lambda: self.take_snapshot(self.SNAPSHOT_SCRIPT))
+
     def get_page_title(self):
         """Obtiene el título de la página"""
-        return self.get_text(self.PAGE_TITLE)
+        return self.cached("title", lambda: self.get_text(self.PAGE_TITLE))
 
     def get_products_count(self):
         """Obtiene la cantidad de productos disponibles"""
-        products = self.find_elements(self.INVENTORY_ITEMS)
-        return len(products)
+        return len(self.snapshot()["items"])
 
     def get_all_product_names(self):
         """Obtiene los nombres de todos los productos"""
-        products = self.find_elements(self.PRODUCT_NAMES)
-        return [product.text for product in products]
+        return [item["name"] for item in self.snapshot()["items"]]
+
+    def get_all_product_prices(self):
+        """Obtiene los precios de todos los productos"""
+        return [item["price"] for item in self.snapshot()["items"]]
 
     def get_first_product_name(self):
         """Obtiene el nombre del primer producto"""
-        try:
-            products = self.find_elements(self.PRODUCT_NAMES)
-            if products:
-                return products[0].text
-        except NoSuchElementException:
-            return None
+        items = self.snapshot()["items"]
+        return items[0]["name"] if items else None
 
     def get_first_product_price(self):
         """Obtiene el precio del primer producto"""
-        try:
-            prices = self.find_elements(self.PRODUCT_PRICES)
-            if prices:
-                return prices[0].text
-        except NoSuchElementException:
-            return None
+        items = self.snapshot()["items"]
+        return items[0]["price"] if items else None
 
     def add_product_to_cart(self, product_index=0):
         """Añade un producto al carrito por índice (robusto para headless)"""
         try:
             # Contar cuántos "Remove" hay antes de agregar
-            pre_remove_count = len(self.find_elements(self.REMOVE_BUTTONS))
+            pre_remove_count = len(self.find_elements_now(self.REMOVE_BUTTONS))
 
             # Localizador indexado del botón "Add to cart"
             indexed_add_locator = (By.XPATH, f"(//button[contains(text(), 'Add to cart')])[{product_index + 1}]")
@@ -71,17 +97,14 @@ class InventoryPage(BasePage):
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
             self.driver.execute_script("arguments[0].click();", button)
 
-            # Esperar a que aparezca un botón "Remove" adicional (confirmación de agregado)
-            def remove_count_increased(driver):
-                return len(self.find_elements(self.REMOVE_BUTTONS)) > pre_remove_count
-
+            # Postcondición: aparece un botón "Remove" adicional (confirmación de agregado)
             try:
-                self.wait.until(lambda d: remove_count_increased(d))
+                self.waits.settle(Expect.element_count_changes(self.REMOVE_BUTTONS, pre_remove_count))
                 return True
             except TimeoutException:
                 # Como fallback, verificar si el badge del carrito apareció
                 try:
-                    self.wait.until(EC.presence_of_element_located(self.CART_BADGE))
+                    self.waits.settle(Expect.element_present(self.CART_BADGE), demo_seconds=0)
                     return True
                 except TimeoutException:
                     return False
@@ -91,29 +114,28 @@ class InventoryPage(BasePage):
 
     def get_cart_count(self):
         """Obtiene el número de items en el carrito"""
-        try:
-            badge = self.driver.find_element(*self.CART_BADGE)
-            return int(badge.text)
-        except NoSuchElementException:
-            return 0
+        return self.cached("cart_count", self._read_cart_count)
+
+    def _read_cart_count(self):
+        # Sin badge el carrito está vacío: se responde al instante, sin espera implícita
+        badges = self.find_elements_now(self.CART_BADGE)
+        return int(badges[0].text) if badges else 0
 
     def click_cart(self):
         """Hace clic en el ícono del carrito y espera navegación"""
         print("[OK] Navegando al carrito")
-        self.click(self.CART_LINK)
-        # Esperar a que cargue la URL del carrito
         try:
-            self.wait.until(EC.url_contains("cart.html"))
+            self.click(self.CART_LINK, expect=Expect.url_contains("cart.html"))
         except TimeoutException:
             pass
 
     def is_menu_button_present(self):
         """Verifica si el botón del menú está presente"""
-        return self.is_element_present(self.MENU_BUTTON)
+        return self.wait_until_present(self.MENU_BUTTON)
 
     def is_cart_icon_present(self):
         """Verifica si el ícono del carrito está presente"""
-        return self.is_element_present(self.CART_LINK)
+        return self.wait_until_present(self.CART_LINK)
 
     def verify_page_loaded(self):
         """Verifica que la página de inventario se haya cargado correctamente"""
@@ -3,7 +3,8 @@ Page Object para la página de Login
 """
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
-import time
+from utils import config
+from utils.waits import Expect, demo_pause
 
 
 class LoginPage(BasePage):
@@ -15,6 +16,12 @@ class LoginPage(BasePage):
     LOGIN_BUTTON = (By.ID, "login-button")
     ERROR_MESSAGE = (By.CSS_SELECTOR, "[data-test='error']")
 
+    # Cookie con la que SauceDemo identifica al usuario autenticado
+    SESSION_COOKIE = "session-username"
+
+    # Estado autenticado (cookies de sesión) cacheado por usuario
+    _auth_state = {}
+
     def __init__(self, driver):
         super().__init__(driver)
 
@@ -31,8 +38,12 @@ class LoginPage(BasePage):
     def click_login_button(self):
         """Hace clic en el botón de login"""
         print("[OK] Haciendo clic en Login")
-        self.click(self.LOGIN_BUTTON)
-        time.sleep(2)
+        # El login termina cuando se llega al inventario o aparece el mensaje de error
+        self.click(self.LOGIN_BUTTON, expect=Expect.any_of(
+            Expect.url_contains("inventory.html"),
+            Expect.element_present(self.ERROR_MESSAGE),
+        ))
+        demo_pause(2)
 
     def login(self, username, password):
         """Realiza el proceso completo de login"""
@@ -42,10 +53,45 @@ class LoginPage(BasePage):
 
     def is_error_message_displayed(self):
         """Verifica si se muestra un mensaje de error"""
-        return self.is_element_present(self.ERROR_MESSAGE)
+        return self.wait_until_present(self.ERROR_MESSAGE)
 
     def get_error_message(self):
         """Obtiene el texto del mensaje de error"""
         if self.is_error_message_displayed():
             return self.get_text(self.ERROR_MESSAGE)
         return None
+
+    def authenticate(self, username, password):
+        """
+        Deja al usuario autenticado en inventory.html sin pasar por el formulario.
+        Inyecta la cookie de sesión de SauceDemo (cacheada por usuario) y, si el
+        sitio no la acepta, hace el login por UI y guarda las cookies resultantes.
+        Los tests que validan el login en sí deben seguir usando login().
+        """
+        if config.login_mode() == "ui":
+            self.login(username, password)
+            return
+
+        # Las cookies solo se pueden definir estando en el dominio del sitio
+        base_url = config.base_url()
+        if not self.get_current_url().startswith(base_url):
+            self.driver.get(base_url)
+
+        cookies = self._auth_state.get(username) or [
+            {"name": self.SESSION_COOKIE, "value": username, "path": "/"}
+        ]
+        for cookie in cookies:
+            self.driver.add_cookie(cookie)
+        self.driver.get(config.page_url("inventory.html"))
+
+        if "inventory.html" in self.get_current_url():
+            print(f"[OK] Sesión de '{username}' restaurada por cookie")
+            self._auth_state[username] = cookies
+            return
+
+        print(f"[OK] Cookie de sesión rechazada, login por UI para '{username}'")
+        self.login(username, password)
+        self._auth_state[username] = [
+            {"name": c["name"], "value": c["value"], "path": c.get("path", "/")}
+            for c in self.driver.get_cookies()
+        ]
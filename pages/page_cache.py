@@ -0,0 +1,90 @@
+"""
+Caché de lecturas de los Page Objects con invalidación por mutaciones
+"""
+from selenium.webdriver.remote.command import Command
+
+
+# Comandos WebDriver que pueden cambiar el estado de la página
+MUTATING_COMMANDS = frozenset({
+    Command.GET,
+    Command.GO_BACK,
+    Command.GO_FORWARD,
+    Command.REFRESH,
+    Command.W3C_EXECUTE_SCRIPT,
+    Command.W3C_EXECUTE_SCRIPT_ASYNC,
+    Command.ADD_COOKIE,
+    Command.DELETE_COOKIE,
+    Command.DELETE_ALL_COOKIES,
+    Command.CLICK_ELEMENT,
+    Command.SEND_KEYS_TO_ELEMENT,
+    Command.CLEAR_ELEMENT,
+    Command.W3C_ACTIONS,
+    Command.SWITCH_TO_WINDOW,
+    Command.SWITCH_TO_FRAME,
+    Command.SWITCH_TO_PARENT_FRAME,
+    Command.NEW_WINDOW,
+    Command.CLOSE,
+    Command.W3C_ACCEPT_ALERT,
+    Command.W3C_DISMISS_ALERT,
+})
+
+
+class PageCacheStats:
+    """Contadores globales del caché de Page Objects (por proceso/worker)"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def resumen(self):
+        return (f"Lecturas cacheadas: {self.hits} | Lecturas al navegador: {self.misses} | "
+                f"Invalidaciones: {self.invalidations} | Tasa de aciertos: {self.hit_rate:.0%}")
+
+
+CACHE_STATS = PageCacheStats()
+
+
+def track_mutations(driver):
+    """
+    Instala un contador de mutaciones en el driver (una sola vez por driver).
+    Todos los comandos pasan por driver.execute, incluidos los de WebElement
+    (click, send_keys...) y los que los tests ejecutan directamente
+    (driver.get, back, execute_script...), así que cualquier mutación se detecta.
+    """
+    if hasattr(driver, "_pom_mutations"):
+        return
+
+    original_execute = driver.execute
+    driver._pom_mutations = 0
+    # Mutaciones ya asentadas (la acción esperó su postcondición); None: ninguna todavía
+    driver._pom_settled = None
+    driver._pom_raw_execute = original_execute
+
+    def execute(driver_command, params=None):
+        try:
+            return original_execute(driver_command, params)
+        finally:
+            if driver_command in MUTATING_COMMANDS:
+                driver._pom_mutations += 1
+
+    driver.execute = execute
+
+
+def mark_settled(driver):
+    """Registra que las mutaciones hechas hasta ahora ya se reflejan en la página"""
+    if hasattr(driver, "_pom_mutations"):
+        driver._pom_settled = driver._pom_mutations
+
+
+def read_script(driver, script):
+    """Ejecuta un script de solo lectura sin contarlo como mutación"""
+    raw_execute = getattr(driver, "_pom_raw_execute", None)
+    if raw_execute is None:
+        return driver.execute_script(script)
+    return raw_execute(Command.W3C_EXECUTE_SCRIPT, {"script": script, "args": []})["value"]
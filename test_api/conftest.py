@@ -0,0 +1,13 @@
+"""
+Fixtures compartidos por las pruebas de test_api/
+"""
+import pytest
+from utils.mock_api import MockAPIServer
+
+
+@pytest.fixture
+def mock_server():
+    """Mock dedicado al test, para no interferir con el mock compartido de API_TARGET=mock"""
+    server = MockAPIServer().start()
+    yield server
+    server.stop()
@@ -0,0 +1,60 @@
+"""
+Pruebas de los cassettes de record/replay de APIClient
+"""
+import pytest
+from utils import cassettes
+from utils.api_utils import APIClient
+from utils.cassettes import CassetteMiss
+
+
+@pytest.fixture
+def cassette_dir(tmp_path, monkeypatch):
+    """Cassettes en un directorio temporal y sin cassettes compartidos entre tests"""
+    monkeypatch.setenv("CASSETTE_DIR", str(tmp_path))
+    monkeypatch.setattr(cassettes, "_cassettes", {})
+    return tmp_path
+
+
+def test_replay_sin_red(mock_server, cassette_dir, monkeypatch):
+    """Lo grabado se reproduce con el servidor apagado, incluidas las secuencias con estado"""
+    monkeypatch.setenv("API_CASSETTES", "record")
+    client = APIClient(mock_server.url, cassette="posts")
+    created = client.post("/posts", json={"title": "t", "body": "b", "userId": 1}).json()
+    client.delete(f"/posts/{created['id']}")
+    assert client.get(f"/posts/{created['id']}").status_code == 404
+    cassettes.save_all()
+    mock_server.stop()
+
+    monkeypatch.setenv("API_CASSETTES", "replay")
+    monkeypatch.setattr(cassettes, "_cassettes", {})
+    client = APIClient(mock_server.url, cassette="posts")
+    # El orden de las claves del body no cambia el hash
+    assert client.post("/posts", json={"userId": 1, "body": "b", "title": "t"}).json() == created
+    assert client.delete(f"/posts/{created['id']}").status_code == 200
+    assert client.get(f"/posts/{created['id']}").status_code == 404
+    assert client.cassette.hits == 3
+
+
+def test_replay_estricto(mock_server, cassette_dir, monkeypatch):
+    """En replay una request no grabada falla en lugar de ir a la red"""
+    monkeypatch.setenv("API_CASSETTES", "record")
+    APIClient(mock_server.url, cassette="users").get("/api/users", params={"page": 1})
+    cassettes.save_all()
+
+    monkeypatch.setenv("API_CASSETTES", "replay")
+    client = APIClient(mock_server.url, cassette="users")
+    with pytest.raises(CassetteMiss):
+        client.get("/api/users", params={"page": 2})
+
+
+def test_refresh_regraba_solo_lo_nuevo(mock_server, cassette_dir, monkeypatch):
+    """refresh responde lo grabado y solo va a la red por las requests que cambiaron"""
+    monkeypatch.setenv("API_CASSETTES", "record")
+    APIClient(mock_server.url, cassette="users").get("/api/users", params={"page": 1})
+
+    monkeypatch.setenv("API_CASSETTES", "refresh")
+    client = APIClient(mock_server.url, cassette="users")
+    client.get("/api/users", params={"page": 1})
+    client.get("/api/users", params={"page": 2})
+
+    assert (client.cassette.hits, client.cassette.misses) == (1, 1)
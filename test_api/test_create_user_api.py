@@ -1,19 +1,15 @@
 """
 Pruebas de API para creación de usuarios
 """
+import asyncio
 import pytest
-from utils.api_utils import APIClient
+from utils.api_utils import AsyncAPIClient
+from utils.payloads import payload_pool
 
 
 BASE_URL = "https://reqres.in"
 
 
-@pytest.fixture
-def api_client():
-    """Fixture para crear una instancia del cliente API"""
-    return APIClient(BASE_URL)
-
-
 @pytest.mark.parametrize("name,job,expected_status", [
     ("John Doe", "Developer", 201),
     ("Jane Smith", "QA Engineer", 201),
@@ -136,3 +132,23 @@ def test_create_user_without_job(api_client):
     assert "createdAt" in response_json
 
     print(f"\n[OK] Usuario creado sin job - ID: {response_json['id']}")
+
+
+def test_create_users_batch():
+    """Crea un lote de usuarios en paralelo y valida cada respuesta"""
+    payloads = payload_pool().take("user", 5)
+
+    async def create_all():
+        async with AsyncAPIClient(BASE_URL, concurrency=5) as client:
+            return await client.batch(("POST", "/api/users", {"json": payload}) for payload in payloads)
+
+    responses = asyncio.run(create_all())
+
+    for payload, response in zip(payloads, responses):
+        assert response.status_code == 201, f"Expected 201, got {response.status_code}"
+        response_json = response.json()
+        assert response_json["name"] == payload["name"]
+        assert "id" in response_json
+        assert "createdAt" in response_json
+
+    print(f"\n[OK] {len(responses)} usuarios creados en paralelo")
@@ -0,0 +1,132 @@
+"""
+Pruebas de la caché de respuestas GET de APIClient contra el mock local
+"""
+import pytest
+import requests
+from utils.api_utils import APIClient
+from utils.http_cache import HttpCacheStats, ResponseCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_client(server, clock, directory=None, maxsize=16):
+    client = APIClient(server.url, cassette=False, cache=True)
+    client.response_cache = ResponseCache(maxsize, ttl=60, directory=directory, stats=HttpCacheStats(),
+                                          clock=clock)
+    return client
+
+
+def test_hit_dentro_del_ttl(mock_server, clock):
+    """Dentro del TTL la respuesta sale de la caché sin ir al servidor"""
+    client = make_client(mock_server, clock)
+    first = client.get("/api/users", params={"page": 1})
+    requests_made = mock_server.state.requests
+
+    second = client.get("/api/users", params={"page": 1})
+
+    assert (first.cache_status, second.cache_status) == ("miss", "hit")
+    assert second.json() == first.json()
+    assert mock_server.state.requests == requests_made
+
+
+def test_revalidacion_con_etag(mock_server, clock):
+    """Vencido el TTL se revalida con If-None-Match y un 304 reutiliza el body cacheado"""
+    client = make_client(mock_server, clock)
+    first = client.get("/posts/1")
+    clock.now += 61
+
+    second = client.get("/posts/1")
+
+    assert second.cache_status == "revalidated"
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert client.response_cache.stats.revalidated == 1
+
+
+def test_fresh_exige_confirmar_con_el_servidor(mock_server, clock):
+    """fresh=True revalida aunque la entrada no haya vencido"""
+    client = make_client(mock_server, clock)
+    client.get("/posts/1")
+    requests_made = mock_server.state.requests
+
+    assert client.get("/posts/1", fresh=True).cache_status == "revalidated"
+    assert mock_server.state.requests == requests_made + 1
+
+
+def test_modificacion_invalida_el_recurso(mock_server, clock):
+    """PATCH /posts/1 descarta lo cacheado de /posts/1 y de /posts"""
+    client = make_client(mock_server, clock)
+    client.get("/posts/1")
+    client.get("/posts")
+
+    client.patch("/posts/1", json={"title": "nuevo"})
+
+    updated = client.get("/posts/1")
+    assert updated.cache_status == "miss"
+    assert updated.json()["title"] == "nuevo"
+    assert client.get("/posts").cache_status == "miss"
+
+
+def test_cache_false_y_lru(mock_server, clock):
+    """cache=False evita la caché y al superar maxsize se descarta la entrada menos usada"""
+    client = make_client(mock_server, clock, maxsize=1)
+    assert not hasattr(client.get("/posts/1", cache=False), "cache_status")
+
+    client.get("/posts/1")
+    client.get("/posts/2")
+
+    assert client.get("/posts/1").cache_status == "miss"
+
+
+def test_respaldo_en_disco(mock_server, clock, tmp_path):
+    """Otra caché sobre el mismo directorio (otro worker o ejecución) reutiliza las respuestas"""
+    make_client(mock_server, clock, directory=tmp_path).get("/api/users/2")
+    requests_made = mock_server.state.requests
+
+    response = make_client(mock_server, clock, directory=tmp_path).get("/api/users/2")
+
+    assert response.cache_status == "hit"
+    assert response.json()["data"]["id"] == 2
+    assert mock_server.state.requests == requests_made
+
+
+def test_invalidacion_persiste_en_disco(mock_server, clock, tmp_path):
+    """Una modificación borra del disco el recurso y su colección: otra caché no los reutiliza"""
+    writer = make_client(mock_server, clock, directory=tmp_path)
+    writer.get("/posts/1")
+    writer.get("/posts")
+    writer.get("/posts/2")
+
+    writer.patch("/posts/1", json={"title": "nuevo"})
+
+    reader = make_client(mock_server, clock, directory=tmp_path)
+    assert reader.get("/posts/1").json()["title"] == "nuevo"
+    assert reader.get("/posts").cache_status == "miss"
+    assert reader.get("/posts/2").cache_status == "hit"
+
+
+def test_bytes_ahorrados_en_bytes(clock):
+    """bytes_saved cuenta los bytes del body, no los caracteres del texto"""
+    cache = ResponseCache(ttl=60, stats=HttpCacheStats(), clock=clock)
+
+    def send(headers):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = "{\"nombre\": \"Ñandú\"}".encode("utf-8")
+        return response
+
+    cache.fetch("http://api.local/items/1", None, send)
+    cache.fetch("http://api.local/items/1", None, send)
+
+    assert cache.stats.bytes_saved == len("{\"nombre\": \"Ñandú\"}".encode("utf-8"))
@@ -0,0 +1,65 @@
+"""
+Pruebas del modo carga (utils.load_test) contra el mock local
+"""
+import json
+import pytest
+from utils import load_test
+
+
+@pytest.fixture
+def mock_target(monkeypatch):
+    monkeypatch.setenv("API_TARGET", "mock")
+
+
+def test_carga_ciclo_de_vida_post(mock_target):
+    """Usuarios virtuales concurrentes ejecutando test_post_lifecycle por iteraciones"""
+    summary = load_test.run_load("post_lifecycle", users=4, iterations=3, ramp_up=0.1)
+
+    assert summary["scenario"] == "post_lifecycle"
+    assert summary["iterations"] == 12
+    assert summary["requests"] == 36
+    assert summary["error_rate"] == 0.0
+    assert set(summary["endpoints"]) == {"POST /posts", "PATCH /posts/{id}", "DELETE /posts/{id}"}
+    latency = summary["latency_ms"]
+    assert 0 < latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+    assert sum(summary["histogram_ms"].values()) == summary["requests"]
+    assert summary["throughput_rps"] > 0
+    # El resumen se puede guardar y comparar entre ejecuciones
+    assert json.loads(json.dumps(summary)) == summary
+
+
+def test_carga_por_duracion(mock_target):
+    """Con duración, cada usuario itera hasta que vence el tiempo"""
+    summary = load_test.run_load("test_api/test_users_api.py::test_get_single_user", users=2, duration=0.3)
+
+    assert summary["iterations"] >= 2
+    assert list(summary["endpoints"]) == ["GET /api/users/{id}"]
+
+
+def test_iteraciones_salteadas(mock_target, monkeypatch):
+    """Un pytest.skip del escenario (BaseException) se cuenta como salteada y el usuario sigue iterando"""
+    def skip(client):
+        pytest.skip("ReqRes devolvió 429")
+
+    monkeypatch.setattr(load_test, "load_scenario", lambda spec: ("skip", "https://reqres.in", skip))
+
+    summary = load_test.run_load("skip", users=2, iterations=3)
+
+    assert summary["skipped_iterations"] == 6
+    assert summary["skips"] == {"ReqRes devolvió 429": 6}
+    assert summary["iterations"] == 0 and summary["error_rate"] == 0.0
+
+
+def test_escenario_con_parametros_no_soportado():
+    with pytest.raises(ValueError):
+        load_test.load_scenario("test_api/test_post_lifecycle.py::test_post_lifecycle_multiple")
+
+
+def test_percentiles_y_comparacion():
+    values = [i / 1000 for i in range(1, 101)]
+    summary = load_test.latency_summary(values)
+    assert (summary["p50"], summary["p95"], summary["p99"]) == (50.0, 95.0, 99.0)
+
+    before = {"throughput_rps": 100.0, "error_rate": 0.0, "latency_ms": summary}
+    after = {"throughput_rps": 150.0, "error_rate": 0.0, "latency_ms": summary}
+    assert load_test.compare(before, after)[0] == "Throughput (req/s): 100.0 -> 150.0 (+50.0%)"
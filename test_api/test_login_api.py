@@ -2,18 +2,11 @@
 Pruebas parametrizadas de Login API
 """
 import pytest
-from utils.api_utils import APIClient
 
 
 BASE_URL = "https://reqres.in"
 
 
-@pytest.fixture
-def api_client():
-    """Fixture para crear una instancia del cliente API"""
-    return APIClient(BASE_URL)
-
-
 @pytest.mark.parametrize("email,password,expected_status,validate_token", [
     # Caso exitoso: credenciales válidas
     ("eve.holt@reqres.in", "cityslicka", 200, True),
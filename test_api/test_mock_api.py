@@ -0,0 +1,112 @@
+"""
+Pruebas del mock local de APIs (latencia e inyección de errores)
+"""
+import asyncio
+import time
+import pytest
+from requests.adapters import HTTPAdapter
+from utils.api_utils import APIClient, AsyncAPIClient
+
+
+@pytest.fixture
+def api_client(mock_server):
+    """Cliente apuntado directamente al mock (sin cassettes: se prueba el servidor)"""
+    return APIClient(mock_server.url, cassette=False)
+
+
+def test_mock_paginacion_usuarios(api_client):
+    """La paginación replica la de ReqRes: 12 usuarios, 6 por página"""
+    page_2 = api_client.get("/api/users", params={"page": 2}).json()
+
+    assert page_2["page"] == 2
+    assert page_2["total"] == 12
+    assert page_2["total_pages"] == 2
+    assert [user["id"] for user in page_2["data"]] == [7, 8, 9, 10, 11, 12]
+
+
+def test_mock_ciclo_de_vida_post(api_client):
+    """Los posts creados se pueden leer, actualizar y eliminar"""
+    post_id = api_client.post("/posts", json={"title": "t", "body": "b", "userId": 1}).json()["id"]
+
+    assert api_client.patch(f"/posts/{post_id}", json={"title": "nuevo"}).json()["title"] == "nuevo"
+    assert api_client.delete(f"/posts/{post_id}").status_code == 200
+    assert api_client.get(f"/posts/{post_id}").status_code == 404
+
+
+def test_mock_inyeccion_de_errores(mock_server):
+    """fail_next devuelve el error indicado y luego el mock responde normalmente"""
+    client = APIClient(mock_server.url, cassette=False)
+    # Sin reintentos, para observar la falla inyectada
+    client.session.mount("http://", HTTPAdapter())
+    mock_server.state.fail_next(429, path="/api/login", headers={"Retry-After": "1"})
+
+    payload = {"email": "eve.holt@reqres.in", "password": "cityslicka"}
+    throttled = client.post("/api/login", json=payload)
+    assert throttled.status_code == 429
+    assert throttled.headers["Retry-After"] == "1"
+    assert client.post("/api/login", json=payload).status_code == 200
+
+
+def test_mock_latencia(mock_server, api_client):
+    """La latencia configurada se agrega a cada respuesta"""
+    mock_server.state.latency = 0.05
+
+    start = time.perf_counter()
+    api_client.get("/posts/1")
+
+    assert time.perf_counter() - start >= 0.05
+
+
+def test_mock_async_batch_concurrente(mock_server):
+    """Un lote en paralelo tarda aproximadamente la latencia de una sola request"""
+    mock_server.state.latency = 0.2
+
+    async def fetch():
+        async with AsyncAPIClient(mock_server.url, concurrency=5, cassette=False) as client:
+            return await client.batch([("GET", f"/posts/{post_id}") for post_id in range(1, 6)])
+
+    start = time.perf_counter()
+    responses = asyncio.run(fetch())
+
+    assert [response.json()["id"] for response in responses] == [1, 2, 3, 4, 5]
+    assert time.perf_counter() - start < 0.2 * 3
+
+
+def test_mock_async_timeout_por_request(mock_server):
+    """El timeout de una request no afecta a las demás del lote"""
+    async def fetch():
+        async with AsyncAPIClient(mock_server.url, cassette=False) as client:
+            # Sin reintentos: la request lenta termina apenas vence su timeout
+            client.client.session.mount("http://", HTTPAdapter())
+            return await client.gather(
+                client.get("/api/users", params={"delay": 1}, timeout=0.2),
+                client.get("/api/users/2"),
+                return_exceptions=True,
+            )
+
+    slow, fast = asyncio.run(fetch())
+
+    assert isinstance(slow, Exception)
+    assert fast.status_code == 200
+
+
+def test_mock_async_cierre_no_bloquea_el_loop(mock_server):
+    """Al salir del contexto se espera la request en curso sin frenar las demás corutinas"""
+    mock_server.state.latency = 0.3
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.02)
+
+    async def run():
+        clock = asyncio.create_task(ticker())
+        async with AsyncAPIClient(mock_server.url, cassette=False) as client:
+            asyncio.ensure_future(client.get("/api/users/2"))
+            await asyncio.sleep(0.05)
+        clock.cancel()
+
+    asyncio.run(run())
+
+    assert len(ticks) >= 10
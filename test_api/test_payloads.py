@@ -0,0 +1,47 @@
+"""
+Pruebas del pool de payloads sembrado (utils.payloads)
+"""
+import pytest
+from utils.payloads import GENERATORS, PayloadPool
+
+
+def test_lotes_reproducibles_y_reutilizados_desde_disco(tmp_path):
+    """Con la misma semilla los lotes son iguales; el segundo pool los lee del disco sin Faker"""
+    first = PayloadPool(seed=7, size=20, directory=str(tmp_path))
+    posts = first.batch("post")
+
+    second = PayloadPool(seed=7, size=20, directory=str(tmp_path))
+
+    assert second.batch("post") == posts
+    assert second.generated == 0 and second._faker is None
+    assert len(posts) == 20 and set(posts[0]) == {"title", "body", "userId"}
+    assert PayloadPool(seed=8, size=20, directory="").batch("post") != posts
+
+
+def test_cursor_por_clave(tmp_path):
+    """Cada clave (nodeid del test) toma siempre los mismos payloads"""
+    pool = PayloadPool(seed=7, size=20, directory=str(tmp_path))
+    pool.reset("test_api/test_x.py::test_a")
+    first = pool.take("user", 3)
+
+    pool.draw("user")
+    pool.reset("test_api/test_x.py::test_a")
+
+    assert pool.take("user", 3) == first
+    assert len({payload["name"] for payload in first}) == 3
+
+
+def test_payload_es_una_copia(tmp_path):
+    pool = PayloadPool(seed=7, size=5, directory=str(tmp_path))
+    pool.reset()
+    pool.draw("credential")["email"] = "modificado"
+
+    pool.reset()
+
+    assert pool.draw("credential")["email"] != "modificado"
+
+
+def test_tipo_desconocido(tmp_path):
+    with pytest.raises(KeyError):
+        PayloadPool(directory=str(tmp_path)).batch("producto")
+    assert set(GENERATORS) == {"post", "user", "credential"}
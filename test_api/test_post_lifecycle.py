@@ -1,26 +1,18 @@
 """
 Prueba de ciclo de vida completo de un Post (E2E)
 Cubre operaciones CRUD: CREATE (POST), UPDATE (PATCH), DELETE
-Utiliza Faker para generar datos aleatorios
+Utiliza payloads generados con Faker por adelantado (utils.payloads)
 Valida esquema, tipos de datos y tiempos de respuesta
 """
 import pytest
-import time
-from faker import Faker
-from utils.api_utils import APIClient
+from utils.payloads import payload_pool
 
 
 # URL base de JSONPlaceholder (API pública para pruebas)
 BASE_URL = "https://jsonplaceholder.typicode.com"
 
-# Inicializar Faker
-fake = Faker('es_ES')
-
-
-@pytest.fixture
-def api_client():
-    """Fixture para crear una instancia del cliente API"""
-    return APIClient(BASE_URL)
+# Pool de payloads sembrado (Faker solo se carga si el lote no está en disco)
+payloads = payload_pool()
 
 
 @pytest.mark.e2e
@@ -38,25 +30,20 @@ def test_post_lifecycle(api_client):
     # ============================================
     print("\n[PASO 1] Creando post con Faker...")
 
-    # Generar datos con Faker
-    post_title = fake.sentence(nb_words=6)
-    post_body = fake.paragraph(nb_sentences=3)
-    post_user_id = fake.random_int(min=1, max=10)
-
-    payload_create = {
-        "title": post_title,
-        "body": post_body,
-        "userId": post_user_id
-    }
+    # Tomar un post generado con Faker del pool
+    payload_create = payloads.draw("post")
+    post_title = payload_create["title"]
+    post_body = payload_create["body"]
+    post_user_id = payload_create["userId"]
 
     print(f"  - Titulo: {post_title}")
     print(f"  - Body: {post_body[:50]}...")
     print(f"  - UserId: {post_user_id}")
 
-    # Realizar POST y medir tiempo
-    start_time = time.time()
+    # Realizar POST
     response_create = api_client.post("/posts", json=payload_create)
-    create_time = time.time() - start_time
+    # APIClient mide cada request con reloj monotónico (pool, conexión, servidor, descarga)
+    create_time = response_create.timing.total
 
     # Validar código de estado
     assert response_create.status_code == 201, \
@@ -65,21 +52,14 @@ def test_post_lifecycle(api_client):
     # Validar tiempo de respuesta (debe ser menor a 5 segundos)
     assert create_time < 5.0, \
         f"POST request took too long: {create_time:.2f} seconds"
-    print(f"  [OK] POST completado en {create_time:.3f} segundos")
+    print(f"  [OK] POST completado en {create_time:.3f} segundos "
+          f"(servidor: {response_create.timing.ttfb:.3f}s)")
 
     # Obtener respuesta JSON
     response_json = response_create.json()
 
-    # Validar esquema de respuesta (claves esperadas)
-    expected_keys_create = ["id", "title", "body", "userId"]
-    for key in expected_keys_create:
-        assert key in response_json, f"Key '{key}' not found in POST response"
-
-    # Validar tipos de datos
-    assert isinstance(response_json["id"], int), "El campo 'id' debe ser un entero"
-    assert isinstance(response_json["title"], str), "El campo 'title' debe ser un string"
-    assert isinstance(response_json["body"], str), "El campo 'body' debe ser un string"
-    assert isinstance(response_json["userId"], int), "El campo 'userId' debe ser un entero"
+    # Validar esquema y tipos de datos (todas las violaciones en un solo reporte)
+    api_client.validate_schema(response_json, "post")
 
     # Validar valores
     assert response_json["title"] == post_title, "El título no coincide"
@@ -106,10 +86,9 @@ def test_post_lifecycle(api_client):
 
     print(f"  - Nuevo titulo: {updated_title}")
 
-    # Realizar PATCH y medir tiempo
-    start_time = time.time()
+    # Realizar PATCH
     response_update = api_client.patch(f"/posts/{post_id}", json=payload_update)
-    update_time = time.time() - start_time
+    update_time = response_update.timing.total
 
     # Validar código de estado
     assert response_update.status_code == 200, \
@@ -123,12 +102,13 @@ def test_post_lifecycle(api_client):
     # Obtener respuesta JSON
     response_update_json = response_update.json()
 
-    # Validar esquema de respuesta
-    assert "title" in response_update_json, "Key 'title' not found in PATCH response"
+    # Validar esquema y tipos de datos
     # Nota: PATCH puede devolver solo los campos actualizados, no necesariamente el ID
-
-    # Validar tipos de datos
-    assert isinstance(response_update_json["title"], str), "El campo 'title' debe ser un string"
+    api_client.validate_schema(response_update_json, {
+        "type": "object",
+        "required": ["title"],
+        "properties": {"title": {"type": "string"}},
+    })
 
     # Validar que el título fue actualizado
     assert response_update_json["title"] == updated_title, \
@@ -144,10 +124,9 @@ def test_post_lifecycle(api_client):
     # ============================================
     print(f"\n[PASO 3] Eliminando post ID {post_id}...")
 
-    # Realizar DELETE y medir tiempo
-    start_time = time.time()
+    # Realizar DELETE
     response_delete = api_client.delete(f"/posts/{post_id}")
-    delete_time = time.time() - start_time
+    delete_time = response_delete.timing.total
 
     # Validar código de estado (200 para JSONPlaceholder)
     assert response_delete.status_code == 200, \
@@ -192,11 +171,7 @@ def test_post_lifecycle_multiple(api_client, num_posts):
 
     # Crear múltiples posts
     for i in range(num_posts):
-        payload = {
-            "title": fake.sentence(),
-            "body": fake.paragraph(),
-            "userId": fake.random_int(min=1, max=10)
-        }
+        payload = payloads.draw("post")
 
         response = api_client.post("/posts", json=payload)
         assert response.status_code == 201
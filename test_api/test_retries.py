@@ -0,0 +1,76 @@
+"""
+Pruebas de la política de reintentos de APIClient contra el mock local
+"""
+import pytest
+from utils.api_utils import APIClient
+from utils.retries import CircuitBreakers, CircuitOpenError, Retrier, RetryBudget, RetryStats
+
+
+@pytest.fixture
+def waits():
+    """Esperas pedidas por el retrier (no se duerme de verdad)"""
+    return []
+
+
+def make_client(server, waits, budget=30, threshold=5):
+    stats = RetryStats()
+    retrier = Retrier(budget=RetryBudget(budget), breakers=CircuitBreakers(threshold, 30, stats),
+                      stats=stats, sleep=waits.append)
+    return APIClient(server.url, cassette=False, retrier=retrier)
+
+
+def test_reintenta_get_respetando_retry_after(mock_server, waits):
+    """Un GET con 503 se reintenta esperando lo que pide Retry-After"""
+    client = make_client(mock_server, waits)
+    mock_server.state.fail_next(503, count=2, path="/posts", headers={"Retry-After": "2"})
+
+    assert client.get("/posts/1").status_code == 200
+    assert waits == [2.0, 2.0]
+    assert client.retrier.stats.retries == 2
+
+
+def test_no_reintenta_post(mock_server, waits):
+    """POST no es idempotente: no se reintenta salvo que se pida con retry=True"""
+    client = make_client(mock_server, waits)
+    payload = {"title": "t", "body": "b", "userId": 1}
+
+    mock_server.state.fail_next(503, path="/posts")
+    assert client.post("/posts", json=payload).status_code == 503
+    assert waits == []
+
+    mock_server.state.fail_next(503, path="/posts")
+    assert client.post("/posts", json=payload, retry=True).status_code == 201
+    assert len(waits) == 1
+
+
+def test_no_reintenta_401(mock_server, waits):
+    """Un 401 no se resuelve reintentando"""
+    client = make_client(mock_server, waits)
+    mock_server.state.fail_next(401, path="/api/users")
+
+    assert client.get("/api/users/2").status_code == 401
+    assert waits == []
+
+
+def test_presupuesto_de_reintentos(mock_server, waits):
+    """Agotado el presupuesto de la ejecución se devuelve el error sin seguir reintentando"""
+    client = make_client(mock_server, waits, budget=1)
+    mock_server.state.fail_next(500, count=5, path="/posts")
+
+    assert client.get("/posts/1").status_code == 500
+    assert len(waits) == 1
+    assert client.retrier.stats.budget_exhausted == 1
+
+
+def test_circuit_breaker_corta_sin_ir_a_la_red(mock_server, waits):
+    """Tras varias respuestas de bloqueo seguidas el host se corta sin hacer requests"""
+    client = make_client(mock_server, waits, threshold=2)
+    mock_server.state.fail_next(429, count=5, path="/posts")
+
+    assert client.get("/posts/1").status_code == 429
+    requests_made = mock_server.state.requests
+    with pytest.raises(CircuitOpenError):
+        client.get("/posts/2")
+
+    assert mock_server.state.requests == requests_made
+    assert client.retrier.stats.circuit_opens == 1
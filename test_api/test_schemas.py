@@ -0,0 +1,80 @@
+"""
+Pruebas del registro de esquemas compilados (utils.schemas)
+"""
+import time
+import pytest
+from utils.api_utils import APIClient
+from utils.mock_api import MockAPIServer
+from utils.schemas import SCHEMAS, SchemaError, SchemaViolation, compile_schema
+
+
+@pytest.fixture(scope="module")
+def photos():
+    """Las 5000 fotos de /photos servidas por el mock"""
+    server = MockAPIServer().start()
+    try:
+        response = APIClient(server.url, cassette=False).get("/photos")
+        assert response.status_code == 200
+        yield response.json()
+    finally:
+        server.stop()
+
+
+def test_valida_lista_completa_en_milisegundos(photos):
+    """Una lista de miles de registros se valida en una sola llamada y en pocos milisegundos"""
+    assert len(photos) == 5000
+    SCHEMAS.validate("photo", photos, many=True)
+
+    start = time.perf_counter()
+    SCHEMAS.validate("photo", photos, many=True)
+
+    assert time.perf_counter() - start < 0.1
+
+
+def test_junta_todas_las_violaciones(photos):
+    """Las violaciones de todos los registros se informan juntas, con su ruta"""
+    broken = [dict(photo) for photo in photos[:3]]
+    broken[0]["id"] = "1"
+    del broken[1]["url"]
+    broken[2]["thumbnailUrl"] = "ftp://placeholder"
+
+    with pytest.raises(SchemaViolation) as error:
+        SCHEMAS.validate("photo", broken, many=True)
+
+    assert error.value.violations == [
+        "$[0].id: se esperaba integer, llegó str",
+        "$[1].url: clave requerida ausente",
+        "$[2].thumbnailUrl: 'ftp://placeholder' no cumple el patrón '^https?://'",
+    ]
+
+
+def test_validador_compilado_una_vez():
+    """El validador se compila una vez y se reutiliza (también para esquemas en línea)"""
+    inline = {"type": "object", "required": ["id"]}
+
+    assert SCHEMAS.validator("post") is SCHEMAS.validator("post")
+    assert SCHEMAS.validator(inline) is SCHEMAS.validator(dict(inline))
+    assert SCHEMAS.errors(inline, {"id": 1}) == []
+
+
+def test_booleano_no_es_entero():
+    """True no pasa como integer aunque bool sea subclase de int en Python"""
+    assert SCHEMAS.errors({"type": "integer"}, True) == ["$: se esperaba integer, llegó bool"]
+
+
+def test_esquema_mal_definido():
+    with pytest.raises(SchemaError):
+        SCHEMAS.validator({"type": "object", "maxProperties": 3})
+
+
+@pytest.mark.parametrize("schema", [
+    {"required": []},
+    {"properties": {}},
+    {"items": {}},
+    {"properties": {"id": {}}},
+    {"type": "object", "properties": {"tags": {"items": {}}}},
+])
+def test_esquemas_sin_restricciones(schema):
+    """Un esquema sin chequeos compila (sin bloques if/for vacíos) y acepta cualquier valor"""
+    validate = compile_schema(schema)
+    assert validate({"id": 1, "tags": [1, "a"]}) == []
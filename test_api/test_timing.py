@@ -0,0 +1,78 @@
+"""
+Pruebas de los tiempos por request de APIClient (utils.timing)
+"""
+import pytest
+import requests
+from utils.api_utils import APIClient
+from utils.timing import SAMPLE_SIZE, TIMING_STATS, RequestTiming, TimingStats, percentile
+
+
+def test_fases_de_la_request(mock_server):
+    """La latencia del servidor aparece en ttfb; la conexión solo se paga en la primera request"""
+    mock_server.state.latency = 0.05
+    client = APIClient(mock_server.url, cassette=False)
+
+    first = client.get("/posts/1").timing
+    second = client.get("/posts/2").timing
+
+    assert first.new_connections == 1 and second.new_connections == 0
+    assert second.connect == 0.0
+    assert second.ttfb >= 0.05
+    assert second.ttfb > 10 * (second.pool_wait + second.download)
+    assert second.total >= second.pool_wait + second.connect + second.ttfb + second.download
+    assert (second.endpoint, second.status, second.source) == ("GET /posts/{id}", 200, "network")
+
+
+def test_tiempos_del_test_y_resumen_por_endpoint(mock_server):
+    """Las requests del test quedan disponibles para el reporte y el resumen por endpoint"""
+    client = APIClient(mock_server.url, cassette=False)
+    client.get("/api/users/2")
+    client.post("/api/users", json={"name": "n", "job": "j"})
+
+    assert [timing["endpoint"] for timing in (t.as_dict() for t in TIMING_STATS.test_timings)] == \
+        ["GET /api/users/{id}", "POST /api/users"]
+    assert any(line.startswith("GET /api/users/{id}: n=") for line in TIMING_STATS.resumen_por_endpoint())
+
+
+def test_respuesta_cacheada_sin_red(mock_server):
+    """Un hit de la caché no tiene fases de red"""
+    client = APIClient(mock_server.url, cassette=False, cache=True)
+    client.get("/posts/3")
+
+    timing = client.get("/posts/3").timing
+
+    assert timing.source == "cache"
+    assert timing.attempts == 0 and timing.ttfb == 0.0
+
+
+def test_hook_on_response(mock_server):
+    """on_response recibe cada request terminada, también las que lanzan una excepción"""
+    seen = []
+    client = APIClient(mock_server.url, cassette=False, on_response=lambda timing, response: seen.append(
+        (timing.endpoint, response.status_code if response is not None else None)))
+    client.get("/posts/1")
+    with pytest.raises(requests.ConnectionError):
+        client.get("http://127.0.0.1:9/posts/2", retry=False)
+
+    assert seen == [("GET /posts/{id}", 200), ("GET /posts/{id}", None)]
+
+
+def test_resumen_por_endpoint_acotado():
+    """Por endpoint se guardan agregados y una muestra acotada, no cada RequestTiming"""
+    stats = TimingStats()
+    for _ in range(3 * SAMPLE_SIZE):
+        timing = RequestTiming("GET", "/posts/1")
+        timing.ttfb = timing.total = 0.001
+        stats.add(timing)
+    stats.begin_test()
+
+    endpoint = stats.by_endpoint["GET /posts/{id}"]
+    assert endpoint.count == 3 * SAMPLE_SIZE and len(endpoint.sample) == SAMPLE_SIZE
+    assert stats.resumen_por_endpoint() == [
+        f"GET /posts/{{id}}: n={3 * SAMPLE_SIZE} | total p50 1.0 / p95 1.0 | "
+        "media: pool_wait 0.0 | connect 0.0 | ttfb 1.0 | download 0.0 | client 0.0"]
+
+
+def test_percentil_por_rango_mas_cercano():
+    values = list(range(100, 0, -1))
+    assert (percentile(values, 50), percentile(values, 95), percentile([], 95)) == (50, 95, 0.0)
@@ -1,31 +1,24 @@
 """
 Pruebas de API para usuarios
 """
+import asyncio
 import pytest
-from utils.api_utils import APIClient
+from utils.api_utils import APIClient, AsyncAPIClient
 
 
 BASE_URL = "https://reqres.in"
 
 
-@pytest.fixture
-def api_client():
-    """Fixture para crear una instancia del cliente API"""
-    return APIClient(BASE_URL)
-
-
-def _retry_or_skip_reqres_page1(api_client: APIClient, endpoint: str, params: dict):
-    """Helper para reintentar llamadas a ReqRes page=1 y skip si persiste 401/403/429."""
+def _get_or_skip_reqres(api_client: APIClient, endpoint: str, params: dict):
+    """
+    GET a ReqRes que saltea el test si el servicio lo bloquea (401/403/429)
+    Los reintentos los hace el Retrier del cliente (utils.retries) y un circuito
+    abierto se saltea en conftest (API_CIRCUIT_ACTION): aquí no se vuelve a pedir
+    """
     response = api_client.get(endpoint, params=params)
     if response.status_code in (401, 403, 429):
-        retry_headers = {
-            "Referer": "https://reqres.in/",
-            "User-Agent": "pre-entrega-automation-tests/1.0 (+https://example.com)",
-            "Accept": "application/json",
-        }
-        response = api_client.get(endpoint, params=params, headers=retry_headers)
-        if response.status_code in (401, 403, 429):
-            pytest.skip(f"ReqRes devolvió {response.status_code} para page=1. Skip por bloqueo temporal del servicio externo.")
+        pytest.skip(f"ReqRes devolvió {response.status_code} para {endpoint} {params}. "
+                    f"Skip por bloqueo temporal del servicio externo.")
     return response
 
 
@@ -36,7 +29,7 @@ def test_get_users_page_1(api_client):
     Extra: valida que el avatar termina en .jpg
     """
     # Realizar petición GET a /api/users?page=1 (con manejo de bloqueos temporales)
-    response = _retry_or_skip_reqres_page1(api_client, "/api/users", {"page": 1})
+    response = _get_or_skip_reqres(api_client, "/api/users", {"page": 1})
 
     # Validar código de estado
     api_client.validate_status_code(response, 200)
@@ -44,31 +37,14 @@ def test_get_users_page_1(api_client):
     # Obtener respuesta JSON
     response_json = response.json()
 
-    # Validar que exista la clave 'data'
-    assert "data" in response_json, "Clave 'data' no encontrada en respuesta"
+    # Validar estructura y cada usuario en una sola pasada: claves requeridas,
+    # valores no vacíos y avatar .jpg (informa todas las violaciones juntas)
+    api_client.validate_schema(response_json, "users_page")
 
     users = response_json["data"]
     assert len(users) > 0, "No se encontraron usuarios en la respuesta"
 
-    # Validar cada usuario
-    required_keys = ["id", "email", "first_name", "last_name"]
-
     for user in users:
-        # Validar claves requeridas
-        for key in required_keys:
-            assert key in user, f"Clave '{key}' no encontrada en usuario {user.get('id', 'unknown')}"
-
-        # Validar que los valores no estén vacíos
-        assert user["id"], "ID del usuario esta vacio"
-        assert user["email"], "Email del usuario esta vacio"
-        assert user["first_name"], "First name del usuario esta vacio"
-        assert user["last_name"], "Last name del usuario esta vacio"
-
-        # Extra: Validar que el avatar termina en .jpg
-        if "avatar" in user:
-            assert user["avatar"].endswith(".jpg"), \
-                f"Avatar del usuario {user['id']} no termina en .jpg: {user['avatar']}"
-
         print(f"\n[OK] Usuario validado: {user['first_name']} {user['last_name']} - {user['email']}")
 
     print(f"\n[OK] Total de usuarios validados: {len(users)}")
@@ -77,15 +53,14 @@ def test_get_users_page_1(api_client):
 def test_get_users_structure(api_client):
     """Valida la estructura completa de la respuesta de usuarios"""
     # GET a page=1 con manejo de bloqueos
-    response = _retry_or_skip_reqres_page1(api_client, "/api/users", {"page": 1})
+    response = _get_or_skip_reqres(api_client, "/api/users", {"page": 1})
 
     assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
     response_json = response.json()
 
     # Validar estructura principal
-    expected_main_keys = ["page", "per_page", "total", "total_pages", "data"]
-    api_client.validate_json_keys(response_json, expected_main_keys)
+    api_client.validate_schema(response_json, "users_page")
 
     # Validar que page sea 1
     assert response_json["page"] == 1, "Page debe ser 1"
@@ -104,7 +79,7 @@ def test_get_users_structure(api_client):
 def test_get_users_multiple_pages(api_client, page):
     """Prueba parametrizada para obtener usuarios de diferentes páginas"""
     if page == 1:
-        response = _retry_or_skip_reqres_page1(api_client, "/api/users", {"page": page})
+        response = _get_or_skip_reqres(api_client, "/api/users", {"page": page})
     else:
         response = api_client.get("/api/users", params={"page": page})
 
@@ -114,10 +89,7 @@ def test_get_users_multiple_pages(api_client, page):
     users = response_json["data"]
 
     # Validar que todos los usuarios tengan avatar con .jpg
-    for user in users:
-        assert "avatar" in user, f"Usuario {user['id']} no tiene avatar"
-        assert user["avatar"].endswith(".jpg"), \
-            f"Avatar no termina en .jpg: {user['avatar']}"
+    api_client.validate_schema(users, "user", many=True)
 
     print(f"\n[OK] Pagina {page} validada con {len(users)} usuarios")
 
@@ -130,15 +102,32 @@ def test_get_single_user(api_client):
     api_client.validate_status_code(response, 200)
 
     response_json = response.json()
-    assert "data" in response_json, "Clave 'data' no encontrada"
+    # Claves requeridas y avatar .jpg
+    api_client.validate_schema(response_json, "single_user")
 
     user = response_json["data"]
-    required_keys = ["id", "email", "first_name", "last_name", "avatar"]
 
-    for key in required_keys:
-        assert key in user, f"Clave '{key}' no encontrada en usuario"
+    print(f"\n[OK] Usuario individual validado: {user['first_name']} {user['last_name']}")
+
 
-    # Validar avatar termina en .jpg
-    assert user["avatar"].endswith(".jpg"), "Avatar no termina en .jpg"
+def test_get_users_all_pages_concurrently(api_client):
+    """Valida todas las páginas de usuarios en paralelo (una latencia en lugar de la suma)"""
+    first_page = _get_or_skip_reqres(api_client, "/api/users", {"page": 1}).json()
+    total_pages = first_page["total_pages"]
 
-    print(f"\n[OK] Usuario individual validado: {user['first_name']} {user['last_name']}")
+    async def fetch_pages():
+        async with AsyncAPIClient(BASE_URL, concurrency=5) as client:
+            return await client.gather(*(client.get("/api/users", params={"page": page})
+                                         for page in range(2, total_pages + 1)))
+
+    responses = asyncio.run(fetch_pages())
+    users = list(first_page["data"])
+    for response in responses:
+        api_client.validate_status_code(response, 200)
+        users.extend(response.json()["data"])
+
+    ids = [user["id"] for user in users]
+    assert len(ids) == first_page["total"], f"Se esperaban {first_page['total']} usuarios, hay {len(ids)}"
+    assert len(set(ids)) == len(ids), "Hay usuarios repetidos entre páginas"
+
+    print(f"\n[OK] {total_pages} páginas validadas con {len(ids)} usuarios")
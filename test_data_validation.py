@@ -1,33 +1,32 @@
 """
-Script de prueba rápida para validar Data-Driven Testing
+Script de validación de los archivos de datos (ver utils.data_validation)
+Uso: python test_data_validation.py [--full]   (--full revalida también los archivos sin cambios)
 """
-from utils.datos import DataLoader
-
-print("\n" + "="*60)
-print("VALIDACIÓN DE ARCHIVOS DE DATOS")
-print("="*60)
-
-# Probar carga de CSV
-print("\n[1] Cargando datos desde login.csv...")
-login_data = DataLoader.get_login_data()
-if login_data:
-    print(f"    ✓ {len(login_data)} registros cargados correctamente")
-    print(f"    ✓ Primer registro: {login_data[0]}")
-else:
-    print("    ✗ Error al cargar CSV")
-
-# Probar carga de JSON
-print("\n[2] Cargando datos desde productos.json...")
-productos_data = DataLoader.get_productos_data()
-if productos_data:
-    print(f"    ✓ JSON cargado correctamente")
-    print(f"    ✓ Productos individuales: {len(productos_data.get('productos_a_comprar', []))}")
-    print(f"    ✓ Escenarios de compra múltiple: {len(productos_data.get('compras_multiples', []))}")
-    print(f"    ✓ Escenarios de carrito: {len(productos_data.get('escenarios_carrito', []))}")
-else:
-    print("    ✗ Error al cargar JSON")
-
-print("\n" + "="*60)
-print("VALIDACIÓN COMPLETADA")
-print("="*60 + "\n")
+import sys
+from utils.data_validation import validate_data
 
+
+def main():
+    print("\n" + "="*60)
+    print("VALIDACIÓN DE ARCHIVOS DE DATOS")
+    print("="*60)
+
+    report = validate_data(incremental="--full" not in sys.argv)
+
+    for file_report in report.files:
+        mark = "✗" if file_report.errors else "✓"
+        print(f"\n    {mark} {file_report.line()}")
+        for warning in file_report.warnings:
+            print(f"      ! {warning}")
+        for error in file_report.errors:
+            print(f"      ✗ {error}")
+
+    print("\n" + "="*60)
+    print(f"VALIDACIÓN COMPLETADA - {report.resumen()}")
+    print("="*60 + "\n")
+
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
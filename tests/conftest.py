@@ -0,0 +1,35 @@
+"""
+Fixtures compartidos por las pruebas de tests/ que no usan navegador
+"""
+import pytest
+from utils.datos import DataLoader
+
+PRODUCTOS_OK = ('{"productos_a_comprar": [{"id": 0, "nombre": "Sauce Labs Backpack", "precio": "$29.99"}],'
+                ' "compras_multiples": [{"productos_indices": [0, 1], "cantidad_esperada": 2}],'
+                ' "escenarios_carrito": [{"accion": "agregar_y_verificar", "producto_index": 5}]}')
+
+
+@pytest.fixture
+def datos_tmp(tmp_path, monkeypatch):
+    """Carpeta de datos y caché en disco temporales"""
+    monkeypatch.setattr(DataLoader, "get_data_path", staticmethod(lambda filename: str(tmp_path / filename)))
+    monkeypatch.setenv("DATA_CACHE_DIR", str(tmp_path / "cache"))
+    DataLoader.clear_cache()
+    yield tmp_path
+    DataLoader.clear_cache()
+
+
+@pytest.fixture
+def login_csv(datos_tmp):
+    """Escribe un login.csv con un caso por cada número de `cases`"""
+    def write(cases):
+        lines = ["username,password,expected_result,test_case"]
+        lines += [f"user{case},secret,success,caso {case}" for case in cases]
+        (datos_tmp / "login.csv").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return write
+
+
+@pytest.fixture
+def productos_ok():
+    """Contenido válido de productos.json"""
+    return PRODUCTOS_OK
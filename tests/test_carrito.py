@@ -9,9 +9,9 @@ from pages.cart_page import CartPage
 
 @pytest.fixture
 def logged_in_inventory_page(driver):
-    """Fixture para hacer login y retornar la página de inventario"""
+    """Fixture que autentica al usuario (cookie de sesión) y retorna la página de inventario"""
     login_page = LoginPage(driver)
-    login_page.login('standard_user', 'secret_sauce')
+    login_page.authenticate('standard_user', 'secret_sauce')
     return InventoryPage(driver)
 
 
@@ -5,6 +5,7 @@ import pytest
 from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
 from pages.cart_page import CartPage
+from utils.config import base_url, page_url
 from utils.datos import DataLoader
 
 
@@ -14,9 +15,9 @@ productos_data = DataLoader.get_productos_data()
 
 @pytest.fixture
 def logged_in_user(driver):
-    """Fixture que hace login y retorna el driver"""
+    """Fixture que autentica al usuario (cookie de sesión) y retorna el driver"""
     login_page = LoginPage(driver)
-    login_page.login('standard_user', 'secret_sauce')
+    login_page.authenticate('standard_user', 'secret_sauce')
     return driver
 
 
@@ -51,7 +52,7 @@ def test_agregar_productos_desde_json(logged_in_user, producto):
     inventory_page.take_screenshot(f"test_producto_json_{producto_id}")
 
     # Limpiar carrito para el siguiente test
-    driver.get("https://www.saucedemo.com/inventory.html")
+    driver.get(page_url("inventory.html"))
 
 
 @pytest.mark.parametrize("compra", productos_data.get('compras_multiples', []))
@@ -94,7 +95,7 @@ def test_compras_multiples_desde_json(logged_in_user, compra):
     cart_page.take_screenshot(f"test_compra_multiple_{cantidad_esperada}_productos")
 
     # Limpiar para el siguiente test
-    driver.get("https://www.saucedemo.com/inventory.html")
+    driver.get(page_url("inventory.html"))
 
 
 @pytest.mark.parametrize("escenario", productos_data.get('escenarios_carrito', []))
@@ -131,7 +132,7 @@ def test_escenarios_carrito_desde_json(logged_in_user, escenario):
         cart_page.remove_item(0)
 
         # Volver a inventory para verificar contador
-        driver.get("https://www.saucedemo.com/inventory.html")
+        driver.get(page_url("inventory.html"))
         inventory_page = InventoryPage(driver)
         final_count = inventory_page.get_cart_count()
 
@@ -154,7 +155,7 @@ def test_escenarios_carrito_desde_json(logged_in_user, escenario):
     inventory_page.take_screenshot(f"test_escenario_{accion}")
 
     # Limpiar
-    driver.get("https://www.saucedemo.com/inventory.html")
+    driver.get(page_url("inventory.html"))
 
 
 @pytest.mark.smoke
@@ -222,131 +223,3 @@ def test_validar_estructura_json():
     print(f"     - {len(productos)} productos")
     print(f"     - {len(data['compras_multiples'])} escenarios de compra múltiple")
     print(f"     - {len(data['escenarios_carrito'])} escenarios de carrito")
-"""
-Tests de Login usando Data-Driven Testing (DDT) con CSV
-"""
-import pytest
-from pages.login_page import LoginPage
-from pages.inventory_page import InventoryPage
-from utils.datos import DataLoader, TestDataHelper
-
-
-# Cargar datos desde CSV
-login_data = DataLoader.get_login_data()
-
-
-@pytest.mark.parametrize("test_data", login_data, ids=TestDataHelper.prepare_test_ids(login_data))
-@pytest.mark.smoke
-def test_login_desde_csv(driver, test_data):
-    """Test parametrizado: Login con datos desde CSV"""
-    # Arrange
-    login_page = LoginPage(driver)
-    inventory_page = InventoryPage(driver)
-
-    username = test_data['username']
-    password = test_data['password']
-    expected_result = test_data['expected_result']
-    test_case = test_data['test_case']
-
-    print(f"\n[TEST] Ejecutando: {test_case}")
-    print(f"[DATA] Usuario: '{username}', Password: '{'*' * len(password) if password else '(vacío)'}'")
-
-    # Act
-    login_page.login(username, password)
-
-    # Assert según el resultado esperado
-    if expected_result == 'success':
-        assert inventory_page.verify_page_loaded(), f"Login debería ser exitoso para: {test_case}"
-        assert "inventory.html" in driver.current_url, "No se redirigió a inventory"
-        print(f"[OK] Login exitoso - {test_case}")
-
-    elif expected_result == 'locked':
-        assert login_page.is_error_message_displayed(), f"Debería mostrar error para: {test_case}"
-        error_msg = login_page.get_error_message()
-        assert "locked out" in error_msg.lower(), f"Mensaje de error incorrecto: {error_msg}"
-        print(f"[OK] Usuario bloqueado detectado - {test_case}")
-
-    elif expected_result == 'error':
-        assert login_page.is_error_message_displayed(), f"Debería mostrar error para: {test_case}"
-        error_msg = login_page.get_error_message()
-        assert error_msg is not None, "No se mostró mensaje de error"
-        print(f"[OK] Error detectado correctamente - {test_case}")
-
-    # Screenshot
-    login_page.take_screenshot(f"test_login_csv_{test_case.replace(' ', '_')}")
-
-
-@pytest.mark.smoke
-def test_login_exitosos_desde_csv(driver):
-    """Test que valida solo los logins exitosos del CSV"""
-    # Filtrar solo los casos exitosos
-    successful_logins = TestDataHelper.filter_by_result(login_data, 'success')
-
-    print(f"\n[INFO] Validando {len(successful_logins)} casos de login exitoso")
-
-    for test_data in successful_logins:
-        login_page = LoginPage(driver)
-        inventory_page = InventoryPage(driver)
-
-        username = test_data['username']
-        password = test_data['password']
-        test_case = test_data['test_case']
-
-        print(f"\n[TEST] {test_case}")
-
-        # Navegar a la página de login si no estamos ahí
-        if "inventory.html" in driver.current_url:
-            driver.get("https://www.saucedemo.com/")
-
-        login_page.login(username, password)
-
-        # Verificar login exitoso
-        assert inventory_page.verify_page_loaded(), f"Login falló para: {username}"
-        print(f"[OK] {username} - Login verificado")
-
-        # Volver a login para el siguiente test
-        driver.get("https://www.saucedemo.com/")
-
-
-@pytest.mark.smoke
-def test_login_con_errores_desde_csv(driver):
-    """Test que valida los casos de error del CSV"""
-    # Filtrar solo los casos con error
-    error_logins = TestDataHelper.filter_by_result(login_data, 'error')
-
-    print(f"\n[INFO] Validando {len(error_logins)} casos de login con error")
-
-    login_page = LoginPage(driver)
-
-    for test_data in error_logins:
-        username = test_data['username']
-        password = test_data['password']
-        test_case = test_data['test_case']
-
-        print(f"\n[TEST] {test_case}")
-
-        login_page.login(username, password)
-
-        # Verificar que se muestra error
-        assert login_page.is_error_message_displayed(), f"No se mostró error para: {test_case}"
-        print(f"[OK] Error validado - {test_case}")
-
-        # Refrescar para el siguiente test
-        driver.refresh()
-
-
-def test_validar_estructura_csv():
-    """Test que valida la estructura del archivo CSV"""
-    data = DataLoader.get_login_data()
-
-    assert len(data) > 0, "El CSV debe contener datos"
-
-    # Verificar que todos los registros tienen los campos requeridos
-    required_fields = ['username', 'password', 'expected_result', 'test_case']
-
-    for i, record in enumerate(data):
-        for field in required_fields:
-            assert field in record, f"Registro {i} no tiene el campo '{field}'"
-
-    print(f"[OK] Estructura del CSV validada - {len(data)} registros correctos")
-
@@ -8,9 +8,9 @@ from pages.inventory_page import InventoryPage
 
 @pytest.fixture
 def logged_in_inventory_page(driver):
-    """Fixture para hacer login y retornar la página de inventario"""
+    """Fixture que autentica al usuario (cookie de sesión) y retorna la página de inventario"""
     login_page = LoginPage(driver)
-    login_page.login('standard_user', 'secret_sauce')
+    login_page.authenticate('standard_user', 'secret_sauce')
     return InventoryPage(driver)
 
 
@@ -46,9 +46,12 @@ def test_verificar_informacion_productos(logged_in_inventory_page):
     """Test 2: Verificar información de productos"""
     inventory_page = logged_in_inventory_page
 
+    # Obtener todo el catálogo en un solo round-trip
+    products = inventory_page.snapshot()["items"]
+
     # Obtener información del primer producto
-    product_name = inventory_page.get_first_product_name()
-    product_price = inventory_page.get_first_product_price()
+    product_name = products[0]["name"] if products else None
+    product_price = products[0]["price"] if products else None
 
     # Assert
     assert product_name is not None, "No se encontró el nombre del primer producto"
@@ -58,9 +61,9 @@ def test_verificar_informacion_productos(logged_in_inventory_page):
     print(f"[OK] Primer producto: {product_name} - Precio: {product_price}")
 
     # Verificar que hay múltiples productos
-    all_products = inventory_page.get_all_product_names()
-    assert len(all_products) >= 6, "No se encontraron suficientes productos"
-    print(f"[OK] Total de productos: {len(all_products)}")
+    assert len(products) >= 6, "No se encontraron suficientes productos"
+    assert all("$" in product["price"] for product in products), "Hay precios sin formato correcto"
+    print(f"[OK] Total de productos: {len(products)}")
 
     # Screenshot
     inventory_page.take_screenshot("test_verificar_informacion_productos")
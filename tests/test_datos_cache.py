@@ -0,0 +1,49 @@
+"""
+Pruebas de la caché de datos de prueba (utils.datos): memoria por proceso y compilado en disco entre workers
+"""
+import os
+from utils.datos import DATA_CACHE_STATS, DataLoader
+
+
+def _contadores():
+    return DATA_CACHE_STATS.compiled, DATA_CACHE_STATS.memory_hits, DATA_CACHE_STATS.disk_hits
+
+
+def test_se_parsea_una_vez_por_proceso(datos_tmp):
+    (datos_tmp / "login.csv").write_text("username,password\nuser,secret\n", encoding="utf-8")
+    compiled, memory, disk = _contadores()
+
+    first = DataLoader.load_csv("login.csv")
+    second = DataLoader.load_csv("login.csv")
+
+    assert first == [{"username": "user", "password": "secret"}]
+    assert second is first
+    assert _contadores() == (compiled + 1, memory + 1, disk)
+
+
+def test_otro_worker_usa_la_cache_en_disco(datos_tmp):
+    """Un proceso nuevo (memoria vacía) abre el compilado sin parsear el JSON"""
+    (datos_tmp / "productos.json").write_text('{"productos": [1, 2]}', encoding="utf-8")
+    DataLoader.load_json("productos.json")
+    DataLoader.clear_cache()
+    compiled, memory, disk = _contadores()
+
+    assert DataLoader.load_json("productos.json") == {"productos": [1, 2]}
+    assert _contadores() == (compiled, memory, disk + 1)
+
+
+def test_se_invalida_si_cambia_el_archivo(datos_tmp):
+    path = datos_tmp / "productos.json"
+    path.write_text('{"v": 1}', encoding="utf-8")
+    assert DataLoader.load_json("productos.json") == {"v": 1}
+
+    path.write_text('{"v": 22}', encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert DataLoader.load_json("productos.json") == {"v": 22}
+
+
+def test_archivo_inexistente(datos_tmp):
+    assert DataLoader.load_csv("no_existe.csv") == []
+    assert DataLoader.load_json("no_existe.json") == {}
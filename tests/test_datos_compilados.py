@@ -0,0 +1,100 @@
+"""
+Pruebas de los compilados de datos mapeados en memoria (utils.datos_compilados)
+"""
+import os
+import pytest
+from utils import datos_compilados
+from utils.datos import DATA_CACHE_STATS, DataLoader, DataShard
+
+
+def test_compilado_igual_al_csv(login_csv):
+    """El compilado se abre sin parsear el CSV y devuelve las mismas filas"""
+    compiled = DATA_CACHE_STATS.compiled
+    login_csv(range(50))
+    rows = DataLoader.load_csv("login.csv")
+
+    data = DataLoader.load_compiled("login.csv")
+    DataLoader.clear_cache()
+    reopened = DataLoader.load_compiled("login.csv")
+
+    assert DATA_CACHE_STATS.compiled == compiled + 1
+    assert list(reopened) == rows
+    assert reopened[-1]["test_case"] == "caso 49"
+    assert data.path == reopened.path
+
+
+def test_compilado_se_regenera_si_cambia_el_fuente(login_csv):
+    login_csv(range(3))
+    assert len(DataLoader.load_compiled("login.csv")) == 3
+
+    login_csv(range(7))
+
+    assert len(DataLoader.load_compiled("login.csv")) == 7
+
+
+def test_compilado_viejo_se_cierra_al_recompilar(login_csv):
+    """El mapeo anterior se cierra antes de reemplazar el archivo (en Windows no se puede reemplazar abierto)"""
+    login_csv(range(3))
+    old = DataLoader.load_compiled("login.csv")
+
+    login_csv(range(5))
+    new = DataLoader.load_compiled("login.csv")
+
+    assert old._map.closed and not new._map.closed
+    assert DataLoader.load_compiled("login.csv") is new
+
+
+def test_loaders_leen_el_compilado(datos_tmp, login_csv, productos_ok, monkeypatch):
+    """get_login_data, get_productos_data e iter_rows devuelven lo mismo que el parseo directo"""
+    monkeypatch.setattr(datos_compilados, "ITER_BLOCK", 4)
+    login_csv(range(10))
+    (datos_tmp / "productos.json").write_text(productos_ok, encoding="utf-8")
+
+    assert list(DataLoader.get_login_data()) == DataLoader.load_csv("login.csv")
+    assert list(DataLoader.iter_rows("login.csv", shard=DataShard())) == DataLoader.load_csv("login.csv")
+    productos = DataLoader.get_productos_data()
+    assert {name: list(value) for name, value in productos.items()} == DataLoader.load_json("productos.json")
+    assert list(DataLoader.iter_rows("productos.json", shard=DataShard(), section="compras_multiples")) == \
+        DataLoader.load_json("productos.json")["compras_multiples"]
+
+
+def test_compilado_json_por_secciones(datos_tmp):
+    (datos_tmp / "productos.json").write_text(
+        '{"productos_a_comprar": [{"id": 0}, {"id": 2}], "compras_multiples": [{"cantidad_esperada": 3}],'
+        ' "version": 2}', encoding="utf-8")
+
+    data = DataLoader.load_compiled("productos.json")
+
+    assert list(data.section("productos_a_comprar")) == [{"id": 0}, {"id": 2}]
+    assert data.section("compras_multiples")[0] == {"cantidad_esperada": 3}
+    assert len(data.section("escenarios_carrito")) == 0
+    assert data.scalars == {"version": 2}
+
+
+def test_error_de_lectura_no_se_oculta(datos_tmp):
+    """Solo un archivo inexistente devuelve el valor vacío: los demás errores no hacen desaparecer tests"""
+    (datos_tmp / "productos.json").write_text('{"productos_a_comprar": [', encoding="utf-8")
+
+    assert DataLoader.load_view("no_existe.json", {}) == {}
+    with pytest.raises(ValueError):
+        DataLoader.load_view("productos.json", {})
+
+
+def test_compilado_propio_si_no_se_puede_reemplazar(datos_tmp, login_csv, monkeypatch):
+    """Si el compilado compartido no se puede reemplazar (en Windows, mapeado por otro worker) se compila uno propio"""
+    replace = os.replace
+
+    def locked(src, dst):
+        if os.path.dirname(dst) == str(datos_tmp / "cache"):
+            raise PermissionError(13, "El archivo está en uso", dst)
+        replace(src, dst)
+
+    monkeypatch.setattr(datos_compilados, "_private_dir", lambda: str(datos_tmp / "propio"))
+    monkeypatch.setattr(datos_compilados.os, "replace", locked)
+    login_csv(range(5))
+
+    data = DataLoader.load_compiled("login.csv")
+
+    assert os.path.dirname(data.path) == str(datos_tmp / "propio")
+    assert [row["test_case"] for row in data] == [f"caso {i}" for i in range(5)]
+    assert not [name for name in os.listdir(datos_tmp / "cache") if name.endswith(".tmp")]
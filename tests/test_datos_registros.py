@@ -0,0 +1,56 @@
+"""
+Pruebas de los registros compactos e indexados (RecordStore)
+"""
+import copy
+import pickle
+from utils.datos import DataLoader, RecordStore, TestDataHelper
+
+
+def test_registros_indexados(datos_tmp):
+    """Los registros se usan como los dict del CSV y se filtran por índice"""
+    (datos_tmp / "login.csv").write_text(
+        "username,password,expected_result,test_case\n"
+        "standard_user,secret_sauce,success,Login exitoso\n"
+        "locked_out_user,secret_sauce,locked,Usuario bloqueado\n"
+        "problem_user,secret_sauce,success,Usuario con problemas\n", encoding="utf-8")
+    rows = DataLoader.load_csv("login.csv")
+
+    records = DataLoader.load_records("login.csv")
+
+    assert list(records) == rows
+    assert [record["username"] for record in TestDataHelper.filter_by_result(records, "success")] == \
+        ["standard_user", "problem_user"]
+    assert TestDataHelper.filter_by_result(records, "error") == []
+    assert records.lookup("username", "locked_out_user")["test_case"] == "Usuario bloqueado"
+    assert "expected_result" in records[0] and records[0].get("otro", "-") == "-"
+    assert TestDataHelper.prepare_test_ids(records) == [row["test_case"] for row in rows]
+    # Los valores repetidos se guardan una sola vez
+    assert records[0]["password"] is records[2]["password"]
+
+
+def test_registros_de_archivo_vacio(datos_tmp):
+    (datos_tmp / "login.csv").write_text("", encoding="utf-8")
+
+    records = DataLoader.load_records("login.csv")
+
+    assert len(records) == 0
+    assert TestDataHelper.filter_by_result(records, "success") == []
+
+
+def test_registros_serializables():
+    """El store viaja en la caché en disco y conserva los índices"""
+    store = RecordStore.from_rows([{"id": "1", "tipo": "a"}, {"id": "2", "tipo": "a"}], indexed=("tipo",))
+
+    copia = pickle.loads(pickle.dumps(store))
+
+    assert [dict(record) for record in copia.where("tipo", "a")] == [{"id": "1", "tipo": "a"}, {"id": "2", "tipo": "a"}]
+
+
+def test_record_serializable():
+    """Un Record suelto sobrevive a pickle, copy y deepcopy con sus campos y valores"""
+    record = RecordStore.from_rows([{"id": "1", "tipo": "a"}])[0]
+
+    for clone in (pickle.loads(pickle.dumps(record)), copy.copy(record), copy.deepcopy(record)):
+        assert type(clone) is type(record)
+        assert dict(clone) == {"id": "1", "tipo": "a"}
+        assert clone["tipo"] == "a"
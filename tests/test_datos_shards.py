@@ -0,0 +1,52 @@
+"""
+Pruebas del reparto de filas de datos entre shards (--data-shard)
+"""
+import pytest
+from utils.datos import DataLoader, DataShard
+
+
+def test_shards_reparten_todas_las_filas(login_csv):
+    """Cada fila cae en exactamente un shard"""
+    login_csv(range(200))
+
+    shards = [[row["test_case"] for row in DataLoader.iter_rows("login.csv", shard=f"{i}/3", key="test_case")]
+              for i in (1, 2, 3)]
+
+    assert sorted(case for shard in shards for case in shard) == sorted(f"caso {i}" for i in range(200))
+    assert all(shards)
+
+
+def test_shard_estable_al_agregar_filas(login_csv):
+    """Agregar filas no mueve las existentes a otro shard"""
+    login_csv(range(100))
+    before = {row["test_case"] for row in DataLoader.iter_rows("login.csv", shard="2/4", key="test_case")}
+
+    login_csv(range(150))
+    after = {row["test_case"] for row in DataLoader.iter_rows("login.csv", shard="2/4", key="test_case")}
+
+    assert before == {case for case in after if int(case.split()[1]) < 100}
+
+
+def test_filas_leidas_de_a_una(datos_tmp):
+    (datos_tmp / "productos.jsonl").write_text('{"id": 1}\n\n{"id": 2}\n', encoding="utf-8")
+
+    rows = DataLoader.iter_rows("productos.jsonl", shard=DataShard())
+
+    assert next(rows) == {"id": 1}
+    assert list(rows) == [{"id": 2}]
+
+
+def test_shard_por_defecto_de_la_ejecucion(login_csv, monkeypatch):
+    """iter_rows sin shard usa el fijado desde --data-shard (no DATA_SHARD)"""
+    login_csv(range(50))
+    monkeypatch.setenv("DATA_SHARD", "1/2")
+    monkeypatch.setattr(DataShard, "_current", DataShard.parse("2/2"))
+
+    rows = [row["test_case"] for row in DataLoader.iter_rows("login.csv", key="test_case")]
+
+    assert rows == [row["test_case"] for row in DataLoader.iter_rows("login.csv", shard="2/2", key="test_case")]
+
+
+def test_shard_invalido():
+    with pytest.raises(ValueError):
+        DataShard.parse("3/2")
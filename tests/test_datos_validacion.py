@@ -0,0 +1,66 @@
+"""
+Pruebas de la validación de los archivos de datos (utils.data_validation)
+"""
+from utils import data_validation
+from utils.data_validation import DataValidator
+
+
+def test_validacion_incremental(datos_tmp, login_csv, productos_ok):
+    """Los archivos válidos sin cambios no se revalidan en la siguiente ejecución"""
+    login_csv(range(10))
+    (datos_tmp / "productos.json").write_text(productos_ok, encoding="utf-8")
+    validator = DataValidator(datos_tmp, state_path=str(datos_tmp / "estado.json"))
+
+    first = validator.validate()
+    second = validator.validate()
+    login_csv(range(11))
+    third = validator.validate()
+
+    assert first.ok and [report.status for report in first.files] == ["ok", "ok"]
+    assert [report.status for report in second.files] == ["cached", "cached"]
+    assert [report.status for report in third.files] == ["ok", "cached"]
+
+
+def test_validacion_informa_errores(datos_tmp, productos_ok):
+    (datos_tmp / "login.csv").write_text(
+        "username,password,expected_result,test_case\n"
+        "standard_user,secret_sauce,success,Login exitoso\n"
+        "locked_out_user,secret_sauce,bloqueado,Usuario bloqueado\n", encoding="utf-8")
+    (datos_tmp / "productos.json").write_text(
+        productos_ok.replace('"producto_index": 5', '"producto_index": 6').replace('"cantidad_esperada": 2',
+                                                                                  '"cantidad_esperada": 3'),
+        encoding="utf-8")
+    (datos_tmp / "usuarios.csv").write_text("username\nuser\n", encoding="utf-8")
+
+    report = DataValidator(datos_tmp, state_path=str(datos_tmp / "estado.json")).validate()
+
+    assert not report.ok
+    assert report.errors == [
+        "login.csv: fila 2: expected_result: 'bloqueado' no es uno de ['success', 'error', 'locked']",
+        "productos.json: $.escenarios_carrito[0].producto_index: 6 es mayor que 5",
+        "productos.json: $.compras_multiples[0]: cantidad_esperada 3 no coincide con 2 productos_indices",
+    ]
+
+
+def test_login_vacio_es_advertencia(datos_tmp):
+    (datos_tmp / "login.csv").write_text("", encoding="utf-8")
+
+    report = DataValidator(datos_tmp, state_path=None).validate()
+
+    assert report.ok
+    assert report.warnings == ["login.csv: archivo vacío (sin registros)"]
+
+
+def test_validacion_en_pool_de_procesos(datos_tmp, login_csv, monkeypatch):
+    """Los bloques de un CSV grande se validan en varios procesos con el mismo resultado"""
+    monkeypatch.setattr(data_validation, "CHUNK_RECORDS", 100)
+    monkeypatch.setattr(data_validation, "POOL_MIN_RECORDS", 0)
+    login_csv(range(450))
+    path = datos_tmp / "login.csv"
+    path.write_text(path.read_text(encoding="utf-8").replace("caso 321", ""), encoding="utf-8")
+
+    report = DataValidator(datos_tmp, workers=2, state_path=None).validate()
+
+    assert report.workers == 2
+    assert report.files[0].records == 450
+    assert report.errors == ["login.csv: fila 322: test_case: '' tiene menos de 1 caracteres"]
@@ -0,0 +1,141 @@
+"""
+Tests de Login usando Data-Driven Testing (DDT) con CSV
+"""
+import pytest
+from pages.login_page import LoginPage
+from pages.inventory_page import InventoryPage
+from utils.config import base_url
+from utils.datos import DataLoader, DataShard, RecordStore, TestDataHelper
+
+
+LOGIN_CSV = 'login.csv'
+
+
+def login_rows():
+    """Filas del CSV de este shard (--data-shard), leídas de a una"""
+    return DataLoader.iter_rows(LOGIN_CSV, key='test_case')
+
+
+def login_records():
+    """Registros del CSV de este shard, indexados por expected_result (filtrar no recorre las filas)"""
+    if DataShard.current().total == 1:
+        return DataLoader.get_login_records()
+    return RecordStore.from_rows(login_rows(), indexed=DataLoader.RECORD_INDEXES)
+
+
+# Las filas se asignan al shard por el hash de test_case (ver conftest.pytest_generate_tests)
+@pytest.mark.datos(LOGIN_CSV, key='test_case')
+@pytest.mark.smoke
+def test_login_desde_csv(driver, test_data):
+    """Test parametrizado: Login con datos desde CSV"""
+    # Arrange
+    login_page = LoginPage(driver)
+    inventory_page = InventoryPage(driver)
+
+    username = test_data['username']
+    password = test_data['password']
+    expected_result = test_data['expected_result']
+    test_case = test_data['test_case']
+
+    print(f"\n[TEST] Ejecutando: {test_case}")
+    print(f"[DATA] Usuario: '{username}', Password: '{'*' * len(password) if password else '(vacío)'}'")
+
+    # Act
+    login_page.login(username, password)
+
+    # Assert según el resultado esperado
+    if expected_result == 'success':
+        assert inventory_page.verify_page_loaded(), f"Login debería ser exitoso para: {test_case}"
+        assert "inventory.html" in driver.current_url, "No se redirigió a inventory"
+        print(f"[OK] Login exitoso - {test_case}")
+
+    elif expected_result == 'locked':
+        assert login_page.is_error_message_displayed(), f"Debería mostrar error para: {test_case}"
+        error_msg = login_page.get_error_message()
+        assert "locked out" in error_msg.lower(), f"Mensaje de error incorrecto: {error_msg}"
+        print(f"[OK] Usuario bloqueado detectado - {test_case}")
+
+    elif expected_result == 'error':
+        assert login_page.is_error_message_displayed(), f"Debería mostrar error para: {test_case}"
+        error_msg = login_page.get_error_message()
+        assert error_msg is not None, "No se mostró mensaje de error"
+        print(f"[OK] Error detectado correctamente - {test_case}")
+
+    # Screenshot
+    login_page.take_screenshot(f"test_login_csv_{test_case.replace(' ', '_')}")
+
+
+@pytest.mark.smoke
+def test_login_exitosos_desde_csv(driver):
+    """Test que valida solo los logins exitosos del CSV"""
+    # Filtrar solo los casos exitosos
+    successful_logins = TestDataHelper.filter_by_result(login_records(), 'success')
+
+    print(f"\n[INFO] Validando {len(successful_logins)} casos de login exitoso")
+
+    for test_data in successful_logins:
+        login_page = LoginPage(driver)
+        inventory_page = InventoryPage(driver)
+
+        username = test_data['username']
+        password = test_data['password']
+        test_case = test_data['test_case']
+
+        print(f"\n[TEST] {test_case}")
+
+        # Navegar a la página de login si no estamos ahí
+        if "inventory.html" in driver.current_url:
+            driver.get(base_url())
+
+        login_page.login(username, password)
+
+        # Verificar login exitoso
+        assert inventory_page.verify_page_loaded(), f"Login falló para: {username}"
+        print(f"[OK] {username} - Login verificado")
+
+        # Volver a login para el siguiente test
+        driver.get(base_url())
+
+
+@pytest.mark.smoke
+def test_login_con_errores_desde_csv(driver):
+    """Test que valida los casos de error del CSV"""
+    # Filtrar solo los casos con error
+    error_logins = TestDataHelper.filter_by_result(login_records(), 'error')
+
+    print(f"\n[INFO] Validando {len(error_logins)} casos de login con error")
+
+    login_page = LoginPage(driver)
+
+    for test_data in error_logins:
+        username = test_data['username']
+        password = test_data['password']
+        test_case = test_data['test_case']
+
+        print(f"\n[TEST] {test_case}")
+
+        login_page.login(username, password)
+
+        # Verificar que se muestra error
+        assert login_page.is_error_message_displayed(), f"No se mostró error para: {test_case}"
+        print(f"[OK] Error validado - {test_case}")
+
+        # Refrescar para el siguiente test
+        driver.refresh()
+
+
+def test_validar_estructura_csv():
+    """Test que valida la estructura del archivo CSV"""
+    # Verificar que todos los registros tienen los campos requeridos (todo el archivo, de a una fila)
+    required_fields = ['username', 'password', 'expected_result', 'test_case']
+
+    total = 0
+    for i, record in enumerate(DataLoader.iter_rows(LOGIN_CSV, shard=DataShard())):
+        for field in required_fields:
+            assert field in record, f"Registro {i} no tiene el campo '{field}'"
+        total += 1
+
+    assert total > 0, "El CSV debe contener datos"
+
+    print(f"[OK] Estructura del CSV validada - {total} registros correctos")
+
@@ -0,0 +1,61 @@
+"""
+Tests de la caché de lecturas de los Page Objects (sin navegador: driver simulado)
+"""
+from selenium.webdriver.remote.command import Command
+from pages.inventory_page import InventoryPage
+
+
+class FakeBadge:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeDriver:
+    """Driver mínimo: cuenta las consultas al DOM y acepta cualquier comando"""
+
+    def __init__(self):
+        self.badges = []
+        self.finds = 0
+
+    def execute(self, driver_command, params=None):
+        return {"value": None}
+
+    def find_elements(self, by, value):
+        self.finds += 1
+        return list(self.badges)
+
+
+def test_lecturas_repetidas_entre_acciones_no_van_al_navegador():
+    driver = FakeDriver()
+    page = InventoryPage(driver)
+    driver.badges = [FakeBadge("2")]
+    page.waits.settle(demo_seconds=0)
+
+    assert [page.get_cart_count() for _ in range(3)] == [2, 2, 2]
+    assert driver.finds == 1
+
+
+def test_mutacion_invalida_la_lectura():
+    driver = FakeDriver()
+    page = InventoryPage(driver)
+    page.waits.settle(demo_seconds=0)
+    assert page.get_cart_count() == 0
+
+    driver.execute(Command.CLICK_ELEMENT)
+    driver.badges = [FakeBadge("1")]
+    page.waits.settle(demo_seconds=0)
+
+    assert page.get_cart_count() == 1
+    assert driver.finds == 2
+
+
+def test_sin_asentar_no_se_cachea():
+    """Después de una mutación sin espera de postcondición (driver.get directo) se lee siempre del DOM"""
+    driver = FakeDriver()
+    page = InventoryPage(driver)
+    driver.execute(Command.GET, {"url": "about:blank"})
+
+    page.get_cart_count()
+    page.get_cart_count()
+
+    assert driver.finds == 2
@@ -1,9 +1,9 @@
 import pytest
-import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from utils.base import BaseTest
 from utils.helpers import Helpers
+from utils.waits import demo_pause
 
 
 class TestSauceDemo(BaseTest):
@@ -23,7 +23,7 @@ class TestSauceDemo(BaseTest):
         # Tomar captura de pantalla
         helpers.take_screenshot("test_login_exitoso")
         print(" Test 1 completado: Login exitoso")
-        time.sleep(2)  # Pausa final
+        demo_pause(2)  # Pausa final (solo en modo demo)
 
     def test_navegacion_catalogo(self):
         """Test 2: Navegación y verificación del catálogo"""
@@ -31,7 +31,7 @@ class TestSauceDemo(BaseTest):
 
         # Realizar login primero
         helpers.login('standard_user', 'secret_sauce')
-        time.sleep(2)  # Pausa después del login
+        demo_pause(2)  # Pausa después del login (solo en modo demo)
 
         # Validar título de la página
         page_title = helpers.get_page_title()
@@ -59,7 +59,7 @@ class TestSauceDemo(BaseTest):
 
         helpers.take_screenshot("test_navegacion_catalogo")
         print(" Test 2 completado: Navegación del catálogo")
-        time.sleep(2)  # Pausa final
+        demo_pause(2)  # Pausa final (solo en modo demo)
 
     def test_agregar_producto_carrito(self):
         """Test 3: Agregar producto al carrito y verificar"""
@@ -67,7 +67,7 @@ class TestSauceDemo(BaseTest):
 
         # Realizar login primero
         helpers.login('standard_user', 'secret_sauce')
-        time.sleep(2)  # Pausa después del login
+        demo_pause(2)  # Pausa después del login (solo en modo demo)
 
         # Obtener contador inicial del carrito
         initial_cart_count = helpers.get_cart_count()
@@ -77,8 +77,7 @@ class TestSauceDemo(BaseTest):
         add_result = helpers.add_product_to_cart(0)
         assert add_result, "No se pudo agregar el producto al carrito"
 
-        # Verificar que el contador del carrito se incrementó
-        time.sleep(2)  # Espera para la actualización
+        # Verificar que el contador del carrito se incrementó (add_product_to_cart ya esperó el badge)
         new_cart_count = helpers.get_cart_count()
         assert new_cart_count == initial_cart_count + 1, \
             f"El contador del carrito no se incrementó correctamente. Esperado: {initial_cart_count + 1}, Obtenido: {new_cart_count}"
@@ -89,7 +88,7 @@ class TestSauceDemo(BaseTest):
         print(" Navegando al carrito...")
         cart_icon = self.driver.find_element(By.CLASS_NAME, "shopping_cart_link")
         cart_icon.click()
-        time.sleep(2)  # Pausa para la navegación
+        demo_pause(2)  # Pausa para la navegación (solo en modo demo)
 
         # Verificar que estamos en la página del carrito
         self.wait.until(EC.url_contains("cart.html"))
@@ -103,4 +102,4 @@ class TestSauceDemo(BaseTest):
 
         helpers.take_screenshot("test_agregar_producto_carrito")
         print(" Test 3 completado: Producto agregado al carrito")
-        time.sleep(2)  # Pausa final
\ No newline at end of file
+        demo_pause(2)  # Pausa final (solo en modo demo)
\ No newline at end of file
@@ -1,23 +1,50 @@
 """
 Utilidades para pruebas de API
 """
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 import requests
-from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
+from utils import config
+from utils.cassettes import CassettePlayer, get_cassette
+from utils.http_cache import SAFE_METHODS, response_cache
+from utils.retries import default_retrier
+from utils.schemas import SCHEMAS
+from utils.timing import TIMING_STATS, RequestTiming, TimedHTTPAdapter
 
 
 class APIClient:
     """Cliente base para interactuar con APIs"""
 
-    def __init__(self, base_url, timeout: float = 10.0):
+    def __init__(self, base_url, timeout: float = 10.0, cassette=None, pool_maxsize: int = None,
+                 retrier=None, cache=None, on_response=None):
         """
         Inicializa el cliente de API
-        :param base_url: URL base de la API
+        :param base_url: URL base de la API (con API_TARGET=mock se redirige al mock local)
         :param timeout: Timeout por defecto para las requests
+        :param cassette: Nombre del cassette (por defecto, el módulo de test en ejecución;
+                         False para no usar cassettes en este cliente)
+        :param pool_maxsize: Conexiones keep-alive por host (por defecto config.api_pool_size())
+        :param retrier: Política de reintentos (por defecto la compartida de la ejecución)
+        :param cache: Cachear los GET por defecto (None = según API_CACHE)
+        :param on_response: Callable(timing, response) llamado al terminar cada request
+                            (response es None si la request lanzó una excepción)
         """
-        self.base_url = base_url
+        self.origin_url = base_url
+        self.base_url = config.api_base_url(base_url)
         self.session = requests.Session()
         self.timeout = timeout
+        self._cassette_name = cassette
+        self.cassette = self._cassette_player(cassette)
+        self.retrier = retrier or default_retrier()
+        self.response_cache = response_cache()
+        self.cache_enabled = config.api_cache() != "off" if cache is None else cache
+        # Dónde se acumulan los tiempos de cada request (None para no registrarlos)
+        self.timing_stats = TIMING_STATS
+        self.on_response = on_response
 
         # Cabeceras por defecto (algunas APIs públicas fallan sin un User-Agent)
         self.session.headers.update({
@@ -25,87 +52,189 @@ class APIClient:
             "Accept": "application/json",
         })
 
-        # Configurar reintentos con backoff para errores transitorios
-        retries = Retry(
-            total=3,
-            backoff_factor=0.5,
-            status_forcelist=[401, 403, 408, 425, 429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "PATCH", "DELETE"],
-            raise_on_status=False,
-        )
-        adapter = HTTPAdapter(max_retries=retries)
+        # urllib3 solo reintenta los errores de conexión (la request no llegó a enviarse);
+        # los reintentos por código de estado los maneja self.retrier (ver utils.retries)
+        retries = Retry(total=2, connect=2, read=0, status=0, other=0, backoff_factor=0.2,
+                        respect_retry_after_header=False, raise_on_status=False)
+        # El adapter registra los tiempos de cada fase de la request (ver utils.timing)
+        adapter = TimedHTTPAdapter(max_retries=retries, pool_maxsize=pool_maxsize or config.api_pool_size())
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
-    def _full_url(self, endpoint: str) -> str:
-        # Asegura que no se dupliquen las barras
+    @staticmethod
+    def _cassette_player(name):
+        """Reproductor de cassette según API_CASSETTES (None si no se usan cassettes)"""
+        mode = config.cassette_mode()
+        if mode == "off" or name is False:
+            return None
+        if name is None:
+            # PYTEST_CURRENT_TEST = "test_api/test_users_api.py::test_x (call)"
+            current_test = os.environ.get("PYTEST_CURRENT_TEST", "")
+            name = Path(current_test.split("::")[0]).stem if current_test else "default"
+        path = Path(config.cassette_dir()) / f"{name}.json.gz"
+        if mode == "replay" and not path.exists():
+            return None
+        return CassettePlayer(get_cassette(path), mode)
+
+    def begin_test(self):
+        """
+        Aísla el cliente para un nuevo test sin cerrar sus conexiones:
+        descarta las cookies y vuelve a resolver el cassette del test en curso
+        """
+        self.session.cookies.clear()
+        self.cassette = self._cassette_player(self._cassette_name)
+
+    def connection_stats(self):
+        """
+        Requests enviadas y conexiones TCP/TLS abiertas por el cliente (datos de urllib3)
+        :return: dict con 'requests' y 'connections'
+        """
+        stats = {"requests": 0, "connections": 0}
+        for adapter in set(self.session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is not None:
+                    stats["requests"] += pool.num_requests
+                    stats["connections"] += pool.num_connections
+        return stats
+
+    def close(self):
+        """Cierra las conexiones del cliente"""
+        self.session.close()
+
+    def _logical_url(self, endpoint: str) -> str:
+        """URL de la API real (antes de redirigirla al mock), usada como clave de los cassettes"""
         if endpoint.startswith("http://") or endpoint.startswith("https://"):
             return endpoint
-        return f"{self.base_url}{endpoint}"
+        return f"{self.origin_url}{endpoint}"
 
-    def get(self, endpoint, params=None, headers=None):
+    def _full_url(self, endpoint: str) -> str:
+        # Asegura que no se dupliquen las barras
+        return config.api_base_url(self._logical_url(endpoint))
+
+    def _request(self, method, endpoint, **kwargs):
+        """
+        Punto único por el que pasan todas las requests del cliente
+        :param method: Método HTTP
+        :param endpoint: Endpoint de la API (o URL absoluta)
+        :param kwargs: Argumentos de requests (params, data, json, headers, retry, cache, fresh)
+        :return: Response object (response.timing: tiempos de la request, ver utils.timing)
+        """
+        url = self._full_url(endpoint)
+        retry = kwargs.pop("retry", None)
+        cache = kwargs.pop("cache", None)
+        fresh = kwargs.pop("fresh", False)
+        kwargs.setdefault("timeout", self.timeout)
+
+        def network(extra_headers=None):
+            request_kwargs = kwargs
+            if extra_headers:
+                request_kwargs = {**kwargs, "headers": {**(kwargs.get("headers") or {}), **extra_headers}}
+            return self.retrier.call(method, url,
+                                     lambda: self.session.request(method, url, **request_kwargs),
+                                     retry=retry)
+
+        def send():
+            # La caché queda por debajo del cassette: lo grabado se reproduce igual con o sin caché
+            if method.upper() == "GET" and self._cacheable(cache, kwargs.get("headers")):
+                return self.response_cache.fetch(url, kwargs.get("params"), network, fresh=fresh)
+            return network()
+
+        timing = RequestTiming(method, endpoint)
+        try:
+            with timing:
+                if self.cassette is not None:
+                    response = self.cassette.request(method, self._logical_url(endpoint), send,
+                                                     params=kwargs.get("params"), data=kwargs.get("data"),
+                                                     json=kwargs.get("json"))
+                else:
+                    response = send()
+        except Exception:
+            if self.on_response is not None:
+                self.on_response(timing, None)
+            raise
+        if getattr(response, "cache_status", None) == "hit":
+            timing.source = "cache"
+        elif self.cassette is not None and timing.attempts == 0:
+            timing.source = "cassette"
+        timing.status = response.status_code
+        response.timing = timing
+        if self.timing_stats is not None:
+            self.timing_stats.add(timing)
+        if self.on_response is not None:
+            self.on_response(timing, response)
+
+        if method.upper() not in SAFE_METHODS:
+            self.response_cache.invalidate(url)
+        return response
+
+    def _cacheable(self, cache, headers):
+        """Si un GET pasa por la caché (cache=True/False en la llamada manda sobre el cliente)"""
+        if cache is not None:
+            return cache
+        # Las respuestas autenticadas dependen del usuario: solo se cachean si se pide explícitamente
+        return self.cache_enabled and not (headers and "Authorization" in headers)
+
+    def get(self, endpoint, params=None, headers=None, retry=None, cache=None, fresh=False):
         """
         Realiza una petición GET
         :param endpoint: Endpoint de la API
         :param params: Parámetros de consulta
         :param headers: Headers adicionales
+        :param retry: True/False fuerza o evita los reintentos (por defecto solo idempotentes)
+        :param cache: True/False fuerza o evita la caché de respuestas (por defecto según API_CACHE)
+        :param fresh: Exige una respuesta confirmada por el servidor (revalida con ETag si está cacheada)
         :return: Response object
         """
-        url = self._full_url(endpoint)
-        # Limpiar cookies entre llamadas para evitar estados inesperados
-        self.session.cookies.clear()
-        response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
-        return response
+        return self._request("GET", endpoint, params=params, headers=headers, retry=retry,
+                             cache=cache, fresh=fresh)
 
-    def post(self, endpoint, data=None, json=None, headers=None):
+    def post(self, endpoint, data=None, json=None, headers=None, retry=None):
         """
         Realiza una petición POST
         :param endpoint: Endpoint de la API
         :param data: Datos del formulario
         :param json: Datos en formato JSON
         :param headers: Headers adicionales
+        :param retry: True/False fuerza o evita los reintentos (por defecto solo idempotentes)
         :return: Response object
         """
-        url = self._full_url(endpoint)
-        response = self.session.post(url, data=data, json=json, headers=headers, timeout=self.timeout)
-        return response
+        return self._request("POST", endpoint, data=data, json=json, headers=headers, retry=retry)
 
-    def put(self, endpoint, data=None, json=None, headers=None):
+    def put(self, endpoint, data=None, json=None, headers=None, retry=None):
         """
         Realiza una petición PUT
         :param endpoint: Endpoint de la API
         :param data: Datos del formulario
         :param json: Datos en formato JSON
         :param headers: Headers adicionales
+        :param retry: True/False fuerza o evita los reintentos (por defecto solo idempotentes)
         :return: Response object
         """
-        url = self._full_url(endpoint)
-        response = self.session.put(url, data=data, json=json, headers=headers, timeout=self.timeout)
-        return response
+        return self._request("PUT", endpoint, data=data, json=json, headers=headers, retry=retry)
 
-    def patch(self, endpoint, data=None, json=None, headers=None):
+    def patch(self, endpoint, data=None, json=None, headers=None, retry=None):
         """
         Realiza una petición PATCH
         :param endpoint: Endpoint de la API
         :param data: Datos del formulario
         :param json: Datos en formato JSON
         :param headers: Headers adicionales
+        :param retry: True/False fuerza o evita los reintentos (por defecto solo idempotentes)
         :return: Response object
         """
-        url = self._full_url(endpoint)
-        response = self.session.patch(url, data=data, json=json, headers=headers, timeout=self.timeout)
-        return response
+        return self._request("PATCH", endpoint, data=data, json=json, headers=headers, retry=retry)
 
-    def delete(self, endpoint, headers=None):
+    def delete(self, endpoint, headers=None, retry=None):
         """
         Realiza una petición DELETE
         :param endpoint: Endpoint de la API
         :param headers: Headers adicionales
+        :param retry: True/False fuerza o evita los reintentos (por defecto solo idempotentes)
         :return: Response object
         """
-        url = self._full_url(endpoint)
-        response = self.session.delete(url, headers=headers, timeout=self.timeout)
-        return response
+        return self._request("DELETE", endpoint, headers=headers, retry=retry)
 
     def validate_status_code(self, response, expected_status):
         """
@@ -122,5 +251,179 @@ class APIClient:
         :param json_data: Datos JSON
         :param expected_keys: Lista de claves esperadas
         """
-        for key in expected_keys:
-            assert key in json_data, f"Key '{key}' not found in response"
+        missing = [key for key in expected_keys if key not in json_data]
+        assert not missing, f"Keys not found in response: {missing}"
+
+    def validate_schema(self, json_data, schema, many=False):
+        """
+        Valida el JSON contra un esquema compilado (ver utils.schemas)
+        Informa todas las violaciones juntas en lugar de cortar en la primera
+        :param json_data: Datos JSON
+        :param schema: Nombre de un esquema registrado en SCHEMAS o esquema en línea
+        :param many: json_data es una lista de registros del esquema
+        """
+        SCHEMAS.validate(schema, json_data, many=many)
+
+
+class APIClientRegistry:
+    """
+    Un APIClient por URL base durante toda la sesión de pytest: las conexiones
+    keep-alive se reutilizan entre tests y el aislamiento (cookies, cassette)
+    se hace al comenzar cada test en lugar de en cada request
+    """
+
+    def __init__(self, pool_maxsize=None):
+        """
+        :param pool_maxsize: Conexiones keep-alive por host (por defecto config.api_pool_size())
+        """
+        self.pool_maxsize = pool_maxsize
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def get(self, base_url):
+        """
+        Cliente compartido para la URL base
+        :param base_url: URL base de la API
+        :return: APIClient
+        """
+        with self._lock:
+            client = self._clients.get(base_url)
+            if client is None:
+                client = APIClient(base_url, pool_maxsize=self.pool_maxsize)
+                self._clients[base_url] = client
+            return client
+
+    def begin_test(self):
+        """Aísla todos los clientes para el test que comienza"""
+        with self._lock:
+            clients = list(self._clients.values())
+        for client in clients:
+            client.begin_test()
+
+    def close(self):
+        """Cierra todos los clientes"""
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
+
+    def stats(self):
+        """Requests, conexiones nuevas y proporción de requests que reutilizaron una conexión"""
+        with self._lock:
+            clients = list(self._clients.values())
+        totals = {"clients": len(clients), "requests": 0, "connections": 0}
+        for client in clients:
+            for key, value in client.connection_stats().items():
+                totals[key] += value
+        totals["reuse_ratio"] = (1 - totals["connections"] / totals["requests"]) if totals["requests"] else 0.0
+        return totals
+
+    def resumen(self):
+        """Resumen de reutilización de conexiones para logs y reportes"""
+        stats = self.stats()
+        return (f"Clientes: {stats['clients']} | Requests: {stats['requests']} | "
+                f"Conexiones nuevas: {stats['connections']} | "
+                f"Reutilización de conexiones: {stats['reuse_ratio']:.0%}")
+
+
+class AsyncAPIClient:
+    """
+    Cliente asyncio con la misma interfaz que APIClient (get/post/put/patch/delete)
+    Las requests se ejecutan sobre un APIClient en un pool de hilos acotado, así que
+    reutilizan su sesión, reintentos, cassettes y redirección al mock
+    """
+
+    def __init__(self, base_url, timeout: float = 10.0, concurrency: int = 10, cassette=None):
+        """
+        Inicializa el cliente
+        :param base_url: URL base de la API
+        :param timeout: Timeout por defecto de cada request (segundos)
+        :param concurrency: Máximo de requests en vuelo al mismo tiempo
+        :param cassette: Igual que en APIClient
+        """
+        self.client = APIClient(base_url, timeout=timeout, cassette=cassette, pool_maxsize=concurrency)
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="async-api")
+        self._semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Como close, pero espera las requests en curso sin bloquear el event loop"""
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def close(self):
+        """
+        Libera los hilos y las conexiones del cliente
+        Espera a las requests en curso (acotadas por su timeout) y descarta las pendientes
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self.client.session.close()
+
+    async def request(self, method, endpoint, timeout=None, **kwargs):
+        """
+        Realiza una request respetando el límite de concurrencia
+        :param method: Método HTTP
+        :param endpoint: Endpoint de la API
+        :param timeout: Timeout de esta request (por defecto el del cliente)
+        :param kwargs: params, data, json, headers, retry, cache, fresh
+        :return: Response object (asyncio.TimeoutError si se supera el timeout)
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        timeout = self.timeout if timeout is None else timeout
+
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            call = loop.run_in_executor(
+                self._executor,
+                lambda: self.client._request(method, endpoint, timeout=timeout, **kwargs),
+            )
+            # El timeout de requests corta el socket; wait_for garantiza el límite total
+            return await asyncio.wait_for(call, timeout)
+
+    async def get(self, endpoint, params=None, headers=None, timeout=None):
+        """Realiza una petición GET"""
+        return await self.request("GET", endpoint, timeout=timeout, params=params, headers=headers)
+
+    async def post(self, endpoint, data=None, json=None, headers=None, timeout=None):
+        """Realiza una petición POST"""
+        return await self.request("POST", endpoint, timeout=timeout, data=data, json=json, headers=headers)
+
+    async def put(self, endpoint, data=None, json=None, headers=None, timeout=None):
+        """Realiza una petición PUT"""
+        return await self.request("PUT", endpoint, timeout=timeout, data=data, json=json, headers=headers)
+
+    async def patch(self, endpoint, data=None, json=None, headers=None, timeout=None):
+        """Realiza una petición PATCH"""
+        return await self.request("PATCH", endpoint, timeout=timeout, data=data, json=json, headers=headers)
+
+    async def delete(self, endpoint, headers=None, timeout=None):
+        """Realiza una petición DELETE"""
+        return await self.request("DELETE", endpoint, timeout=timeout, headers=headers)
+
+    async def gather(self, *requests_, return_exceptions=False):
+        """
+        Ejecuta varias requests en paralelo (hasta `concurrency` a la vez)
+        :param requests_: Corutinas del cliente (ej: client.get("/api/users/2"))
+        :return: Respuestas en el mismo orden
+        """
+        return await asyncio.gather(*requests_, return_exceptions=return_exceptions)
+
+    async def batch(self, specs, return_exceptions=False):
+        """
+        Ejecuta un lote de requests descritas como tuplas
+        :param specs: Iterable de (método, endpoint) o (método, endpoint, kwargs)
+                      ej: [("POST", "/api/users", {"json": {...}, "timeout": 2})]
+        :return: Respuestas en el mismo orden
+        """
+        calls = []
+        for spec in specs:
+            method, endpoint, kwargs = (*spec, {}) if len(spec) == 2 else spec
+            calls.append(self.request(method, endpoint, **kwargs))
+        return await self.gather(*calls, return_exceptions=return_exceptions)
@@ -1,10 +1,9 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import pytest
-import time
+from utils.config import base_url
+from utils.driver_factory import DriverFactory
+from utils.waits import demo_pause
 
 
 class BaseTest:
@@ -13,38 +12,24 @@ class BaseTest:
     @pytest.fixture(autouse=True)
     def setup(self):
         """Configuración inicial del WebDriver"""
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
-
-        # Ruta FIJA del ChromeDriver
-        CHROME_DRIVER_PATH = r"C:\chromedriver\chromedriver.exe"
-
         try:
             print(" Iniciando ChromeDriver...")
-            # Inicializar el WebDriver con la ruta FIJA
-            self.driver = webdriver.Chrome(
-                service=Service(CHROME_DRIVER_PATH),
-                options=chrome_options
-            )
-            self.driver.implicitly_wait(10)
+            # Sesión nueva contra el ChromeDriver compartido de DriverFactory
+            self.driver = DriverFactory.create_driver()
             self.wait = WebDriverWait(self.driver, 15)
 
             # Navegar a la página inicial
-            print(" Navegando a saucedemo.com...")
-            self.driver.get("https://www.saucedemo.com/")
+            print(f" Navegando a {base_url()}...")
+            self.driver.get(base_url())
 
-            # PAUSA para ver la página de login
-            time.sleep(2)
+            # PAUSA para ver la página de login (solo en modo demo)
+            demo_pause(2)
 
             yield
 
-            # PAUSA antes de cerrar
+            # PAUSA antes de cerrar (solo en modo demo)
             print(" Cerrando navegador...")
-            time.sleep(1)
+            demo_pause(1)
 
             # Cleanup después de cada test
             if self.driver:
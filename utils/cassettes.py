@@ -0,0 +1,214 @@
+"""
+Cassettes de record/replay para APIClient
+Cada cassette es un JSON comprimido con gzip (un archivo por módulo de test)
+con un índice por clave de request: método, URL, query y hash del body normalizado
+"""
+import atexit
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import timedelta
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+# Solo se guardan los headers que los tests o el cliente pueden usar
+KEPT_HEADERS = ("Content-Type", "Retry-After", "ETag", "Last-Modified", "Cache-Control", "Location")
+
+
+class CassetteMiss(LookupError):
+    """La request no está grabada en el cassette (modo replay estricto)"""
+
+
+def _normalized_body(data=None, json_body=None):
+    """Body canónico: JSON con claves ordenadas, formularios ordenados o bytes tal cual"""
+    if json_body is not None:
+        return json.dumps(json_body, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    if isinstance(data, dict):
+        return urlencode(sorted(data.items())).encode("utf-8")
+    if isinstance(data, str):
+        return data.encode("utf-8")
+    return data or b""
+
+
+def request_key(method, url, params=None, data=None, json_body=None):
+    """
+    Clave de una request para el índice del cassette
+    :return: (clave, descripción legible de la request)
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    query += [(str(key), str(value)) for key, value in (params or {}).items() if value is not None]
+    query = sorted(query)
+    base = urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+    body_hash = hashlib.sha1(_normalized_body(data, json_body)).hexdigest()
+
+    request = {"method": method.upper(), "url": base, "query": query, "body_hash": body_hash}
+    key = hashlib.sha1(json.dumps(request, sort_keys=True).encode("utf-8")).hexdigest()
+    return key, request
+
+
+def serialize_response(response):
+    content = response.content or b""
+    try:
+        body = {"text": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        body = {"base64": base64.b64encode(content).decode("ascii")}
+    return {
+        "status": response.status_code,
+        "reason": response.reason,
+        "headers": {name: response.headers[name] for name in KEPT_HEADERS if name in response.headers},
+        **body,
+    }
+
+
+def build_response(entry, method, url):
+    response = requests.Response()
+    response.status_code = entry["status"]
+    response.reason = entry.get("reason")
+    response.headers = CaseInsensitiveDict(entry.get("headers", {}))
+    if "base64" in entry:
+        response._content = base64.b64decode(entry["base64"])
+    else:
+        response._content = entry.get("text", "").encode("utf-8")
+    response.encoding = "utf-8"
+    response.url = url
+    response.request = requests.Request(method, url).prepare()
+    response.elapsed = timedelta(0)
+    return response
+
+
+class Cassette:
+    """Archivo de cassette con índice en memoria clave -> respuestas grabadas (en orden)"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.index = {}
+        self.requests = {}
+        self.dirty = False
+        # Claves regrabadas en esta ejecución (el primer registro reemplaza lo anterior)
+        self._rerecorded = set()
+        if self.path.exists():
+            self._load()
+
+    def _load(self):
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        for entry in data.get("entries", []):
+            self.index[entry["key"]] = entry["responses"]
+            self.requests[entry["key"]] = entry["request"]
+
+    def lookup(self, key, position):
+        """Respuesta grabada para la clave (la n-ésima vez que se pide, o la última)"""
+        responses = self.index.get(key)
+        if not responses:
+            return None
+        return responses[min(position, len(responses) - 1)]
+
+    def record(self, key, request, response):
+        """Agrega la respuesta a la clave (la primera vez en la ejecución reemplaza lo grabado)"""
+        with self._lock:
+            if key not in self._rerecorded:
+                self._rerecorded.add(key)
+                self.index[key] = []
+            self.index[key].append(serialize_response(response))
+            self.requests[key] = request
+            self.dirty = True
+
+    def save(self):
+        """Escribe el cassette de forma atómica si hubo cambios"""
+        with self._lock:
+            if not self.dirty:
+                return
+            entries = [{"key": key, "request": self.requests[key], "responses": responses}
+                       for key, responses in sorted(self.index.items())]
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump({"version": CASSETTE_VERSION, "entries": entries}, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        logger.info(f"Cassette guardado: {self.path} ({len(entries)} requests)")
+
+
+_cassettes = {}
+_lock = threading.Lock()
+
+
+def get_cassette(path):
+    """Cassette compartido del proceso para la ruta indicada"""
+    path = Path(path)
+    with _lock:
+        if path not in _cassettes:
+            _cassettes[path] = Cassette(path)
+        return _cassettes[path]
+
+
+def save_all():
+    """Guarda todos los cassettes modificados en la ejecución"""
+    with _lock:
+        cassettes = list(_cassettes.values())
+    for cassette in cassettes:
+        cassette.save()
+
+
+atexit.register(save_all)
+
+
+class CassettePlayer:
+    """
+    Aplica un modo de cassette a las requests de un APIClient
+    record: siempre va a la red y graba; replay: solo responde desde el cassette
+    (sin I/O de red, CassetteMiss si falta); refresh: responde desde el cassette
+    y regraba únicamente las requests cuya forma cambió (las que no están grabadas)
+    """
+
+    MODES = ("record", "replay", "refresh")
+
+    def __init__(self, cassette, mode):
+        if mode not in self.MODES:
+            raise ValueError(f"Modo de cassette desconocido: {mode}")
+        self.cassette = cassette
+        self.mode = mode
+        # Cuántas veces pidió este cliente cada clave (para secuencias con estado)
+        self._positions = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def request(self, method, url, send, params=None, data=None, json=None, **kwargs):
+        """
+        Resuelve una request
+        :param url: URL lógica (la de la API real, antes de redirigir al mock)
+        :param send: Callable sin argumentos que hace la request real
+        """
+        key, request = request_key(method, url, params=params, data=data, json_body=json)
+        with self._lock:
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+
+        if self.mode != "record":
+            entry = self.cassette.lookup(key, position)
+            if entry is not None:
+                with self._lock:
+                    self.hits += 1
+                return build_response(entry, method.upper(), url)
+            if self.mode == "replay":
+                raise CassetteMiss(f"{method.upper()} {url} no está grabada en {self.cassette.path} "
+                                   f"(API_CASSETTES=refresh para grabarla)")
+
+        with self._lock:
+            self.misses += 1
+        response = send()
+        self.cassette.record(key, request, response)
+        return response
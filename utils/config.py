@@ -0,0 +1,226 @@
+"""
+Configuración centralizada de la ejecución (variables de entorno)
+"""
+import os
+
+
+# Sitio bajo prueba por defecto
+SAUCEDEMO_URL = "https://www.saucedemo.com/"
+
+# APIs públicas que el mock en proceso puede reemplazar (ver utils.mock_api)
+MOCKED_API_HOSTS = ("https://jsonplaceholder.typicode.com", "https://reqres.in")
+
+# Ruta histórica del ChromeDriver en las máquinas Windows del proyecto
+LEGACY_CHROMEDRIVER_PATH = r"C:\chromedriver\chromedriver.exe"
+
+
+def env_flag(name):
+    """Indica si una variable de entorno tiene el valor 'true'"""
+    return os.environ.get(name, "").lower() == "true"
+
+
+def is_ci():
+    """Detecta si estamos en CI (GitHub Actions)"""
+    return env_flag("CI") or env_flag("GITHUB_ACTIONS")
+
+
+def is_headless():
+    """Chrome corre en modo headless en CI o si se define HEADLESS=true"""
+    return is_ci() or env_flag("HEADLESS")
+
+
+def chromedriver_path():
+    """
+    Ruta del ChromeDriver a utilizar
+    Prioridad: variable CHROMEDRIVER_PATH, ruta histórica de Windows si existe,
+    y si no None para que Selenium Manager/PATH resuelvan el driver del sistema
+    """
+    path = os.environ.get("CHROMEDRIVER_PATH")
+    if path:
+        return path
+    if os.path.isfile(LEGACY_CHROMEDRIVER_PATH):
+        return LEGACY_CHROMEDRIVER_PATH
+    return None
+
+
+def login_mode():
+    """
+    Modo de autenticación para los tests que solo necesitan un usuario logueado
+    'cookie' (por defecto) inyecta la cookie de sesión, 'ui' usa el formulario
+    """
+    return os.environ.get("LOGIN_MODE", "cookie").lower()
+
+
+def demo_mode():
+    """DEMO_MODE=true vuelve a agregar pausas visuales después de cada acción"""
+    return env_flag("DEMO_MODE")
+
+
+def implicit_wait():
+    """
+    Espera implícita (segundos) de los WebDrivers
+    Por defecto 0: los Page Objects usan esperas explícitas y las consultas
+    de presencia/ausencia responden con el estado actual del DOM.
+    IMPLICIT_WAIT=10 restaura el comportamiento histórico
+    """
+    return float(os.environ.get("IMPLICIT_WAIT", "0"))
+
+
+def browser_profile():
+    """
+    Perfil de Chrome por defecto (ver DriverFactory.PROFILES)
+    'lean' (por defecto) carga las páginas en modo eager y bloquea imágenes,
+    fuentes y analytics; BROWSER_PROFILE=full vuelve a la carga completa
+    """
+    return os.environ.get("BROWSER_PROFILE", "lean").lower()
+
+
+def base_url():
+    """
+    URL base de SauceDemo para Page Objects, fixtures y steps
+    BASE_URL=local levanta la réplica local en proceso (ver utils.local_site);
+    cualquier otro valor se usa como URL del sitio
+    """
+    url = os.environ.get("BASE_URL", SAUCEDEMO_URL)
+    if url.lower() == "local":
+        from utils.local_site import local_saucedemo
+        return local_saucedemo().url
+    return url if url.endswith("/") else url + "/"
+
+
+def page_url(path=""):
+    """URL absoluta de una página del sitio (ej: 'inventory.html')"""
+    return base_url() + path.lstrip("/")
+
+
+def api_target():
+    """
+    Destino de los tests API: 'live' (por defecto) usa las APIs públicas,
+    'mock' las reemplaza por el mock local en proceso
+    """
+    return os.environ.get("API_TARGET", "live").lower()
+
+
+def api_base_url(url):
+    """
+    Resuelve la URL de una API según API_TARGET
+    Con API_TARGET=mock las URLs de JSONPlaceholder y ReqRes apuntan al mock local
+    """
+    if api_target() != "mock":
+        return url
+    for host in MOCKED_API_HOSTS:
+        if url.startswith(host):
+            from utils.mock_api import mock_api
+            return mock_api().url + url[len(host):]
+    return url
+
+
+def cassette_mode():
+    """
+    Modo de los cassettes de APIClient (API_CASSETTES): off, record, replay o refresh
+    Por defecto replay en CI (si el cassette existe) y off en local
+    """
+    return os.environ.get("API_CASSETTES", "replay" if is_ci() else "off").lower()
+
+
+def cassette_dir():
+    """Directorio de los cassettes grabados"""
+    return os.environ.get("CASSETTE_DIR", os.path.join("test_api", "cassettes"))
+
+
+def api_pool_size():
+    """Conexiones keep-alive por host de cada APIClient (API_POOL_SIZE, por defecto 10)"""
+    return int(os.environ.get("API_POOL_SIZE", "10"))
+
+
+def api_max_retries():
+    """Reintentos máximos por request de API (API_MAX_RETRIES, por defecto 3)"""
+    return int(os.environ.get("API_MAX_RETRIES", "3"))
+
+
+def api_retry_budget():
+    """Reintentos máximos de toda la ejecución (API_RETRY_BUDGET, por defecto 30)"""
+    return int(os.environ.get("API_RETRY_BUDGET", "30"))
+
+
+def api_circuit_threshold():
+    """Respuestas de bloqueo seguidas que abren el circuit breaker de un host (por defecto 5)"""
+    return int(os.environ.get("API_CIRCUIT_THRESHOLD", "5"))
+
+
+def api_circuit_cooldown():
+    """Segundos que el circuit breaker queda abierto antes de volver a probar (por defecto 30)"""
+    return float(os.environ.get("API_CIRCUIT_COOLDOWN", "30"))
+
+
+def api_circuit_action():
+    """Qué pasa con un test que choca con un circuito abierto: 'skip' (por defecto) o 'fail'"""
+    return os.environ.get("API_CIRCUIT_ACTION", "skip").lower()
+
+
+def api_cache():
+    """
+    Caché de respuestas GET de APIClient (API_CACHE): off, memory o disk
+    Con off solo se cachean las llamadas marcadas con cache=True
+    """
+    return os.environ.get("API_CACHE", "off").lower()
+
+
+def api_cache_ttl():
+    """Segundos que una respuesta cacheada se usa sin revalidar (API_CACHE_TTL, por defecto 300)"""
+    return float(os.environ.get("API_CACHE_TTL", "300"))
+
+
+def api_cache_size():
+    """Respuestas máximas en la caché en memoria (API_CACHE_SIZE, por defecto 256)"""
+    return int(os.environ.get("API_CACHE_SIZE", "256"))
+
+
+def api_cache_dir():
+    """Directorio de la caché de respuestas en disco (API_CACHE=disk)"""
+    return os.environ.get("API_CACHE_DIR", os.path.join(".cache", "http"))
+
+
+def data_cache_dir():
+    """
+    Directorio de los archivos de datos compilados (DATA_CACHE_DIR)
+    Compartido por los workers en paralelo; con DATA_CACHE=off cada proceso compila los suyos
+    """
+    if os.environ.get("DATA_CACHE", "").lower() == "off":
+        return None
+    return os.environ.get("DATA_CACHE_DIR", os.path.join(".cache", "datos"))
+
+
+def data_shard():
+    """Shard de filas de datos de este proceso, 'i/n' (DATA_SHARD o --data-shard); vacío: todas"""
+    return os.environ.get("DATA_SHARD", "")
+
+
+def data_validation():
+    """Validar datos/ antes de recolectar los tests (DATA_VALIDATION=off lo desactiva)"""
+    return os.environ.get("DATA_VALIDATION", "on").lower() != "off"
+
+
+def data_validation_workers():
+    """Procesos para validar archivos de datos grandes (DATA_VALIDATION_WORKERS, por defecto CPUs)"""
+    return max(1, int(os.environ.get("DATA_VALIDATION_WORKERS", os.cpu_count() or 1)))
+
+
+def payload_seed():
+    """Semilla de los payloads generados con Faker (PAYLOAD_SEED, por defecto 2024)"""
+    return int(os.environ.get("PAYLOAD_SEED", "2024"))
+
+
+def payload_pool_size():
+    """Payloads por tipo en el pool (PAYLOAD_POOL_SIZE, por defecto 500)"""
+    return int(os.environ.get("PAYLOAD_POOL_SIZE", "500"))
+
+
+def payload_locale():
+    """Locale de Faker para los payloads (PAYLOAD_LOCALE, por defecto es_ES)"""
+    return os.environ.get("PAYLOAD_LOCALE", "es_ES")
+
+
+def payload_dir():
+    """Directorio del pool de payloads en disco (PAYLOAD_DIR)"""
+    return os.environ.get("PAYLOAD_DIR", os.path.join(".cache", "payloads"))
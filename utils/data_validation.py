@@ -0,0 +1,345 @@
+"""
+Validación de los archivos de datos/ (login, productos y cualquier CSV/JSON nuevo)
+Cada archivo se valida contra sus reglas (columnas requeridas, valores permitidos,
+índices dentro del catálogo) con los validadores compilados de utils.schemas.
+Los CSV se reparten en bloques entre un pool de procesos (cada proceso lee su
+bloque del compilado mapeado en memoria, ver utils.datos_compilados) y solo se
+revalidan los archivos cuyo contenido cambió desde la última ejecución válida
+
+Uso:
+    python test_data_validation.py
+    DATA_VALIDATION=off pytest ...   (desactiva el chequeo previo a la recolección)
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from utils import config
+from utils.datos import DataLoader
+from utils.datos_compilados import CompiledData, open_compiled
+from utils.schemas import NON_EMPTY_STRING, SCHEMAS
+
+
+logger = logging.getLogger(__name__)
+
+# Cambiarla invalida los resultados guardados (por ejemplo, al cambiar el formato)
+VALIDATION_VERSION = 1
+# Productos del inventario de SauceDemo: los índices de datos/ van de 0 a CATALOG_SIZE - 1
+CATALOG_SIZE = 6
+EXPECTED_RESULTS = ("success", "error", "locked")
+# Filas por bloque y filas totales a partir de las cuales conviene el pool de procesos
+CHUNK_RECORDS = 20000
+POOL_MIN_RECORDS = 50000
+# Errores informados por archivo (el resto se resume)
+MAX_ERRORS = 50
+EXTENSIONS = (".csv", ".json", ".jsonl")
+
+PRODUCT_INDEX = {"type": "integer", "minimum": 0, "maximum": CATALOG_SIZE - 1}
+
+
+def _cantidades_coinciden(data):
+    """En compras_multiples la cantidad esperada es la cantidad de productos"""
+    if not isinstance(data, dict):
+        return []
+    return [f"$.compras_multiples[{i}]: cantidad_esperada {compra.get('cantidad_esperada')} no coincide "
+            f"con {len(compra['productos_indices'])} productos_indices"
+            for i, compra in enumerate(data.get("compras_multiples", []))
+            if isinstance(compra, dict) and isinstance(compra.get("productos_indices"), list)
+            and compra.get("cantidad_esperada") != len(compra["productos_indices"])]
+
+
+class FileRule:
+    """Reglas de un archivo: columnas por fila (CSV) o esquema del documento (JSON)"""
+
+    def __init__(self, columns=None, schema=None, checks=()):
+        """
+        :param columns: Esquema de cada columna requerida de un CSV {columna: esquema}
+        :param schema: Esquema del documento completo de un JSON
+        :param checks: Funciones extra sobre el JSON parseado que devuelven violaciones
+        """
+        self.columns = columns or {}
+        self.schema = schema
+        self.checks = checks
+
+    def fingerprint(self):
+        return {"columns": self.columns, "schema": self.schema,
+                "checks": [check.__name__ for check in self.checks]}
+
+
+RULES = {
+    "login.csv": FileRule(columns={
+        "username": {"type": "string"},
+        "password": {"type": "string"},
+        "expected_result": {"enum": list(EXPECTED_RESULTS)},
+        "test_case": NON_EMPTY_STRING,
+    }),
+    "productos.json": FileRule(schema={
+        "type": "object",
+        "required": ["productos_a_comprar", "compras_multiples", "escenarios_carrito"],
+        "properties": {
+            "productos_a_comprar": {"type": "array", "items": {
+                "type": "object", "required": ["id", "nombre", "precio"],
+                "properties": {"id": PRODUCT_INDEX, "nombre": NON_EMPTY_STRING,
+                               "precio": {"type": "string", "pattern": r"^\$\d+\.\d{2}$"}},
+            }},
+            "compras_multiples": {"type": "array", "items": {
+                "type": "object", "required": ["productos_indices", "cantidad_esperada"],
+                "properties": {"productos_indices": {"type": "array", "minItems": 1, "items": PRODUCT_INDEX},
+                               "cantidad_esperada": {"type": "integer", "minimum": 1}},
+            }},
+            "escenarios_carrito": {"type": "array", "items": {
+                "type": "object", "required": ["accion", "producto_index"],
+                "properties": {"accion": NON_EMPTY_STRING, "producto_index": PRODUCT_INDEX},
+            }},
+        },
+    }, checks=(_cantidades_coinciden,)),
+}
+
+
+def rules_fingerprint():
+    """Hash de las reglas: si cambian, se revalidan todos los archivos"""
+    rules = {name: rule.fingerprint() for name, rule in sorted(RULES.items())}
+    payload = json.dumps([VALIDATION_VERSION, CATALOG_SIZE, rules], sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def content_hash(path):
+    digest = hashlib.sha1()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class FileReport:
+    """Resultado de un archivo: ok, cached (sin cambios desde la última validación) o error"""
+
+    def __init__(self, name, status="ok", records=0, errors=None, warnings=None):
+        self.name = name
+        self.status = status
+        self.records = records
+        self.errors = errors or []
+        self.warnings = warnings or []
+
+    def line(self):
+        extra = f" | {len(self.errors)} errores" if self.errors else ""
+        extra += f" | {len(self.warnings)} advertencias" if self.warnings else ""
+        return f"{self.name}: {self.status} ({self.records} registros){extra}"
+
+
+class ValidationReport:
+    """Resultado de la validación de todo datos/"""
+
+    def __init__(self, files, elapsed, workers):
+        self.files = files
+        self.elapsed = elapsed
+        self.workers = workers
+
+    @property
+    def ok(self):
+        return not any(report.errors for report in self.files)
+
+    @property
+    def errors(self):
+        return [f"{report.name}: {error}" for report in self.files for error in report.errors]
+
+    @property
+    def warnings(self):
+        return [f"{report.name}: {warning}" for report in self.files for warning in report.warnings]
+
+    def resumen(self):
+        validated = sum(1 for report in self.files if report.status != "cached")
+        return (f"Archivos: {len(self.files)} | Validados: {validated} | "
+                f"Sin cambios: {len(self.files) - validated} | Errores: {len(self.errors)} | "
+                f"Advertencias: {len(self.warnings)} | Procesos: {self.workers} | "
+                f"Tiempo: {self.elapsed * 1000:.0f} ms")
+
+
+def _column_errors(rule, fields):
+    """Columnas requeridas ausentes en el encabezado del CSV"""
+    return [f"columna requerida ausente: {column}" for column in rule.columns if column not in fields]
+
+
+def _validate_rows(sidecar, name, start, end):
+    """
+    Valida un bloque de filas de un CSV compilado (se ejecuta en el pool)
+    Se valida por columna: el validador compilado recorre la columna entera en una llamada
+    :return: (errores, filas validadas)
+    """
+    rule = RULES.get(name, FileRule())
+    with CompiledData(sidecar) as data:
+        columns = list(zip(*data.values(start, end)))
+        found = []
+        for order, (column, schema) in enumerate(rule.columns.items()):
+            if column not in data.fields:
+                continue
+            for error in SCHEMAS.errors(schema, list(columns[data.fields.index(column)]), many=True):
+                # "$[i]: mensaje" -> fila del archivo (sin contar el encabezado)
+                index, message = error[2:].split("]", 1)
+                found.append((start + int(index) + 1, order, f"{column}{message}"))
+    found.sort()
+    return [f"fila {row}: {message}" for row, _, message in found[:MAX_ERRORS]], end - start
+
+
+def _validate_document(path, name):
+    """Valida un JSON o JSON Lines completo (se ejecuta en el pool): (errores, registros)"""
+    rule = RULES.get(name, FileRule())
+    with open(path, "r", encoding="utf-8") as file:
+        if path.endswith(".jsonl"):
+            errors, records = [], 0
+            for number, line in enumerate(file, 1):
+                if not line.strip():
+                    continue
+                records += 1
+                try:
+                    json.loads(line)
+                except json.JSONDecodeError as e:
+                    errors.append(f"línea {number}: JSON inválido ({e.msg})")
+            return errors, records
+        try:
+            data = json.load(file)
+        except json.JSONDecodeError as e:
+            return [f"JSON inválido: {e.msg} (línea {e.lineno}, columna {e.colno})"], 0
+    errors = SCHEMAS.errors(rule.schema, data) if rule.schema else []
+    for check in rule.checks:
+        errors.extend(check(data))
+    records = sum(len(value) for value in data.values() if isinstance(value, list)) \
+        if isinstance(data, dict) else len(data) if isinstance(data, list) else 1
+    return errors, records
+
+
+class DataValidator:
+    """Valida los archivos de un directorio de datos con resultados incrementales"""
+
+    def __init__(self, directory=None, workers=None, state_path=None):
+        self.directory = Path(directory or os.path.dirname(DataLoader.get_data_path("")))
+        self.workers = workers or config.data_validation_workers()
+        cache_dir = config.data_cache_dir()
+        if state_path is None and cache_dir is not None:
+            state_path = os.path.join(cache_dir, "validacion.json")
+        self.state_path = state_path
+
+    def files(self):
+        state = Path(self.state_path).resolve() if self.state_path else None
+        return sorted(path for path in self.directory.rglob("*")
+                      if path.is_file() and path.suffix.lower() in EXTENSIONS and path.resolve() != state)
+
+    def _load_state(self):
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as file:
+                state = json.load(file)
+        except (TypeError, OSError, ValueError):
+            return {}
+        return state.get("files", {}) if state.get("rules") == rules_fingerprint() else {}
+
+    def _save_state(self, files):
+        if self.state_path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+            tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump({"rules": rules_fingerprint(), "files": files}, file, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            logger.warning(f"No se pudo guardar el estado de la validación de datos: {e}")
+
+    def _unchanged(self, path, stat, entry):
+        """El archivo tiene el mismo contenido que en la última validación sin errores"""
+        if entry is None:
+            return False
+        if (entry["mtime_ns"], entry["size"]) == (stat.st_mtime_ns, stat.st_size):
+            return True
+        # Cambió la fecha (checkout, touch): se compara el contenido
+        if entry["size"] == stat.st_size and entry["sha1"] == content_hash(path):
+            entry["mtime_ns"] = stat.st_mtime_ns
+            return True
+        return False
+
+    def _plan(self, path, name, report):
+        """Tareas de un archivo: bloques de filas de un CSV o el documento completo"""
+        if path.stat().st_size == 0:
+            report.warnings.append("archivo vacío (sin registros)")
+            return []
+        if path.suffix.lower() != ".csv":
+            return [(_validate_document, (str(path), name))]
+        data, _ = open_compiled(str(path))
+        rule = RULES.get(name, FileRule())
+        report.errors.extend(_column_errors(rule, data.fields))
+        if not len(data):
+            report.warnings.append("sin registros (solo encabezado)")
+        if report.errors:
+            return []
+        return [(_validate_rows, (data.path, name, start, min(start + CHUNK_RECORDS, len(data))))
+                for start in range(0, len(data), CHUNK_RECORDS)]
+
+    def _run(self, tasks, total_records):
+        """Ejecuta las tareas en el pool si el volumen lo justifica (si no, en este proceso)"""
+        workers = min(self.workers, len(tasks))
+        if workers > 1 and total_records >= POOL_MIN_RECORDS:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [pool.submit(function, *args) for function, args in tasks]
+                    return [future.result() for future in futures], workers
+            except (OSError, NotImplementedError) as e:
+                logger.warning(f"Pool de procesos no disponible ({e}): se valida en este proceso")
+        return [function(*args) for function, args in tasks], 1
+
+    def validate(self, incremental=True):
+        """
+        Valida todos los archivos de datos/
+        :param incremental: Saltear los archivos sin cambios desde la última validación sin errores
+        :return: ValidationReport
+        """
+        start = time.perf_counter()
+        previous = self._load_state() if incremental else {}
+        state, reports, tasks, owners = {}, [], [], []
+        estimated = 0
+
+        for path in self.files():
+            name = path.relative_to(self.directory).as_posix()
+            stat = path.stat()
+            entry = previous.get(name)
+            if self._unchanged(path, stat, entry):
+                reports.append(FileReport(name, "cached", entry["records"], warnings=entry["warnings"]))
+                state[name] = entry
+                continue
+            report = FileReport(name)
+            reports.append(report)
+            try:
+                planned = self._plan(path, name, report)
+            except (OSError, ValueError) as e:
+                report.errors.append(f"no se pudo leer: {e}")
+                planned = []
+            tasks.extend(planned)
+            owners.extend([report] * len(planned))
+            estimated += sum(args[3] - args[2] for function, args in planned if function is _validate_rows)
+
+        results, workers = self._run(tasks, estimated)
+        for report, (errors, records) in zip(owners, results):
+            report.records += records
+            report.errors.extend(errors)
+
+        for report in reports:
+            if report.status == "cached":
+                continue
+            if len(report.errors) > MAX_ERRORS:
+                report.errors[MAX_ERRORS:] = [f"... y {len(report.errors) - MAX_ERRORS} errores más"]
+            if report.errors:
+                report.status = "error"
+                continue
+            path = self.directory / report.name
+            stat = path.stat()
+            state[report.name] = {"sha1": content_hash(path), "mtime_ns": stat.st_mtime_ns, "size": stat.st_size,
+                                  "records": report.records, "warnings": report.warnings}
+
+        self._save_state(state)
+        return ValidationReport(reports, time.perf_counter() - start, workers)
+
+
+def validate_data(directory=None, incremental=True, workers=None):
+    """Valida datos/ (ver DataValidator.validate)"""
+    return DataValidator(directory, workers).validate(incremental)
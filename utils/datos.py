@@ -2,12 +2,257 @@
 Utilidades para cargar y manejar datos de prueba desde archivos externos
 """
 import csv
+import functools
+import itertools
 import json
 import os
+import threading
+import zlib
+from collections.abc import Mapping
+from utils import config
+
+
+class DataCacheStats:
+    """Contadores de la caché de datos (por proceso/worker)"""
+
+    def __init__(self):
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.compiled = 0
+
+    def resumen(self):
+        return (f"Compilados: {self.compiled} | Desde disco: {self.disk_hits} | "
+                f"Desde memoria: {self.memory_hits}")
+
+    @property
+    def active(self):
+        return bool(self.memory_hits or self.disk_hits or self.compiled)
+
+
+DATA_CACHE_STATS = DataCacheStats()
+
+
+def stable_hash(value):
+    """Hash estable entre procesos y ejecuciones (hash() de Python cambia con PYTHONHASHSEED)"""
+    return zlib.crc32(str(value).encode("utf-8"))
+
+
+class DataShard:
+    """
+    Porción de las filas de datos que ejecuta este proceso: i/n toma las filas
+    cuyo hash estable de la clave cae en el resto i-1 módulo n. Agregar o reordenar
+    filas no cambia el shard de las demás
+    """
+
+    # Shard de la ejecución fijado por conftest desde --data-shard (None: DATA_SHARD)
+    _current = None
+
+    def __init__(self, index=1, total=1):
+        if total < 1 or not 1 <= index <= total:
+            raise ValueError(f"Shard inválido: {index}/{total}")
+        self.index = index
+        self.total = total
+
+    @classmethod
+    def parse(cls, spec):
+        """Crea el shard desde 'i/n' (vacío o None: todas las filas)"""
+        if not spec:
+            return cls()
+        try:
+            index, total = (int(part) for part in str(spec).split("/"))
+        except ValueError:
+            raise ValueError(f"Shard inválido: {spec!r} (se espera i/n, por ejemplo 2/4)") from None
+        return cls(index, total)
+
+    @classmethod
+    def current(cls):
+        """Shard de este proceso: el de --data-shard si corre pytest, si no DATA_SHARD"""
+        return cls._current if cls._current is not None else cls.parse(config.data_shard())
+
+    @classmethod
+    def set_current(cls, shard):
+        """Fija el shard por defecto del proceso (None vuelve a DATA_SHARD)"""
+        cls._current = shard
+
+    def owns(self, key):
+        return self.total == 1 or stable_hash(key) % self.total == self.index - 1
+
+    def __repr__(self):
+        return f"{self.index}/{self.total}"
+
+
+class Record(tuple):
+    """
+    Fila de un RecordStore: una tupla (sin __dict__) que se usa como el dict de
+    csv.DictReader: record['username'], record.get(...), 'campo' in record, dict(record)
+    Cada RecordStore usa una subclase con sus campos (ver record_type)
+    """
+
+    __slots__ = ()
+    fields = ()
+    _positions = {}
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                key = self._positions[key]
+            except KeyError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        position = self._positions.get(key)
+        return default if position is None else tuple.__getitem__(self, position)
+
+    def keys(self):
+        return self.fields
+
+    def values(self):
+        return tuple(tuple.__iter__(self))
+
+    def items(self):
+        return tuple(zip(self.fields, tuple.__iter__(self)))
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __contains__(self, key):
+        return key in self._positions
+
+    def __eq__(self, other):
+        if isinstance(other, (Mapping, Record)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = tuple.__hash__
+
+    def __reduce__(self):
+        # La subclase se crea en record_type: se serializan los campos y los valores
+        return _make_record, (self.fields, tuple(tuple.__iter__(self)))
+
+    def __repr__(self):
+        return f"Record({dict(self.items())!r})"
+
+
+Mapping.register(Record)
+
+
+@functools.lru_cache(maxsize=None)
+def record_type(fields):
+    """Subclase de Record para una tupla de campos (una por encabezado distinto)"""
+    return type("Record", (Record,), {"__slots__": (), "fields": fields,
+                                      "_positions": {field: i for i, field in enumerate(fields)}})
+
+
+def _make_record(fields, values):
+    """Reconstruye un Record (pickle, copy) desde sus campos y valores"""
+    return tuple.__new__(record_type(fields), values)
+
+
+class RecordStore:
+    """
+    Registros de datos compactos: cada fila es una tupla Record con los valores
+    repetidos internados (una sola copia de 'success' para todas las filas).
+    Los índices (valor -> registros) se arman una vez por campo y filtrar o buscar
+    cuesta O(k) en la cantidad de resultados en lugar de recorrer todas las filas
+    """
+
+    def __init__(self, fields, rows=(), indexed=()):
+        self.fields = tuple(fields)
+        record = record_type(self.fields)
+        self.records = [tuple.__new__(record, row) for row in rows]
+        self._indexes = {}
+        for field in indexed:
+            if field in self.fields:
+                self.index(field)
+
+    @classmethod
+    def from_rows(cls, rows, fields=None, indexed=()):
+        """Arma el store desde filas dict (se consumen de a una: acepta un generador)"""
+        rows = iter(rows)
+        first = next(rows, None)
+        if fields is None:
+            fields = list(first) if first is not None else []
+        # Una sola copia de cada valor repetido (el dict se descarta al terminar)
+        shared = {}
+        values = ([] if first is None else
+                  ([shared.setdefault(value, value) if value.__class__ is str else value
+                    for value in map(row.get, fields)]
+                   for row in itertools.chain([first], rows)))
+        return cls(fields, values, indexed)
+
+    def index(self, field):
+        """Índice valor -> Record (si es único) o lista de Records; se arma la primera vez"""
+        index = self._indexes.get(field)
+        if index is None:
+            if field not in self.fields:
+                if self.records:
+                    raise KeyError(field)
+                # Archivo vacío: sin encabezado no hay campos, pero filtrar no es un error
+                return {}
+            position = self.fields.index(field)
+            index = {}
+            for record in self.records:
+                value = tuple.__getitem__(record, position)
+                found = index.get(value)
+                if found is None:
+                    index[value] = record
+                elif isinstance(found, list):
+                    found.append(record)
+                else:
+                    index[value] = [found, record]
+            self._indexes[field] = index
+        return index
+
+    def where(self, field, value):
+        """Registros con field == value"""
+        found = self.index(field).get(value)
+        if found is None:
+            return []
+        return list(found) if isinstance(found, list) else [found]
+
+    def lookup(self, field, value):
+        """Primer registro con field == value (None si no hay)"""
+        found = self.index(field).get(value)
+        return found[0] if isinstance(found, list) else found
+
+    def distinct(self, field):
+        """Valores distintos del campo"""
+        return list(self.index(field))
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, position):
+        return self.records[position]
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __reduce__(self):
+        # Se serializa como tuplas simples (sin depender de la subclase de record_type)
+        return (RecordStore, (self.fields, [tuple(tuple.__iter__(record)) for record in self.records],
+                              tuple(self._indexes)))
+
+    def __repr__(self):
+        return f"<RecordStore {len(self)} registros, campos: {', '.join(self.fields)}>"
 
 
 class DataLoader:
-    """Clase para cargar datos desde archivos CSV y JSON"""
+    """
+    Clase para cargar datos desde archivos CSV y JSON
+    Cada archivo se parsea una sola vez a su compilado en disco (ver load_compiled), que
+    comparten los workers; las listas, dicts y RecordStore se arman desde el compilado una
+    vez por proceso (clave: ruta, mtime y tamaño).
+    Los datos devueltos son compartidos: los tests no deben modificarlos
+    """
+
+    # Campos indexados al cargar con load_records (el resto se indexa al primer filtro)
+    RECORD_INDEXES = ("expected_result", "username")
+
+    _memo = {}
+    _compiled = {}
+    _lock = threading.Lock()
 
     @staticmethod
     def get_data_path(filename):
@@ -15,6 +260,55 @@ class DataLoader:
         current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         return os.path.join(current_dir, 'datos', filename)
 
+    @staticmethod
+    def _load_cached(filename, builder):
+        """
+        Devuelve los datos del archivo armados por builder desde su compilado (ver
+        load_compiled). Cada forma (lista, dict, RecordStore) se arma una vez por proceso
+        y se reutiliza mientras el fuente no cambie. Lanza FileNotFoundError si no existe
+        :return: (datos, True si se armaron en esta llamada)
+        """
+        file_path = DataLoader.get_data_path(filename)
+        kind = builder.__name__
+        stat = os.stat(file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with DataLoader._lock:
+            entry = DataLoader._memo.get((file_path, kind))
+        if entry is not None and entry[0] == signature:
+            DATA_CACHE_STATS.memory_hits += 1
+            return entry[1], False
+
+        data = builder(DataLoader.load_compiled(filename))
+        with DataLoader._lock:
+            DataLoader._memo[(file_path, kind)] = (signature, data)
+        return data, True
+
+    @staticmethod
+    def clear_cache():
+        """Descarta los datos memorizados del proceso (los compilados en disco se validan por mtime)"""
+        with DataLoader._lock:
+            DataLoader._memo.clear()
+            DataLoader._compiled.clear()
+
+    @staticmethod
+    def _build_csv(compiled):
+        return [dict(zip(compiled.fields, values)) for values in compiled.values(0, len(compiled))]
+
+    @staticmethod
+    def _build_json(compiled):
+        sections = compiled.header["sections"]
+        data = {name: compiled.values(start, start + count) for name, (start, count) in sections.items()}
+        if list(sections) == [""] and not compiled.scalars:
+            # El JSON era una lista
+            return data[""]
+        return {**data, **compiled.scalars}
+
+    @staticmethod
+    def _build_records(compiled):
+        rows = (dict(zip(compiled.fields, values)) for values in compiled.values(0, len(compiled)))
+        return RecordStore.from_rows(rows, fields=list(compiled.fields), indexed=DataLoader.RECORD_INDEXES)
+
     @staticmethod
     def load_csv(filename):
         """
@@ -26,15 +320,12 @@ class DataLoader:
         Returns:
             list: Lista de diccionarios con los datos del CSV
         """
-        data = []
         file_path = DataLoader.get_data_path(filename)
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                csv_reader = csv.DictReader(file)
-                for row in csv_reader:
-                    data.append(row)
-            print(f"[OK] Datos cargados desde {filename}: {len(data)} registros")
+            data, built = DataLoader._load_cached(filename, DataLoader._build_csv)
+            if built:
+                print(f"[OK] Datos cargados desde {filename}: {len(data)} registros")
             return data
         except FileNotFoundError:
             print(f"[ERROR] Archivo no encontrado: {file_path}")
@@ -43,6 +334,92 @@ class DataLoader:
             print(f"[ERROR] Error al leer CSV: {e}")
             return []
 
+    @staticmethod
+    def load_records(filename):
+        """
+        Carga un CSV como RecordStore (por columnas e indexado por RECORD_INDEXES)
+
+        Args:
+            filename (str): Nombre del archivo CSV
+
+        Returns:
+            RecordStore: Registros del CSV (vacío si el archivo no existe o no se puede leer)
+        """
+        file_path = DataLoader.get_data_path(filename)
+
+        try:
+            data, built = DataLoader._load_cached(filename, DataLoader._build_records)
+            if built:
+                print(f"[OK] Datos cargados desde {filename}: {len(data)} registros")
+            return data
+        except FileNotFoundError:
+            print(f"[ERROR] Archivo no encontrado: {file_path}")
+        except Exception as e:
+            print(f"[ERROR] Error al leer CSV: {e}")
+        return RecordStore([], [])
+
+    @staticmethod
+    def load_compiled(filename):
+        """
+        Abre un CSV o JSON precompilado a binario y mapeado en memoria: abrirlo no depende
+        del tamaño del archivo y solo se decodifican los registros que se leen.
+        Se recompila automáticamente cuando cambia el archivo fuente
+
+        Args:
+            filename (str): Nombre del archivo de datos
+
+        Returns:
+            CompiledData: Secuencia de registros (filas del CSV o, con section(nombre), listas del JSON)
+        """
+        from utils.datos_compilados import open_compiled
+
+        file_path = DataLoader.get_data_path(filename)
+        stat = os.stat(file_path)
+        with DataLoader._lock:
+            stale = DataLoader._compiled.get(file_path)
+            if stale is not None:
+                if stale.is_fresh(stat):
+                    DATA_CACHE_STATS.memory_hits += 1
+                    return stale
+                # Se cierra antes de recompilar: en Windows os.replace falla sobre un archivo mapeado
+                del DataLoader._compiled[file_path]
+                stale.close()
+
+        # La compilación corre fuera del lock: no frena la lectura de los demás archivos
+        data, compiled = open_compiled(file_path)
+        with DataLoader._lock:
+            current = DataLoader._compiled.get(file_path)
+            if current is not None and current.is_fresh(stat):
+                # Otro hilo lo abrió mientras tanto: se usa el suyo
+                data.close()
+                return current
+            DataLoader._compiled[file_path] = data
+        if compiled:
+            DATA_CACHE_STATS.compiled += 1
+            print(f"[OK] Datos compilados desde {filename}: {len(data)} registros")
+        else:
+            DATA_CACHE_STATS.disk_hits += 1
+        return data
+
+    @staticmethod
+    def load_view(filename, empty):
+        """
+        Carga un archivo de datos desde su compilado mapeado en memoria (ver load_compiled)
+        con la forma del original: secuencia de filas del CSV o dict del JSON
+
+        Args:
+            filename (str): Nombre del archivo de datos
+            empty: Valor devuelto si el archivo no existe (los demás errores se propagan)
+
+        Returns:
+            CompiledData | dict: Datos del archivo (se decodifican a medida que se leen)
+        """
+        try:
+            return DataLoader.load_compiled(filename).view()
+        except FileNotFoundError:
+            print(f"[ERROR] Archivo no encontrado: {DataLoader.get_data_path(filename)}")
+            return empty
+
     @staticmethod
     def load_json(filename):
         """
@@ -57,9 +434,9 @@ class DataLoader:
         file_path = DataLoader.get_data_path(filename)
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-            print(f"[OK] Datos cargados desde {filename}")
+            data, built = DataLoader._load_cached(filename, DataLoader._build_json)
+            if built:
+                print(f"[OK] Datos cargados desde {filename}")
             return data
         except FileNotFoundError:
             print(f"[ERROR] Archivo no encontrado: {file_path}")
@@ -71,15 +448,75 @@ class DataLoader:
             print(f"[ERROR] Error al leer JSON: {e}")
             return {}
 
+    @staticmethod
+    def _row_key(row, key):
+        if key is not None:
+            return row.get(key, "")
+        # Sin clave: la fila completa (estable aunque cambie su posición en el archivo)
+        return "\x1f".join(str(value) for value in row.values())
+
+    @staticmethod
+    def _stream(filename):
+        """Filas del archivo de a una, sin cargarlo completo (CSV y JSON Lines)"""
+        file_path = DataLoader.get_data_path(filename)
+        extension = os.path.splitext(filename)[1].lower()
+        with open(file_path, 'r', encoding='utf-8', newline='') as file:
+            if extension == ".csv":
+                yield from csv.DictReader(file)
+            elif extension == ".jsonl":
+                for line in file:
+                    if line.strip():
+                        yield json.loads(line)
+            else:
+                raise ValueError(f"{filename}: solo se leen por filas archivos .csv y .jsonl")
+
+    @staticmethod
+    def iter_rows(filename, shard=None, key=None, section=None):
+        """
+        Itera las filas de un archivo de datos que corresponden al shard
+        Los CSV y JSON se recorren por bloques desde su compilado (ver load_compiled) y
+        los JSON Lines de a una fila: en memoria quedan solo las del shard
+
+        Args:
+            filename (str): Archivo en datos/ (.csv, .jsonl o .json con section)
+            shard (DataShard | str): Shard de las filas (por defecto, DataShard.current())
+            key (str): Campo cuyo hash asigna la fila al shard (por defecto, la fila completa)
+            section (str): Lista a recorrer dentro de un .json
+
+        Yields:
+            dict: Filas del shard
+        """
+        if shard is None:
+            shard = DataShard.current()
+        elif not isinstance(shard, DataShard):
+            shard = DataShard.parse(shard)
+        try:
+            if section is not None:
+                rows = DataLoader.load_compiled(filename).section(section)
+            elif filename.lower().endswith(".csv"):
+                rows = DataLoader.load_compiled(filename)
+            else:
+                rows = DataLoader._stream(filename)
+            for row in rows:
+                if shard.owns(DataLoader._row_key(row, key)):
+                    yield row
+        except FileNotFoundError:
+            print(f"[ERROR] Archivo no encontrado: {DataLoader.get_data_path(filename)}")
+
     @staticmethod
     def get_login_data():
-        """Obtiene los datos de login desde el CSV"""
-        return DataLoader.load_csv('login.csv')
+        """Obtiene los datos de login desde el CSV (compilado y mapeado en memoria)"""
+        return DataLoader.load_view('login.csv', [])
+
+    @staticmethod
+    def get_login_records():
+        """Obtiene los datos de login del CSV como RecordStore indexado"""
+        return DataLoader.load_records('login.csv')
 
     @staticmethod
     def get_productos_data():
-        """Obtiene los datos de productos desde el JSON"""
-        return DataLoader.load_json('productos.json')
+        """Obtiene los datos de productos desde el JSON (compilado y mapeado en memoria)"""
+        return DataLoader.load_view('productos.json', {})
 
 
 class TestDataHelper:
@@ -91,12 +528,14 @@ class TestDataHelper:
         Filtra datos de login por resultado esperado
 
         Args:
-            login_data (list): Lista de datos de login
+            login_data (list | RecordStore): Datos de login (con un RecordStore se usa su índice)
             expected_result (str): Resultado esperado (success, error, locked)
 
         Returns:
             list: Lista filtrada
         """
+        if isinstance(login_data, RecordStore):
+            return login_data.where('expected_result', expected_result)
         return [data for data in login_data if data['expected_result'] == expected_result]
 
     @staticmethod
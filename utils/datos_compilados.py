@@ -0,0 +1,264 @@
+"""
+Archivos de datos/ precompilados a un formato binario con índice de offsets
+Cada CSV o JSON se compila una vez (y otra vez solo si cambia su mtime o tamaño)
+a un archivo en la caché de datos; al abrirlo se mapea en memoria (mmap) y solo se
+decodifican los registros que se leen, así que abrirlo cuesta lo mismo sin importar
+el tamaño del archivo
+
+Formato (little-endian):
+    MAGIC (8 bytes) | versión (uint16) | largo del encabezado (uint32) | encabezado JSON
+    | offsets (uint64, registros + 1) | registros (JSON compacto en UTF-8)
+"""
+import csv
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+from array import array
+from collections.abc import Sequence
+from utils import config
+
+
+MAGIC = b"DATOSBIN"
+FORMAT_VERSION = 1
+_PREFIX = struct.Struct("<8sHI")
+_SPAN = struct.Struct("<2Q")
+# Registros decodificados por llamada a json.loads al recorrer una sección
+ITER_BLOCK = 512
+
+
+def _private_dir():
+    return os.path.join(tempfile.gettempdir(), f"datos-{os.getpid()}")
+
+
+def sidecar_path(file_path, directory=None):
+    """Ruta del archivo compilado de un archivo de datos (en DATA_CACHE_DIR)"""
+    directory = directory or config.data_cache_dir() or _private_dir()
+    key = hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()[:12]
+    return os.path.join(directory, f"{os.path.basename(file_path)}.{key}.bin")
+
+
+def _encode(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _csv_records(file_path, header):
+    with open(file_path, "r", encoding="utf-8", newline="") as file:
+        reader = csv.reader(file)
+        header["fields"] = next(reader, [])
+        width = len(header["fields"])
+        for row in reader:
+            # Mismo criterio que csv.DictReader: faltantes como None
+            yield row + [None] * (width - len(row)) if len(row) < width else row[:width]
+
+
+def _json_records(file_path, header):
+    with open(file_path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    if isinstance(data, list):
+        data = {"": data}
+    start = 0
+    for name, value in data.items():
+        if isinstance(value, list):
+            header["sections"][name] = [start, len(value)]
+            start += len(value)
+            yield from value
+        else:
+            header["scalars"][name] = value
+
+
+def compile_file(file_path, target=None):
+    """
+    Compila un CSV o JSON de datos al formato binario (escritura atómica)
+    :return: Ruta del archivo compilado
+    """
+    target = target or sidecar_path(file_path)
+    stat = os.stat(file_path)
+    kind = "csv" if file_path.lower().endswith(".csv") else "json"
+    header = {"source": os.path.abspath(file_path), "mtime_ns": stat.st_mtime_ns, "size": stat.st_size,
+              "kind": kind, "fields": [], "sections": {}, "scalars": {}}
+    records = _csv_records(file_path, header) if kind == "csv" else _json_records(file_path, header)
+
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    offsets = array("Q", [0])
+    with tempfile.TemporaryFile(dir=os.path.dirname(target)) as body:
+        for record in records:
+            offsets.append(offsets[-1] + body.write(_encode(record)))
+        if kind == "csv":
+            header["sections"][""] = [0, len(offsets) - 1]
+        if sys.byteorder != "little":
+            offsets.byteswap()
+
+        encoded = _encode(header)
+        tmp_path = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as out:
+            out.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(encoded)))
+            out.write(encoded)
+            offsets.tofile(out)
+            body.seek(0)
+            shutil.copyfileobj(body, out)
+    # Reemplazo atómico: los workers que ya lo tienen mapeado siguen leyendo el anterior
+    try:
+        os.replace(tmp_path, target)
+    except OSError:
+        os.remove(tmp_path)
+        raise
+    return target
+
+
+class _Section(Sequence):
+    """Registros contiguos de un archivo compilado (una lista del JSON o las filas del CSV)"""
+
+    def __init__(self, data, start, count):
+        self._data = data
+        self._start = start
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            positions = range(self._count)[position]
+            if positions.step == 1:
+                return self._data.records(self._start + positions.start, self._start + positions.stop)
+            return [self[i] for i in positions]
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count:
+            raise IndexError(position)
+        return self._data.record(self._start + position)
+
+    def __iter__(self):
+        # Por bloques: en memoria queda solo el bloque en curso
+        for start in range(0, self._count, ITER_BLOCK):
+            end = min(start + ITER_BLOCK, self._count)
+            yield from self._data.records(self._start + start, self._start + end)
+
+    def __repr__(self):
+        return f"<Sección de {self._data.name}: {self._count} registros>"
+
+
+class CompiledData(_Section):
+    """
+    Archivo compilado mapeado en memoria; se usa como la lista de registros
+    (filas Record del CSV o dicts de las listas del JSON, ver section)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, header_size = _PREFIX.unpack_from(self._map, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._map.close()
+            raise ValueError(f"{path} no es un archivo de datos compilado (versión {FORMAT_VERSION})")
+        self.header = json.loads(self._map[_PREFIX.size:_PREFIX.size + header_size])
+        self.name = os.path.basename(self.header["source"])
+        self.fields = tuple(self.header["fields"])
+        self.scalars = self.header["scalars"]
+        self._offsets = _PREFIX.size + header_size
+        count = sum(section[1] for section in self.header["sections"].values())
+        self._body = self._offsets + (count + 1) * 8
+        self._record = None
+        if self.header["kind"] == "csv":
+            from utils.datos import record_type
+            self._record = record_type(self.fields)
+        super().__init__(self, 0, count)
+
+    def is_fresh(self, stat):
+        """El compilado corresponde a esta versión del archivo fuente"""
+        return (self.header["mtime_ns"], self.header["size"]) == (stat.st_mtime_ns, stat.st_size)
+
+    def record(self, number):
+        """Decodifica un registro por su número (solo lee sus bytes del mmap)"""
+        start, end = _SPAN.unpack_from(self._map, self._offsets + number * 8)
+        value = json.loads(self._map[self._body + start:self._body + end])
+        return value if self._record is None else tuple.__new__(self._record, value)
+
+    def records(self, start, end):
+        """Registros de un rango (ver values)"""
+        values = self.values(start, end)
+        if self._record is None:
+            return values
+        return [tuple.__new__(self._record, value) for value in values]
+
+    def values(self, start, end):
+        """
+        Decodifica un rango de registros con una sola llamada a json.loads (lectura en bloque)
+        En un CSV cada registro es la lista de valores de la fila, en el orden de fields
+        """
+        if end <= start:
+            return []
+        offsets = array("Q")
+        offsets.frombytes(self._map[self._offsets + start * 8:self._offsets + (end + 1) * 8])
+        if sys.byteorder != "little":
+            offsets.byteswap()
+        base = offsets[0]
+        body = self._map[self._body + base:self._body + offsets[-1]]
+        # Cada registro es un valor JSON completo: juntos forman una lista JSON válida
+        return json.loads(b"[" + b",".join([body[offsets[i] - base:offsets[i + 1] - base]
+                                            for i in range(end - start)]) + b"]")
+
+    def section(self, name):
+        """Lista del JSON por nombre (vacía si no existe)"""
+        start, count = self.header["sections"].get(name, (0, 0))
+        return _Section(self, start, count)
+
+    def view(self):
+        """
+        El archivo con la forma del original: la secuencia de registros (CSV o lista JSON)
+        o un dict con las listas del JSON como secciones y el resto de los valores
+        """
+        sections = self.header["sections"]
+        if self.header["kind"] == "csv" or (list(sections) == [""] and not self.scalars):
+            return self
+        return {**{name: _Section(self, start, count) for name, (start, count) in sections.items()},
+                **self.scalars}
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def __repr__(self):
+        return f"<CompiledData {self.name}: {len(self)} registros>"
+
+
+def open_compiled(file_path):
+    """
+    Abre el compilado de un archivo de datos, compilándolo si no existe o si el
+    fuente cambió (mtime o tamaño). Lanza FileNotFoundError si el fuente no existe
+    :return: (CompiledData, True si se compiló en esta llamada)
+    """
+    stat = os.stat(file_path)
+    target = sidecar_path(file_path)
+    try:
+        data = CompiledData(target)
+        if data.is_fresh(stat):
+            return data, False
+        data.close()
+    except (OSError, ValueError, struct.error):
+        pass
+    try:
+        return CompiledData(compile_file(file_path, target)), True
+    except FileNotFoundError:
+        raise
+    except OSError as e:
+        private = sidecar_path(file_path, _private_dir())
+        if private == target:
+            raise
+        # El compartido no se pudo reemplazar (en Windows, si otro worker lo tiene mapeado):
+        # se compila una copia propia del proceso en lugar de perder los datos
+        print(f"[WARN] No se pudo actualizar {target}: {e}. Se compila en {private}")
+        return CompiledData(compile_file(file_path, private)), True
@@ -0,0 +1,185 @@
+"""
+Fábrica única de WebDrivers para pytest, behave y la clase legacy BaseTest
+"""
+import atexit
+import logging
+import threading
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from utils import config
+
+
+logger = logging.getLogger(__name__)
+
+
+class _SharedService(Service):
+    """
+    Service de ChromeDriver que se inicia una sola vez y atiende muchas sesiones.
+    driver.quit() llama a stop(), por eso stop() no detiene el proceso:
+    el cierre real se hace con shutdown() al terminar la ejecución.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            process = getattr(self, "process", None)
+            if process is not None and process.poll() is None:
+                return
+            logger.info("Iniciando proceso de ChromeDriver compartido...")
+            super().start()
+            logger.info(f"ChromeDriver escuchando en {self.service_url}")
+
+    def stop(self):
+        pass
+
+    def shutdown(self):
+        """Detiene el proceso de ChromeDriver"""
+        if getattr(self, "process", None) is not None:
+            super().stop()
+            self.process = None
+
+
+def _full_profile(options):
+    """Perfil estándar del proyecto: carga completa de las páginas"""
+    options.add_argument("--start-maximized")
+    options.add_argument("--disable-notifications")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")  # Para CI
+    options.add_experimental_option("excludeSwitches", ["enable-logging"])
+
+
+# Recursos que el perfil lean no descarga (no intervienen en los tests)
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*backtrace.io*", "*segment.io*", "*hotjar.com*",
+]
+
+
+def _lean_profile(options):
+    """
+    Perfil rápido: el driver.get vuelve con DOMContentLoaded (eager) y Chrome
+    no hace tráfico de fondo. El bloqueo de recursos se aplica vía CDP al crear la sesión
+    """
+    _full_profile(options)
+    options.page_load_strategy = "eager"
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--disable-component-update")
+    options.add_argument("--disable-default-apps")
+    options.add_argument("--disable-sync")
+    options.add_argument("--metrics-recording-only")
+    options.add_argument("--no-first-run")
+
+
+def _block_resources(driver):
+    """Bloquea imágenes, fuentes y dominios de analytics con Network.setBlockedURLs"""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
+
+class DriverFactory:
+    """Crea sesiones de Chrome contra un único proceso de ChromeDriver"""
+
+    PROFILES = {
+        "full": _full_profile,
+        "lean": _lean_profile,
+    }
+
+    # Nombres alternativos de perfiles (comparten Options y ajustes de sesión)
+    PROFILE_ALIASES = {
+        "default": "full",
+    }
+
+    # Ajustes que requieren una sesión abierta (CDP), por perfil
+    SESSION_SETUP = {
+        "lean": _block_resources,
+    }
+
+    _service = None
+    _options_cache = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def resolve_profile(cls, profile=None):
+        """Nombre canónico del perfil (None = config.browser_profile())"""
+        profile = profile or config.browser_profile()
+        return cls.PROFILE_ALIASES.get(profile, profile)
+
+    @classmethod
+    def get_options(cls, profile=None):
+        """
+        Obtiene las Options de un perfil (se construyen una sola vez y se cachean)
+        :param profile: Nombre del perfil en DriverFactory.PROFILES (None = config.browser_profile())
+        :return: Options de Chrome
+        """
+        profile = cls.resolve_profile(profile)
+        with cls._lock:
+            options = cls._options_cache.get(profile)
+            if options is None:
+                options = Options()
+                cls.PROFILES[profile](options)
+
+                if config.is_headless():
+                    logger.info("Ejecutando en entorno CI - Configurando modo headless")
+                    options.add_argument("--headless")
+                    options.add_argument("--window-size=1920,1080")
+
+                cls._options_cache[profile] = options
+            return options
+
+    @classmethod
+    def get_service(cls):
+        """Obtiene el Service compartido de ChromeDriver (se crea una sola vez)"""
+        with cls._lock:
+            if cls._service is None:
+                path = config.chromedriver_path()
+                logger.info(f"ChromeDriver: {path or 'resuelto por Selenium Manager'}")
+                cls._service = _SharedService(executable_path=path)
+            return cls._service
+
+    @classmethod
+    def create_driver(cls, profile=None):
+        """
+        Abre una nueva sesión de Chrome
+        :param profile: Nombre del perfil de opciones (None = config.browser_profile())
+        :return: WebDriver
+        """
+        profile = cls.resolve_profile(profile)
+        options = cls.get_options(profile)
+        service = cls.get_service()
+
+        try:
+            driver = webdriver.Chrome(service=service, options=options)
+        except Exception as e:
+            logger.error(f"Error al inicializar WebDriver: {e}")
+            raise
+
+        setup = cls.SESSION_SETUP.get(profile)
+        if setup is not None:
+            try:
+                setup(driver)
+            except Exception as e:
+                logger.warning(f"No se pudo aplicar la configuración del perfil '{profile}': {e}")
+
+        driver.implicitly_wait(config.implicit_wait())
+        logger.info(f"ChromeDriver iniciado exitosamente (perfil: {profile})")
+        return driver
+
+    @classmethod
+    def shutdown(cls):
+        """Detiene el proceso compartido de ChromeDriver"""
+        with cls._lock:
+            if cls._service is not None:
+                logger.info("Deteniendo ChromeDriver compartido...")
+                cls._service.shutdown()
+                cls._service = None
+
+
+# Garantiza que el proceso compartido no quede huérfano al salir del intérprete
+atexit.register(DriverFactory.shutdown)
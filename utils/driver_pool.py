@@ -0,0 +1,250 @@
+"""
+Pool de WebDrivers reutilizables entre tests UI
+"""
+import logging
+import os
+import threading
+import time
+from selenium.common.exceptions import WebDriverException
+from utils.timing import percentile
+
+
+logger = logging.getLogger(__name__)
+
+# Memoria aproximada que consume un Chrome headless con una pestaña de SauceDemo
+MEMORY_PER_BROWSER_MB = 512
+# Un worker ejecuta un test a la vez: uno en uso y uno de repuesto alcanza
+MAX_SIZE_PER_WORKER = 2
+
+
+def _available_memory_mb():
+    """Memoria disponible en MB (None si no se puede determinar)"""
+    try:
+        with open("/proc/meminfo", encoding="utf-8") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+class DriverPool:
+    """
+    Mantiene navegadores abiertos durante toda la sesión de pytest.
+    Entre tests el navegador se limpia (cookies, localStorage, sessionStorage
+    y pestañas extra) en lugar de cerrarse y volver a abrirse.
+    Opcionalmente precalienta navegadores en hilos de segundo plano.
+    Con pytest-xdist cada worker tiene su propia sesión y por lo tanto su propio pool.
+    """
+
+    def __init__(self, factory, size=0):
+        """
+        Inicializa el pool
+        :param factory: Callable que crea un WebDriver nuevo (recibe opcionalmente el perfil)
+        :param size: Navegadores a mantener precalentados (0 = sin precalentamiento)
+        """
+        self._factory = factory
+        self.size = size
+        self._libres = []
+        self._pendientes = 0
+        self._cerrado = False
+        self._cond = threading.Condition()
+
+        self.lanzamientos = 0
+        self.reutilizaciones = 0
+        self.descartados = 0
+        self.cuarentenas = 0
+        self.tiempos_lanzamiento = []
+        self.tiempos_espera = []
+
+    @staticmethod
+    def auto_size():
+        """
+        Calcula cuántos navegadores precalentar según CPU y memoria disponibles,
+        repartidos entre los workers de pytest-xdist si los hay
+        """
+        workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1") or 1)
+        budget = max(1, (os.cpu_count() or 1) // 2)
+        memory = _available_memory_mb()
+        if memory is not None:
+            budget = min(budget, memory // MEMORY_PER_BROWSER_MB)
+        return max(0, min(MAX_SIZE_PER_WORKER, budget // workers))
+
+    def prewarm(self):
+        """Lanza en segundo plano los navegadores que faltan para llegar a size"""
+        with self._cond:
+            faltantes = self.size - len(self._libres) - self._pendientes
+        if faltantes > 0:
+            logger.info(f"Precalentando {faltantes} navegador(es) en segundo plano")
+        for _ in range(faltantes):
+            self._launch_in_background()
+
+    def acquire(self, fresh=False, profile=None):
+        """
+        Entrega un WebDriver listo para usar
+        :param fresh: Si es True se lanza siempre un navegador nuevo
+        :param profile: Perfil distinto del que usa el pool (implica navegador nuevo)
+        :return: WebDriver
+        """
+        if profile is not None:
+            logger.info(f"Lanzando navegador nuevo (perfil: {profile})")
+            return self._launch(profile)
+        if fresh:
+            logger.info("Lanzando navegador nuevo (fresh_browser)")
+            return self._launch()
+
+        inicio = time.perf_counter()
+        with self._cond:
+            # Si hay navegadores precalentándose conviene esperarlos antes que lanzar otro
+            while not self._libres and self._pendientes:
+                self._cond.wait()
+            self.tiempos_espera.append(time.perf_counter() - inicio)
+
+            if self._libres:
+                driver, usado = self._libres.pop()
+                if usado:
+                    self.reutilizaciones += 1
+                    logger.info(f"Reutilizando navegador del pool (reutilizaciones: {self.reutilizaciones})")
+                else:
+                    logger.info("Usando navegador precalentado del pool")
+                return driver
+
+        logger.info("Lanzando navegador nuevo")
+        return self._launch()
+
+    def release(self, driver, reusable=True, quarantine=False):
+        """
+        Devuelve un WebDriver al pool
+        :param driver: WebDriver entregado por acquire()
+        :param reusable: False para navegadores que no pertenecen al pool (fresh_browser)
+        :param quarantine: True si el test falló y el navegador no debe reutilizarse
+        """
+        if quarantine:
+            self.cuarentenas += 1
+            logger.warning("Navegador en cuarentena tras un fallo, se reemplaza")
+        elif reusable and self.reset(driver):
+            with self._cond:
+                if not self._cerrado:
+                    self._libres.append((driver, True))
+                    self._cond.notify_all()
+                    return
+        elif reusable:
+            self.descartados += 1
+
+        self._quit(driver)
+        if reusable and self.size > 0:
+            self.prewarm()
+
+    @staticmethod
+    def reset(driver):
+        """
+        Limpia el estado del navegador para el siguiente test
+        :return: True si el navegador quedó en condiciones de reutilizarse
+        """
+        try:
+            # Cerrar pestañas/ventanas adicionales abiertas por el test
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # El storage solo es accesible desde el origen de la página actual
+            if driver.current_url.startswith("http"):
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except WebDriverException as e:
+            logger.warning(f"No se pudo limpiar el navegador, se descarta: {e}")
+            return False
+
+    def close(self, timeout=60):
+        """Cierra todos los navegadores del pool, esperando los que se están lanzando"""
+        with self._cond:
+            self._cerrado = True
+            self._cond.wait_for(lambda: self._pendientes == 0, timeout=timeout)
+            libres, self._libres = self._libres, []
+        for driver, _ in libres:
+            self._quit(driver)
+
+    @property
+    def lanzamientos_ahorrados(self):
+        """Cantidad de aperturas de navegador evitadas gracias a la reutilización"""
+        return self.reutilizaciones
+
+    def stats(self):
+        """Métricas del pool en segundos, útiles para dimensionar size"""
+        return {
+            "size": self.size,
+            "lanzamientos": self.lanzamientos,
+            "reutilizaciones": self.reutilizaciones,
+            "lanzamientos_ahorrados": self.lanzamientos_ahorrados,
+            "descartados": self.descartados,
+            "cuarentenas": self.cuarentenas,
+            "lanzamiento_promedio": (sum(self.tiempos_lanzamiento) / len(self.tiempos_lanzamiento)
+                                     if self.tiempos_lanzamiento else 0.0),
+            "lanzamiento_max": max(self.tiempos_lanzamiento, default=0.0),
+            "espera_promedio": (sum(self.tiempos_espera) / len(self.tiempos_espera)
+                                if self.tiempos_espera else 0.0),
+            "espera_p95": percentile(self.tiempos_espera, 95),
+            "espera_max": max(self.tiempos_espera, default=0.0),
+        }
+
+    def resumen(self):
+        """Resumen de uso del pool para logs y reportes"""
+        stats = self.stats()
+        return (f"Tamaño: {stats['size']} | "
+                f"Navegadores lanzados: {stats['lanzamientos']} | "
+                f"Reutilizaciones: {stats['reutilizaciones']} | "
+                f"Lanzamientos ahorrados: {stats['lanzamientos_ahorrados']} | "
+                f"Cuarentenas: {stats['cuarentenas']} | "
+                f"Descartados: {stats['descartados']} | "
+                f"Lanzamiento prom/max: {stats['lanzamiento_promedio']:.2f}s/{stats['lanzamiento_max']:.2f}s | "
+                f"Espera prom/p95/max: {stats['espera_promedio']:.2f}s/"
+                f"{stats['espera_p95']:.2f}s/{stats['espera_max']:.2f}s")
+
+    def _launch(self, *args):
+        inicio = time.perf_counter()
+        driver = self._factory(*args)
+        duracion = time.perf_counter() - inicio
+        with self._cond:
+            self.lanzamientos += 1
+            self.tiempos_lanzamiento.append(duracion)
+        logger.info(f"Navegador lanzado en {duracion:.2f}s")
+        return driver
+
+    def _launch_in_background(self):
+        with self._cond:
+            if self._cerrado:
+                return
+            self._pendientes += 1
+        threading.Thread(target=self._background_launch, name="driver-pool-prewarm", daemon=True).start()
+
+    def _background_launch(self):
+        driver = None
+        try:
+            driver = self._launch()
+        except Exception as e:
+            logger.error(f"Error al precalentar navegador: {e}")
+
+        with self._cond:
+            self._pendientes -= 1
+            sobrante = driver is not None and self._cerrado
+            if driver is not None and not sobrante:
+                self._libres.append((driver, False))
+            self._cond.notify_all()
+
+        if sobrante:
+            self._quit(driver)
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            logger.error(f"Error al cerrar WebDriver: {e}")
@@ -1,6 +1,7 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from utils.waits import Expect, WaitEngine, demo_pause
 import time
 import os
 
@@ -11,6 +12,7 @@ class Helpers:
     def __init__(self, driver, wait):
         self.driver = driver
         self.wait = wait
+        self.waits = WaitEngine(driver)
 
     def login(self, username='standard_user', password='secret_sauce'):
         """Realiza el login en la aplicación"""
@@ -26,20 +28,17 @@ class Helpers:
             # Ingresar credenciales y hacer login
             username_field.clear()
             username_field.send_keys(username)
-            time.sleep(1)  # Pausa para ver la entrada
+            demo_pause(1)  # Pausa para ver la entrada (solo en modo demo)
 
             password_field.clear()
             password_field.send_keys(password)
-            time.sleep(1)  # Pausa para ver la entrada
+            demo_pause(1)  # Pausa para ver la entrada (solo en modo demo)
 
             login_button.click()
             print(" Credenciales ingresadas, haciendo click en login...")
 
             # Verificar login exitoso
-            self.wait.until(
-                EC.url_contains("inventory.html")
-            )
-            time.sleep(2)  # Pausa para ver el resultado
+            self.waits.settle(Expect.url_contains("inventory.html"), demo_seconds=2)
             return True
 
         except Exception as e:
@@ -81,7 +80,10 @@ class Helpers:
             if add_buttons:
                 print(f" Agregando producto {product_index + 1} al carrito...")
                 add_buttons[product_index].click()
-                time.sleep(2)  # Pausa para ver el botón clickeado
+                # Postcondición: el botón clickeado deja de ser "Add to cart"
+                self.waits.settle(Expect.element_count_changes(
+                    (By.XPATH, "//button[contains(text(), 'Add to cart')]"), len(add_buttons)
+                ), demo_seconds=2)
                 return True
             return False
 
@@ -91,11 +93,8 @@ class Helpers:
 
     def get_cart_count(self):
         """Obtiene el número de items en el carrito"""
-        try:
-            cart_badge = self.driver.find_element(By.CLASS_NAME, "shopping_cart_badge")
-            return int(cart_badge.text)
-        except NoSuchElementException:
-            return 0
+        cart_badges = self.driver.find_elements(By.CLASS_NAME, "shopping_cart_badge")
+        return int(cart_badges[0].text) if cart_badges else 0
 
     def take_screenshot(self, test_name):
         """Toma una captura de pantalla y la guarda"""
@@ -0,0 +1,252 @@
+"""
+Caché de respuestas GET de APIClient
+LRU en memoria con TTL, respaldo opcional en disco y revalidación condicional
+(If-None-Match / If-Modified-Since): una respuesta vencida con validadores
+se revalida y, si el servidor responde 304, se reutiliza sin volver a descargarla
+"""
+import gzip
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from urllib.parse import quote, urlsplit, urlunsplit
+from utils import config
+from utils.cassettes import build_response, request_key, serialize_response
+
+
+logger = logging.getLogger(__name__)
+
+# Métodos que no modifican el recurso (el resto invalida las respuestas cacheadas)
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class HttpCacheStats:
+    """Contadores de la caché de respuestas (por proceso/worker)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.bytes_saved = 0
+
+    def add(self, counter, saved=0):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+            self.bytes_saved += saved
+
+    @property
+    def active(self):
+        return bool(self.hits or self.revalidated or self.misses)
+
+    def resumen(self):
+        return (f"Respuestas cacheadas: {self.hits} | Revalidadas (304): {self.revalidated} | "
+                f"Descargadas: {self.misses} | Invalidaciones: {self.invalidations} | "
+                f"Bytes ahorrados: {self.bytes_saved}")
+
+
+HTTP_CACHE_STATS = HttpCacheStats()
+
+
+def _resource(url):
+    """URL sin query ni barra final (lo que invalida una request que modifica el recurso)"""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path.rstrip("/"), "", ""))
+
+
+def _body_size(response):
+    """Bytes del body de una respuesta serializada (no caracteres del texto)"""
+    if "base64" in response:
+        encoded = response["base64"]
+        return len(encoded) * 3 // 4 - encoded[-2:].count("=")
+    return len(response.get("text", "").encode("utf-8"))
+
+
+class ResponseCache:
+    """
+    Respuestas GET por clave de request (método, URL y query normalizados)
+    Las entradas son respuestas serializadas como en los cassettes
+    En disco cada recurso tiene su directorio (/posts/1 queda dentro de /posts), así
+    una invalidación borra los archivos del recurso sin leer el resto de la caché
+    """
+
+    def __init__(self, maxsize=256, ttl=300.0, directory=None, stats=HTTP_CACHE_STATS, clock=time.time):
+        """
+        :param maxsize: Entradas máximas en memoria (se descarta la menos usada)
+        :param ttl: Segundos que una entrada se usa sin consultar al servidor
+        :param directory: Directorio del respaldo en disco (None = solo memoria)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.directory = Path(directory) if directory else None
+        self.stats = stats
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    # ---------- Almacenamiento ----------
+
+    def _resource_dir(self, resource):
+        """Directorio del recurso: host y cada segmento del path escapados ('.' incluido)"""
+        parts = urlsplit(resource)
+        segments = [parts.scheme, parts.netloc] + [s for s in parts.path.split("/") if s]
+        return self.directory.joinpath(*(quote(s, safe="").replace(".", "%2E") or "_" for s in segments))
+
+    def _path(self, key, resource):
+        return self._resource_dir(resource) / f"{key}.json.gz"
+
+    def _load(self, key, resource):
+        if self.directory is None:
+            return None
+        try:
+            with gzip.open(self._path(key, resource), "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, key, entry):
+        if self.directory is None:
+            return
+        path = self._path(key, entry["resource"])
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(entry, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"No se pudo guardar la respuesta en la caché de disco: {e}")
+
+    def _delete(self, resource):
+        """Borra del disco las respuestas del recurso y de sus subrecursos"""
+        shutil.rmtree(self._resource_dir(resource), ignore_errors=True)
+
+    def _delete_entries(self, resource):
+        """Borra del disco solo las respuestas del recurso (no las de sus subrecursos)"""
+        for path in self._resource_dir(resource).glob("*.json.gz"):
+            path.unlink(missing_ok=True)
+
+    def get(self, key, url):
+        """Entrada de la clave (memoria y luego disco) o None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        entry = self._load(key, _resource(url))
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def put(self, key, url, response):
+        """Guarda la respuesta si se puede cachear (200 y sin Cache-Control: no-store)"""
+        if response.status_code != 200 or "no-store" in response.headers.get("Cache-Control", ""):
+            return None
+        entry = {"resource": _resource(url), "stored_at": self._clock(),
+                 "response": serialize_response(response)}
+        self._remember(key, entry)
+        self._write(key, entry)
+        return entry
+
+    def touch(self, key, entry):
+        """Renueva el TTL de una entrada revalidada"""
+        entry = {**entry, "stored_at": self._clock()}
+        self._remember(key, entry)
+        self._write(key, entry)
+
+    def is_fresh(self, entry):
+        return self._clock() - entry["stored_at"] < self.ttl
+
+    def invalidate(self, url):
+        """
+        Descarta las respuestas del recurso modificado, de sus subrecursos
+        y de la colección que lo contiene (POST /posts/1 invalida /posts/1 y /posts)
+        """
+        resource = _resource(url)
+        parent = resource.rsplit("/", 1)[0]
+        with self._lock:
+            stale = [key for key, entry in self._entries.items()
+                     if entry["resource"] in (resource, parent)
+                     or entry["resource"].startswith(resource + "/")]
+            for key in stale:
+                del self._entries[key]
+        # En disco se borra siempre: puede haber respuestas de otros workers o ejecuciones
+        if self.directory is not None:
+            self._delete(resource)
+            self._delete_entries(parent)
+        if stale:
+            self.stats.add("invalidations")
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    # ---------- Requests ----------
+
+    def fetch(self, url, params, send, fresh=False):
+        """
+        Resuelve un GET desde la caché o el servidor
+        :param url: URL completa de la request
+        :param params: Query params de la request
+        :param send: Callable(headers) que hace la request con los headers condicionales dados
+        :param fresh: Exige confirmar con el servidor (revalida aunque la entrada no haya vencido)
+        :return: Response con el atributo cache_status: hit, revalidated o miss
+        """
+        key, _ = request_key("GET", url, params=params)
+        entry = self.get(key, url)
+
+        if entry is not None and not fresh and self.is_fresh(entry):
+            self.stats.add("hits", saved=_body_size(entry["response"]))
+            return self._build(entry, url, "hit")
+
+        conditional = {}
+        if entry is not None:
+            headers = entry["response"]["headers"]
+            if "ETag" in headers:
+                conditional["If-None-Match"] = headers["ETag"]
+            if "Last-Modified" in headers:
+                conditional["If-Modified-Since"] = headers["Last-Modified"]
+
+        response = send(conditional)
+        if response.status_code == 304 and conditional:
+            response.close()
+            self.touch(key, entry)
+            self.stats.add("revalidated", saved=_body_size(entry["response"]))
+            return self._build(entry, url, "revalidated")
+
+        self.stats.add("misses")
+        self.put(key, url, response)
+        response.cache_status = "miss"
+        return response
+
+    @staticmethod
+    def _build(entry, url, status):
+        response = build_response(entry["response"], "GET", url)
+        response.cache_status = status
+        return response
+
+
+_response_cache = None
+_lock = threading.Lock()
+
+
+def response_cache():
+    """Caché de respuestas compartida por todos los clientes del proceso"""
+    global _response_cache
+    with _lock:
+        if _response_cache is None:
+            directory = config.api_cache_dir() if config.api_cache() == "disk" else None
+            _response_cache = ResponseCache(config.api_cache_size(), config.api_cache_ttl(), directory)
+        return _response_cache
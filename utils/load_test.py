@@ -0,0 +1,297 @@
+"""
+Modo carga para los tests de API
+Ejecuta un test de API existente (por defecto el ciclo de vida de un post) como
+escenario de N usuarios virtuales concurrentes, con rampa de subida y duración
+o cantidad de iteraciones, y genera un resumen JSON con percentiles de latencia,
+histograma, throughput y tasa de errores para comparar entre ejecuciones
+
+Uso:
+    python -m utils.load_test --users 10 --duration 30 --ramp-up 5 --target mock
+    python -m utils.load_test --scenario test_api/test_users_api.py::test_get_single_user \
+        --iterations 20 --baseline reports/load/post_lifecycle.json
+"""
+import argparse
+import contextlib
+import datetime
+import importlib
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+import pytest
+from utils import config
+from utils.api_utils import APIClient
+from utils.payloads import payload_pool
+from utils.retries import CircuitBreakers, Retrier, RetryBudget, RetryPolicy, RetryStats
+from utils.timing import percentile
+
+
+logger = logging.getLogger(__name__)
+
+SCENARIOS = {
+    "post_lifecycle": "test_api/test_post_lifecycle.py::test_post_lifecycle",
+}
+# Límites superiores (ms) de los buckets del histograma de latencias
+HISTOGRAM_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+def latency_summary(values):
+    """p50/p95/p99, media y máximo (en ms) de latencias en segundos"""
+    values = sorted(values)
+    to_ms = lambda seconds: round(seconds * 1000, 2)
+    return {
+        "count": len(values),
+        "p50": to_ms(percentile(values, 50)),
+        "p95": to_ms(percentile(values, 95)),
+        "p99": to_ms(percentile(values, 99)),
+        "mean": to_ms(sum(values) / len(values)) if values else 0.0,
+        "max": to_ms(values[-1]) if values else 0.0,
+    }
+
+
+def histogram(values):
+    """Cantidad de latencias por bucket (clave: límite superior en ms)"""
+    buckets = {f"<={limit}": 0 for limit in HISTOGRAM_BUCKETS_MS}
+    buckets[f">{HISTOGRAM_BUCKETS_MS[-1]}"] = 0
+    for seconds in values:
+        ms = seconds * 1000
+        label = next((f"<={limit}" for limit in HISTOGRAM_BUCKETS_MS if ms <= limit),
+                     f">{HISTOGRAM_BUCKETS_MS[-1]}")
+        buckets[label] += 1
+    return buckets
+
+
+class LoadStats:
+    """Latencias y errores de todos los usuarios virtuales"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = {}
+        self.request_errors = 0
+        self.iterations = []
+        self.failed_iterations = 0
+        self.errors = {}
+        self.skipped_iterations = 0
+        self.skips = {}
+
+    def record_request(self, name, latency, ok):
+        with self._lock:
+            self.requests.setdefault(name, []).append(latency)
+            if not ok:
+                self.request_errors += 1
+
+    def on_response(self, timing, response):
+        """Hook on_response de APIClient: una request terminada (con excepción si response es None)"""
+        self.record_request(timing.endpoint, timing.total, ok=response is not None and response.status_code < 500)
+
+    def record_iteration(self, latency, error=None):
+        with self._lock:
+            self.iterations.append(latency)
+            if error is not None:
+                self.failed_iterations += 1
+                message = f"{type(error).__name__}: {str(error).splitlines()[0] if str(error) else ''}"
+                self.errors[message] = self.errors.get(message, 0) + 1
+
+    def record_skip(self, reason):
+        """Iteración salteada por el test (pytest.skip): no cuenta como error ni en las latencias"""
+        with self._lock:
+            self.skipped_iterations += 1
+            message = str(reason).splitlines()[0] if str(reason) else "skip"
+            self.skips[message] = self.skips.get(message, 0) + 1
+
+    def summary(self, elapsed):
+        all_latencies = [latency for values in self.requests.values() for latency in values]
+        total_requests = len(all_latencies)
+        total_iterations = len(self.iterations)
+        return {
+            "requests": total_requests,
+            "request_errors": self.request_errors,
+            "iterations": total_iterations,
+            "failed_iterations": self.failed_iterations,
+            "skipped_iterations": self.skipped_iterations,
+            "error_rate": round(self.failed_iterations / total_iterations, 4) if total_iterations else 0.0,
+            "request_error_rate": round(self.request_errors / total_requests, 4) if total_requests else 0.0,
+            "throughput_rps": round(total_requests / elapsed, 2) if elapsed else 0.0,
+            "iterations_per_s": round(total_iterations / elapsed, 2) if elapsed else 0.0,
+            "latency_ms": latency_summary(all_latencies),
+            "iteration_ms": latency_summary(self.iterations),
+            "histogram_ms": histogram(all_latencies),
+            "endpoints": {name: latency_summary(values) for name, values in sorted(self.requests.items())},
+            "errors": dict(sorted(self.errors.items(), key=lambda item: -item[1])),
+            "skips": dict(sorted(self.skips.items(), key=lambda item: -item[1])),
+        }
+
+
+def load_scenario(spec):
+    """
+    Resuelve un escenario: alias de SCENARIOS o 'ruta/al/test.py::nombre_del_test'
+    El test debe recibir solo el fixture api_client; la URL base es el BASE_URL del módulo
+    :return: (nombre, base_url, callable(client))
+    """
+    alias = spec if spec in SCENARIOS else None
+    spec = SCENARIOS.get(spec, spec)
+    path, _, name = spec.partition("::")
+    if not name:
+        raise ValueError(f"Escenario inválido: {spec} (se espera ruta.py::test)")
+    module = importlib.import_module(Path(path).with_suffix("").as_posix().replace("/", "."))
+    function = getattr(module, name)
+    parameters = list(inspect.signature(function).parameters)
+    if parameters != ["api_client"]:
+        raise ValueError(f"{spec} recibe {parameters}: el modo carga solo admite tests con (api_client)")
+    if not hasattr(module, "BASE_URL"):
+        raise ValueError(f"{path} no define BASE_URL")
+    return alias or name, module.BASE_URL, lambda client: function(api_client=client)
+
+
+def _virtual_user_client(base_url, stats):
+    """APIClient de un usuario virtual: sin cassettes, caché ni reintentos (se mide la latencia real)"""
+    retry_stats = RetryStats()
+    retrier = Retrier(RetryPolicy(max_retries=0), RetryBudget(0),
+                      CircuitBreakers(float("inf"), 0, retry_stats), retry_stats)
+    client = APIClient(base_url, cassette=False, cache=False, pool_maxsize=1, retrier=retrier,
+                       on_response=stats.on_response)
+    # Las latencias de la carga van a LoadStats, no al resumen de tiempos de la sesión
+    client.timing_stats = None
+    return client
+
+
+def run_load(scenario="post_lifecycle", users=10, duration=None, iterations=None, ramp_up=0.0):
+    """
+    Ejecuta el escenario con usuarios virtuales concurrentes
+    :param scenario: Alias o 'ruta.py::test' (ver load_scenario)
+    :param users: Usuarios virtuales (un hilo y una conexión keep-alive cada uno)
+    :param duration: Segundos totales de la prueba (incluye la rampa)
+    :param iterations: Iteraciones por usuario virtual (si no hay duración, por defecto 10)
+    :param ramp_up: Segundos en los que se van sumando los usuarios
+    :return: Resumen (dict serializable a JSON)
+    """
+    name, base_url, run_iteration = load_scenario(scenario)
+    if duration is None and iterations is None:
+        iterations = 10
+    # Los payloads salen del pool en disco: Faker no corre dentro del tiempo medido
+    payload_pool().warm()
+    stats = LoadStats()
+    start = time.perf_counter()
+    deadline = start + duration if duration is not None else None
+
+    def virtual_user(index):
+        time.sleep(ramp_up * index / users if users > 1 else 0)
+        client = _virtual_user_client(base_url, stats)
+        try:
+            completed = 0
+            while iterations is None or completed < iterations:
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+                iteration_start = time.perf_counter()
+                try:
+                    run_iteration(client)
+                    error = None
+                except pytest.skip.Exception as e:  # BaseException: el test se salteó (ej. 429)
+                    stats.record_skip(e)
+                    completed += 1
+                    continue
+                except Exception as e:  # AssertionError incluido: la iteración falló
+                    error = e
+                stats.record_iteration(time.perf_counter() - iteration_start, error)
+                completed += 1
+        finally:
+            client.close()
+
+    logger.info(f"Carga: {name} contra {config.api_base_url(base_url)} | usuarios: {users} | "
+                f"duración: {duration}s | iteraciones por usuario: {iterations} | rampa: {ramp_up}s")
+    threads = [threading.Thread(target=virtual_user, args=(index,), name=f"vu-{index}", daemon=True)
+               for index in range(users)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "scenario": name,
+        "target": config.api_base_url(base_url),
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "users": users,
+        "ramp_up_s": ramp_up,
+        "duration_s": round(elapsed, 3),
+        "iterations_per_user": iterations,
+        **stats.summary(elapsed),
+    }
+
+
+def compare(baseline, summary):
+    """Diferencias principales contra una ejecución anterior (líneas legibles)"""
+    lines = []
+    metrics = [
+        ("Throughput (req/s)", lambda data: data["throughput_rps"]),
+        ("Latencia p50 (ms)", lambda data: data["latency_ms"]["p50"]),
+        ("Latencia p95 (ms)", lambda data: data["latency_ms"]["p95"]),
+        ("Latencia p99 (ms)", lambda data: data["latency_ms"]["p99"]),
+        ("Tasa de errores", lambda data: data["error_rate"]),
+    ]
+    for label, value in metrics:
+        before, after = value(baseline), value(summary)
+        change = f"{(after - before) / before:+.1%}" if before else "n/a"
+        lines.append(f"{label}: {before} -> {after} ({change})")
+    return lines
+
+
+def _log_summary(summary):
+    latency = summary["latency_ms"]
+    logger.info(f"Requests: {summary['requests']} | Iteraciones: {summary['iterations']} | "
+                f"Throughput: {summary['throughput_rps']} req/s | Errores: {summary['error_rate']:.1%}")
+    logger.info(f"Latencia p50/p95/p99/max: {latency['p50']}/{latency['p95']}/{latency['p99']}/"
+                f"{latency['max']} ms")
+    for name, endpoint in summary["endpoints"].items():
+        logger.info(f"  {name}: p50 {endpoint['p50']} ms | p95 {endpoint['p95']} ms | n={endpoint['count']}")
+    for message, count in summary["errors"].items():
+        logger.warning(f"  {count}x {message}")
+    if summary["skipped_iterations"]:
+        logger.warning(f"Iteraciones salteadas: {summary['skipped_iterations']}")
+        for message, count in summary["skips"].items():
+            logger.warning(f"  {count}x {message}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Modo carga para los tests de API")
+    parser.add_argument("--scenario", default="post_lifecycle",
+                        help="Alias (post_lifecycle) o ruta.py::test que recibe api_client")
+    parser.add_argument("--users", type=int, default=10, help="Usuarios virtuales concurrentes")
+    parser.add_argument("--duration", type=float, help="Duración total en segundos (incluye la rampa)")
+    parser.add_argument("--iterations", type=int, help="Iteraciones por usuario virtual")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="Segundos para sumar todos los usuarios")
+    parser.add_argument("--target", choices=["mock", "live"],
+                        help="mock: mock local en proceso; live: host real (por defecto API_TARGET)")
+    parser.add_argument("--output", help="Archivo JSON del resumen (por defecto reports/load/<escenario>.json)")
+    parser.add_argument("--baseline", help="Resumen JSON contra el que comparar (por defecto, el --output anterior)")
+    parser.add_argument("--verbose", action="store_true", help="Muestra lo que imprimen los tests en cada iteración")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    if args.target:
+        os.environ["API_TARGET"] = args.target
+
+    # Los tests imprimen su progreso: desde la línea de comandos se descarta para no
+    # mezclarlo con el resumen (el log va a stderr)
+    with open(os.devnull, "w") as devnull, \
+            contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(devnull):
+        summary = run_load(args.scenario, users=args.users, duration=args.duration,
+                           iterations=args.iterations, ramp_up=args.ramp_up)
+    _log_summary(summary)
+
+    output = Path(args.output or Path("reports") / "load" / f"{summary['scenario']}.json")
+    baseline = Path(args.baseline) if args.baseline else output
+    if baseline.exists():
+        for line in compare(json.loads(baseline.read_text(encoding="utf-8")), summary):
+            logger.info(f"Comparación con {baseline}: {line}")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding="utf-8")
+    logger.info(f"Resumen de carga: {output}")
+    return 0 if summary["error_rate"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
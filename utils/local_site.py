@@ -0,0 +1,95 @@
+"""
+Réplica local de SauceDemo servida por un HTTP server en proceso
+Se activa con BASE_URL=local (ver config.base_url): los tests UI y los steps
+de behave navegan contra 127.0.0.1 en lugar de www.saucedemo.com
+"""
+import atexit
+import logging
+import os
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+SITE_DIR = Path(__file__).resolve().parent.parent / "local_site" / "saucedemo"
+
+
+class _SiteHandler(SimpleHTTPRequestHandler):
+    """Sirve los archivos estáticos del sitio sin ensuciar la salida de pytest"""
+
+    def end_headers(self):
+        # Los assets no cambian durante la ejecución: el navegador los reutiliza entre tests
+        if self.path.endswith((".js", ".css")):
+            self.send_header("Cache-Control", "max-age=3600")
+        else:
+            self.send_header("Cache-Control", "no-cache")
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+class LocalSite:
+    """HTTP server multihilo que sirve un directorio en segundo plano"""
+
+    def __init__(self, directory=SITE_DIR, host="127.0.0.1", port=0):
+        """
+        Inicializa el servidor
+        :param directory: Directorio con los archivos del sitio
+        :param host: Interfaz de escucha
+        :param port: Puerto (0 = puerto libre asignado por el sistema)
+        """
+        self.directory = Path(directory)
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        """URL base del sitio (con barra final)"""
+        return f"http://{self.host}:{self.port}/"
+
+    @property
+    def running(self):
+        return self._server is not None
+
+    def start(self):
+        """Levanta el servidor en un hilo daemon"""
+        if self.running:
+            return self
+        handler = partial(_SiteHandler, directory=str(self.directory))
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name="local-site", daemon=True)
+        self._thread.start()
+        logger.info(f"Réplica local de SauceDemo escuchando en {self.url}")
+        return self
+
+    def stop(self):
+        """Detiene el servidor"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None
+
+
+_local_saucedemo = None
+_lock = threading.Lock()
+
+
+def local_saucedemo():
+    """Réplica local de SauceDemo (una por proceso, se levanta la primera vez que se pide)"""
+    global _local_saucedemo
+    with _lock:
+        if _local_saucedemo is None:
+            port = int(os.environ.get("LOCAL_SITE_PORT", "0"))
+            _local_saucedemo = LocalSite(port=port).start()
+            atexit.register(_local_saucedemo.stop)
+        return _local_saucedemo
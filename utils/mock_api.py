@@ -0,0 +1,409 @@
+"""
+Mock en proceso de JSONPlaceholder (/posts) y ReqRes (/api/users, /api/login, /api/register)
+Se activa con API_TARGET=mock (ver config.api_base_url): APIClient redirige
+las URLs de las APIs públicas a este servidor local
+"""
+import atexit
+import functools
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+logger = logging.getLogger(__name__)
+
+# Usuarios de ReqRes (mismos datos que el servicio real)
+REQRES_USERS = [
+    (1, "George", "Bluth"), (2, "Janet", "Weaver"), (3, "Emma", "Wong"),
+    (4, "Eve", "Holt"), (5, "Charles", "Morris"), (6, "Tracey", "Ramos"),
+    (7, "Michael", "Lawson"), (8, "Lindsay", "Ferguson"), (9, "Tobias", "Funke"),
+    (10, "Byron", "Fields"), (11, "George", "Edwards"), (12, "Rachel", "Howell"),
+]
+REQRES_PER_PAGE = 6
+REQRES_TOKEN = "QpwL5tke4Pnpja7X4"
+REQRES_SUPPORT = {
+    "url": "https://contentcaddy.io?utm_source=reqres&utm_medium=json&utm_campaign=referral",
+    "text": "Tired of writing endless social media content? Let Content Caddy generate it for you.",
+}
+
+JSONPLACEHOLDER_POSTS = 100
+JSONPLACEHOLDER_PHOTOS = 5000
+JSONPLACEHOLDER_PHOTOS_PER_ALBUM = 50
+
+
+def _reqres_user(user_id, first_name, last_name):
+    return {
+        "id": user_id,
+        "email": f"{first_name.lower()}.{last_name.lower()}@reqres.in",
+        "first_name": first_name,
+        "last_name": last_name,
+        "avatar": f"https://reqres.in/img/faces/{user_id}-image.jpg",
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _photos():
+    """Fotos de JSONPlaceholder (solo lectura: se generan una vez por proceso)"""
+    photos = []
+    for photo_id in range(1, JSONPLACEHOLDER_PHOTOS + 1):
+        color = f"{photo_id * 2654435761 % 0xFFFFFF:06x}"
+        photos.append({
+            "albumId": (photo_id - 1) // JSONPLACEHOLDER_PHOTOS_PER_ALBUM + 1,
+            "id": photo_id,
+            "title": f"photo {photo_id} title",
+            "url": f"https://via.placeholder.com/600/{color}",
+            "thumbnailUrl": f"https://via.placeholder.com/150/{color}",
+        })
+    return photos
+
+
+def _timestamp():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+class MockState:
+    """Datos y fallas inyectadas del mock (compartidos por todos los hilos del servidor)"""
+
+    def __init__(self, latency=0.0, error_rate=0.0, error_status=503, seed=None):
+        """
+        :param latency: Demora en segundos agregada a cada respuesta
+        :param error_rate: Probabilidad (0-1) de responder error_status en lugar del resultado
+        :param error_status: Código devuelto por las fallas aleatorias
+        :param seed: Semilla para que las fallas aleatorias sean reproducibles
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._faults = []
+        self.requests = 0
+        self.reset()
+
+    def reset(self):
+        """Vuelve los datos al estado inicial y descarta las fallas pendientes"""
+        with self._lock:
+            self.posts = {
+                post_id: {
+                    "userId": (post_id - 1) // 10 + 1,
+                    "id": post_id,
+                    "title": f"post {post_id} title",
+                    "body": f"post {post_id} body",
+                }
+                for post_id in range(1, JSONPLACEHOLDER_POSTS + 1)
+            }
+            self.next_post_id = JSONPLACEHOLDER_POSTS + 1
+            self.users = {user[0]: _reqres_user(*user) for user in REQRES_USERS}
+            self._faults = []
+
+    def fail_next(self, status, count=1, path=None, headers=None, body=None):
+        """
+        Hace fallar las próximas requests (útil para probar reintentos)
+        :param status: Código de estado a devolver
+        :param count: Cantidad de requests que fallan
+        :param path: Prefijo de path al que se aplica (None = cualquiera)
+        :param headers: Headers extra de la respuesta (ej: {"Retry-After": "1"})
+        :param body: Cuerpo JSON de la respuesta de error
+        """
+        with self._lock:
+            self._faults.append({"status": status, "count": count, "path": path,
+                                 "headers": headers or {}, "body": body or {}})
+
+    def take_fault(self, path):
+        """Devuelve la falla a aplicar a la request (None si no corresponde ninguna)"""
+        with self._lock:
+            self.requests += 1
+            for fault in self._faults:
+                if fault["path"] is None or path.startswith(fault["path"]):
+                    fault["count"] -= 1
+                    if fault["count"] <= 0:
+                        self._faults.remove(fault)
+                    return fault
+            if self.error_rate and self._random.random() < self.error_rate:
+                return {"status": self.error_status, "headers": {}, "body": {}}
+        return None
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    """Rutea las requests a los handlers de JSONPlaceholder y ReqRes"""
+
+    # Keep-alive: el cliente reutiliza la conexión entre requests
+    protocol_version = "HTTP/1.1"
+    # Headers y body salen en un solo write y sin Nagle (evita la demora de ~40ms del ACK diferido)
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+
+    ROUTES = [
+        ("GET", re.compile(r"^/posts/?$"), "list_posts"),
+        ("POST", re.compile(r"^/posts/?$"), "create_post"),
+        ("GET", re.compile(r"^/posts/(\d+)$"), "get_post"),
+        ("PUT", re.compile(r"^/posts/(\d+)$"), "update_post"),
+        ("PATCH", re.compile(r"^/posts/(\d+)$"), "update_post"),
+        ("DELETE", re.compile(r"^/posts/(\d+)$"), "delete_post"),
+        ("GET", re.compile(r"^/photos/?$"), "list_photos"),
+        ("GET", re.compile(r"^/photos/(\d+)$"), "get_photo"),
+        ("GET", re.compile(r"^/api/users/?$"), "list_users"),
+        ("POST", re.compile(r"^/api/users/?$"), "create_user"),
+        ("GET", re.compile(r"^/api/users/(\d+)$"), "get_user"),
+        ("PUT", re.compile(r"^/api/users/(\d+)$"), "update_user"),
+        ("PATCH", re.compile(r"^/api/users/(\d+)$"), "update_user"),
+        ("DELETE", re.compile(r"^/api/users/(\d+)$"), "delete_user"),
+        ("POST", re.compile(r"^/api/login/?$"), "login"),
+        ("POST", re.compile(r"^/api/register/?$"), "register"),
+    ]
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    # ---------- Infraestructura ----------
+
+    def _dispatch(self, method):
+        parts = urlsplit(self.path)
+        self.query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        raw_body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+        # Latencia: global del mock o ?delay=N como en ReqRes
+        delay = self.state.latency + float(self.query.get("delay", 0) or 0)
+        if delay:
+            time.sleep(delay)
+
+        fault = self.state.take_fault(parts.path)
+        if fault is not None:
+            return self._send(fault["status"], fault["body"], fault["headers"])
+
+        try:
+            self.body = json.loads(raw_body) if raw_body else {}
+        except ValueError:
+            return self._send(400, {"error": "Invalid JSON body"})
+
+        for route_method, pattern, handler in self.ROUTES:
+            match = pattern.match(parts.path)
+            if match and route_method == method:
+                return getattr(self, handler)(*(int(group) for group in match.groups()))
+        return self._send(404, {})
+
+    def _send(self, status, payload=None, headers=None):
+        body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        headers = dict(headers or {})
+        if self.command == "GET" and status == 200:
+            # ETag como las APIs reales: permite revalidar con If-None-Match (304 sin body)
+            headers["ETag"] = f'W/"{hashlib.sha1(body).hexdigest()[:16]}"'
+            if self.headers.get("If-None-Match") == headers["ETag"]:
+                status, body, payload = 304, b"", None
+        self.send_response(status)
+        if payload is not None:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, str(value))
+        self.end_headers()
+        self.wfile.write(body)
+
+    # ---------- JSONPlaceholder ----------
+
+    def list_posts(self):
+        posts = list(self.state.posts.values())
+        if "userId" in self.query:
+            posts = [post for post in posts if str(post["userId"]) == self.query["userId"]]
+        self._send(200, posts)
+
+    def create_post(self):
+        with self.state._lock:
+            post = {**self.body, "id": self.state.next_post_id}
+            self.state.posts[post["id"]] = post
+            self.state.next_post_id += 1
+        self._send(201, post)
+
+    def get_post(self, post_id):
+        post = self.state.posts.get(post_id)
+        self._send(200 if post else 404, post or {})
+
+    def update_post(self, post_id):
+        with self.state._lock:
+            post = self.state.posts.get(post_id)
+            if post is None:
+                return self._send(404, {})
+            if self.command == "PUT":
+                post = {**self.body, "id": post_id}
+            else:
+                post = {**post, **self.body}
+            self.state.posts[post_id] = post
+        self._send(200, post)
+
+    def delete_post(self, post_id):
+        # JSONPlaceholder responde 200 {} aunque el post no exista
+        with self.state._lock:
+            self.state.posts.pop(post_id, None)
+        self._send(200, {})
+
+    def list_photos(self):
+        photos = _photos()
+        if "albumId" in self.query:
+            photos = [photo for photo in photos if str(photo["albumId"]) == self.query["albumId"]]
+        self._send(200, photos)
+
+    def get_photo(self, photo_id):
+        photos = _photos()
+        if not 1 <= photo_id <= len(photos):
+            return self._send(404, {})
+        self._send(200, photos[photo_id - 1])
+
+    # ---------- ReqRes ----------
+
+    def list_users(self):
+        try:
+            page = max(1, int(self.query.get("page", 1)))
+            per_page = max(1, int(self.query.get("per_page", REQRES_PER_PAGE)))
+        except ValueError:
+            page, per_page = 1, REQRES_PER_PAGE
+        users = sorted(self.state.users.values(), key=lambda user: user["id"])
+        start = (page - 1) * per_page
+        self._send(200, {
+            "page": page,
+            "per_page": per_page,
+            "total": len(users),
+            "total_pages": -(-len(users) // per_page),
+            "data": users[start:start + per_page],
+            "support": REQRES_SUPPORT,
+        })
+
+    def get_user(self, user_id):
+        user = self.state.users.get(user_id)
+        if user is None:
+            return self._send(404, {})
+        self._send(200, {"data": user, "support": REQRES_SUPPORT})
+
+    def create_user(self):
+        self._send(201, {**self.body, "id": str(random.randint(100, 999)), "createdAt": _timestamp()})
+
+    def update_user(self, user_id):
+        self._send(200, {**self.body, "updatedAt": _timestamp()})
+
+    def delete_user(self, user_id):
+        self._send(204)
+
+    def _find_user(self, email):
+        return next((user for user in self.state.users.values() if user["email"] == email), None)
+
+    def login(self):
+        email = self.body.get("email") or self.body.get("username")
+        if not email:
+            return self._send(400, {"error": "Missing email or username"})
+        if not self.body.get("password"):
+            return self._send(400, {"error": "Missing password"})
+        if self._find_user(email) is None:
+            return self._send(400, {"error": "user not found"})
+        self._send(200, {"token": REQRES_TOKEN})
+
+    def register(self):
+        email = self.body.get("email") or self.body.get("username")
+        if not email:
+            return self._send(400, {"error": "Missing email or username"})
+        if not self.body.get("password"):
+            return self._send(400, {"error": "Missing password"})
+        user = self._find_user(email)
+        if user is None:
+            return self._send(400, {"error": "Note: Only defined users succeed registration"})
+        self._send(200, {"id": user["id"], "token": REQRES_TOKEN})
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Un cliente que corta la conexión por timeout no es un error del mock
+        logger.debug(f"Conexión cerrada por el cliente {client_address}")
+
+
+class MockAPIServer:
+    """HTTP server multihilo con el mock de JSONPlaceholder y ReqRes"""
+
+    def __init__(self, host="127.0.0.1", port=0, **state_options):
+        """
+        :param host: Interfaz de escucha
+        :param port: Puerto (0 = puerto libre asignado por el sistema)
+        :param state_options: Latencia y fallas inyectadas (ver MockState)
+        """
+        self.host = host
+        self.port = port
+        self.state = MockState(**state_options)
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        """URL base del mock (sin barra final, como las BASE_URL de los tests)"""
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        """Levanta el servidor en un hilo daemon"""
+        if self._server is not None:
+            return self
+        self._server = _MockHTTPServer((self.host, self.port), _MockHandler)
+        self._server.state = self.state
+        self.port = self._server.server_address[1]
+        # poll_interval corto: stop() no demora a los tests que levantan su propio mock
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,),
+                                        name="mock-api", daemon=True)
+        self._thread.start()
+        logger.info(f"Mock de APIs escuchando en {self.url}")
+        return self
+
+    def stop(self):
+        """Detiene el servidor"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None
+
+
+_mock_api = None
+_lock = threading.Lock()
+
+
+def mock_api():
+    """
+    Mock de APIs del proceso (se levanta la primera vez que se pide)
+    MOCK_LATENCY_MS, MOCK_ERROR_RATE, MOCK_ERROR_STATUS y MOCK_SEED configuran
+    la latencia y las fallas aleatorias
+    """
+    global _mock_api
+    with _lock:
+        if _mock_api is None:
+            _mock_api = MockAPIServer(
+                port=int(os.environ.get("MOCK_API_PORT", "0")),
+                latency=float(os.environ.get("MOCK_LATENCY_MS", "0")) / 1000,
+                error_rate=float(os.environ.get("MOCK_ERROR_RATE", "0")),
+                error_status=int(os.environ.get("MOCK_ERROR_STATUS", "503")),
+                seed=os.environ.get("MOCK_SEED"),
+            ).start()
+            atexit.register(_mock_api.stop)
+        return _mock_api
@@ -0,0 +1,165 @@
+"""
+Pool de payloads generados con Faker por adelantado
+Los lotes (posts, usuarios, credenciales) se generan una sola vez con una semilla
+fija, se guardan comprimidos en disco y las siguientes ejecuciones (y los workers
+en paralelo) los leen sin importar Faker ni cargar el locale. Los tests toman
+payloads del pool en lugar de llamar a Faker en cada request
+"""
+import gzip
+import json
+import logging
+import os
+import threading
+import zlib
+from importlib import metadata
+from utils import config
+
+
+logger = logging.getLogger(__name__)
+
+POOL_VERSION = 1
+
+
+def _post(fake):
+    return {"title": fake.sentence(nb_words=6), "body": fake.paragraph(nb_sentences=3),
+            "userId": fake.random_int(min=1, max=10)}
+
+
+def _user(fake):
+    return {"name": fake.name(), "job": fake.job()}
+
+
+def _credential(fake):
+    return {"email": fake.email(), "password": fake.password(length=12)}
+
+
+# Generadores por tipo de payload (reciben la instancia de Faker ya sembrada)
+GENERATORS = {
+    "post": _post,
+    "user": _user,
+    "credential": _credential,
+}
+
+
+def _faker_version():
+    try:
+        return metadata.version("Faker")
+    except metadata.PackageNotFoundError:
+        return "none"
+
+
+class PayloadPool:
+    """
+    Lotes de payloads reproducibles por tipo, generados la primera vez que se piden
+    Misma semilla, locale, tamaño y versión de Faker: mismos payloads en cualquier máquina
+    """
+
+    def __init__(self, seed=None, size=None, locale=None, directory=None):
+        self.seed = config.payload_seed() if seed is None else seed
+        self.size = size or config.payload_pool_size()
+        self.locale = locale or config.payload_locale()
+        self.directory = directory if directory is not None else config.payload_dir()
+        self.generated = 0
+        self._batches = {}
+        self._cursors = {}
+        self._faker = None
+        self._lock = threading.Lock()
+
+    def _path(self, kind):
+        name = f"{kind}-{self.locale}-{self.seed}-{self.size}-faker{_faker_version()}-v{POOL_VERSION}.json.gz"
+        return os.path.join(self.directory, name)
+
+    def _fake(self):
+        """Faker se importa y se carga el locale recién cuando hay que generar un lote"""
+        if self._faker is None:
+            from faker import Faker
+            self._faker = Faker(self.locale)
+        return self._faker
+
+    def _generate(self, kind):
+        fake = self._fake()
+        # Semilla por tipo: agregar un tipo nuevo no cambia los lotes existentes
+        fake.seed_instance(zlib.crc32(f"{self.seed}:{kind}".encode("utf-8")))
+        batch = [GENERATORS[kind](fake) for _ in range(self.size)]
+        self.generated += 1
+        logger.info(f"Pool de payloads: {self.size} '{kind}' generados (semilla {self.seed}, {self.locale})")
+        return batch
+
+    def _load(self, path):
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save(self, path, batch):
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(batch, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"No se pudo guardar el pool de payloads: {e}")
+
+    def batch(self, kind):
+        """
+        Lote completo de un tipo: memoria, disco o generación con Faker (en ese orden)
+        Los payloads son compartidos: copiarlos antes de modificarlos
+        """
+        if kind not in GENERATORS:
+            raise KeyError(f"Tipo de payload desconocido: {kind} (tipos: {', '.join(GENERATORS)})")
+        batch = self._batches.get(kind)
+        if batch is not None:
+            return batch
+        with self._lock:
+            batch = self._batches.get(kind)
+            if batch is None:
+                path = self._path(kind) if self.directory else None
+                batch = self._load(path) if path else None
+                if batch is None:
+                    batch = self._generate(kind)
+                    if path:
+                        self._save(path, batch)
+                self._batches[kind] = batch
+        return batch
+
+    def warm(self, kinds=None):
+        """Carga (o genera) los lotes antes de usarlos, por ejemplo antes de una prueba de carga"""
+        for kind in kinds or GENERATORS:
+            self.batch(kind)
+        return self
+
+    def draw(self, kind):
+        """Siguiente payload del tipo (recorre el lote en forma circular, seguro entre hilos)"""
+        batch = self.batch(kind)
+        with self._lock:
+            position = self._cursors.get(kind, 0)
+            self._cursors[kind] = position + 1
+        return dict(batch[position % len(batch)])
+
+    def take(self, kind, count):
+        """Varios payloads del tipo"""
+        return [self.draw(kind) for _ in range(count)]
+
+    def reset(self, key=None):
+        """
+        Reinicia los cursores: sin clave al principio del lote, con clave en una posición
+        que depende solo de ella (cada test toma siempre los mismos payloads)
+        """
+        start = zlib.crc32(key.encode("utf-8")) if key is not None else 0
+        with self._lock:
+            self._cursors = {kind: start for kind in GENERATORS}
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def payload_pool():
+    """Pool de payloads compartido por el proceso (se crea al primer uso, sin importar Faker)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = PayloadPool()
+        return _pool
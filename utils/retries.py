@@ -0,0 +1,258 @@
+"""
+Reintentos de APIClient: Retry-After, presupuesto por ejecución y circuit breaker por host
+Solo se reintentan por defecto los métodos idempotentes y los códigos transitorios;
+401/403 no se reintentan (no se van a resolver solos) pero cuentan para el circuit breaker
+"""
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+from utils import config
+
+
+logger = logging.getLogger(__name__)
+
+# Códigos que pueden resolverse reintentando
+RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+# Códigos con los que un host indica que nos está bloqueando o limitando
+THROTTLE_STATUSES = frozenset({401, 403, 429, 503})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class CircuitOpenError(RuntimeError):
+    """El host está limitando las requests: se corta sin ir a la red"""
+
+    def __init__(self, host, retry_in):
+        super().__init__(f"Circuit breaker abierto para {host}: el host está limitando las requests "
+                         f"(se vuelve a probar en {retry_in:.0f}s)")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class RetryStats:
+    """Contadores de reintentos de la ejecución (por proceso/worker)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.retry_time = 0.0
+        self.budget_exhausted = 0
+        self.circuit_opens = 0
+        self.short_circuited = 0
+        self.retries_by_host = {}
+
+    def add_retry(self, host, delay):
+        with self._lock:
+            self.retries += 1
+            self.retry_time += delay
+            self.retries_by_host[host] = self.retries_by_host.get(host, 0) + 1
+
+    def add(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    @property
+    def active(self):
+        return bool(self.retries or self.budget_exhausted or self.circuit_opens or self.short_circuited)
+
+    def resumen(self):
+        hosts = ", ".join(f"{host}: {count}" for host, count in sorted(self.retries_by_host.items()))
+        return (f"Reintentos: {self.retries} | Tiempo reintentando: {self.retry_time:.2f}s | "
+                f"Presupuesto agotado: {self.budget_exhausted} | "
+                f"Circuitos abiertos: {self.circuit_opens} | Requests cortadas: {self.short_circuited}"
+                + (f" | Por host: {hosts}" if hosts else ""))
+
+
+RETRY_STATS = RetryStats()
+
+
+class RetryBudget:
+    """Máximo de reintentos de toda la ejecución (evita que un host caído consuma minutos)"""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def take(self):
+        """Consume un reintento del presupuesto (False si ya no quedan)"""
+        with self._lock:
+            if self.used >= self.limit:
+                return False
+            self.used += 1
+            return True
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker de un host
+    Tras `threshold` respuestas de bloqueo seguidas se abre durante `cooldown`
+    segundos; después deja pasar una request de prueba (half-open)
+    """
+
+    def __init__(self, host, threshold, cooldown, stats=RETRY_STATS, clock=time.monotonic):
+        self.host = host
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._stats = stats
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.failures = 0
+        self.opened_at = None
+
+    @property
+    def is_open(self):
+        return self.opened_at is not None and self._clock() - self.opened_at < self.cooldown
+
+    def before_request(self):
+        """Lanza CircuitOpenError si el circuito está abierto"""
+        with self._lock:
+            if self.is_open:
+                self._stats.add("short_circuited")
+                raise CircuitOpenError(self.host, self.cooldown - (self._clock() - self.opened_at))
+
+    def record(self, status):
+        """Registra el resultado de una request al host"""
+        with self._lock:
+            if status not in THROTTLE_STATUSES:
+                self.failures = 0
+                self.opened_at = None
+                return
+            self.failures += 1
+            if self.failures >= self.threshold and not self.is_open:
+                self.opened_at = self._clock()
+                self._stats.add("circuit_opens")
+                logger.warning(f"Circuit breaker abierto para {self.host} "
+                               f"tras {self.failures} respuestas de bloqueo seguidas")
+
+
+class CircuitBreakers:
+    """Circuit breakers por host"""
+
+    def __init__(self, threshold, cooldown, stats=RETRY_STATS):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._stats = stats
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, host):
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(host, self.threshold, self.cooldown, self._stats)
+            return self._breakers[host]
+
+
+class RetryPolicy:
+    """Qué se reintenta y cuánto se espera entre intentos"""
+
+    def __init__(self, max_retries=3, backoff_factor=0.5, max_backoff=5.0, max_retry_after=10.0,
+                 statuses=RETRY_STATUSES, methods=IDEMPOTENT_METHODS):
+        """
+        :param max_retries: Reintentos máximos por request
+        :param backoff_factor: Espera base del backoff exponencial (segundos)
+        :param max_backoff: Tope de la espera calculada por backoff
+        :param max_retry_after: Si el Retry-After pide esperar más que esto, no se reintenta
+        :param statuses: Códigos que se reintentan
+        :param methods: Métodos que se reintentan (por defecto solo idempotentes)
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+
+    def should_retry(self, method, status):
+        return method.upper() in self.methods and status in self.statuses
+
+    @staticmethod
+    def retry_after(response):
+        """Segundos pedidos por el header Retry-After (None si no viene o no se entiende)"""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+    def delay(self, attempt, response):
+        """Espera antes del reintento número attempt (0 = primer reintento)"""
+        retry_after = self.retry_after(response)
+        if retry_after is not None:
+            return retry_after
+        return min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+
+
+class Retrier:
+    """Ejecuta una request aplicando política, presupuesto y circuit breaker"""
+
+    def __init__(self, policy=None, budget=None, breakers=None, stats=RETRY_STATS, sleep=time.sleep):
+        self.policy = policy or RetryPolicy(max_retries=config.api_max_retries())
+        self.budget = budget or RetryBudget(config.api_retry_budget())
+        self.breakers = breakers or CircuitBreakers(config.api_circuit_threshold(),
+                                                    config.api_circuit_cooldown(), stats)
+        self.stats = stats
+        self._sleep = sleep
+
+    def call(self, method, url, send, retry=None):
+        """
+        Ejecuta send() con reintentos
+        :param method: Método HTTP
+        :param url: URL de la request (define el host del circuit breaker)
+        :param send: Callable sin argumentos que hace la request
+        :param retry: True/False fuerza reintentar o no (por defecto según el método)
+        :return: Response (la última, si se agotaron los reintentos)
+        """
+        host = urlsplit(url).netloc
+        breaker = self.breakers.get(host)
+        breaker.before_request()
+
+        attempt = 0
+        while True:
+            response = send()
+            breaker.record(response.status_code)
+
+            if retry is None:
+                retryable = self.policy.should_retry(method, response.status_code)
+            else:
+                retryable = retry and response.status_code in self.policy.statuses
+            if not retryable or attempt >= self.policy.max_retries or breaker.is_open:
+                return response
+
+            delay = self.policy.delay(attempt, response)
+            if delay > self.policy.max_retry_after:
+                logger.warning(f"{host} pide esperar {delay:.0f}s (Retry-After), no se reintenta")
+                return response
+            if not self.budget.take():
+                self.stats.add("budget_exhausted")
+                logger.warning("Presupuesto de reintentos de la ejecución agotado")
+                return response
+
+            logger.info(f"{method} {url} respondió {response.status_code}, "
+                        f"reintento {attempt + 1}/{self.policy.max_retries} en {delay:.2f}s")
+            start = time.monotonic()
+            response.close()
+            self._sleep(delay)
+            self.stats.add_retry(host, time.monotonic() - start)
+            attempt += 1
+
+
+_default_retrier = None
+_lock = threading.Lock()
+
+
+def default_retrier():
+    """Retrier compartido por todos los clientes de la ejecución (presupuesto y circuitos globales)"""
+    global _default_retrier
+    with _lock:
+        if _default_retrier is None:
+            _default_retrier = Retrier()
+        return _default_retrier
@@ -0,0 +1,289 @@
+"""
+Esquemas JSON declarativos compilados a validadores
+Subconjunto de JSON Schema: type, required, properties, items, minItems,
+minLength, minimum, maximum, pattern y enum. Cada esquema se compila una sola vez a una
+función Python generada que recorre el payload en una pasada y junta todas las
+violaciones (no se corta en la primera, como con una cadena de asserts)
+"""
+import json
+import re
+import threading
+
+
+TYPES = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "object": (dict,),
+    "array": (list,),
+    "null": (type(None),),
+}
+KEYWORDS = frozenset({"type", "required", "properties", "items", "minItems", "minLength",
+                      "minimum", "maximum", "pattern", "enum"})
+# Violaciones que se muestran en el mensaje del assert (el resto se resume)
+MAX_REPORTED = 20
+
+
+class SchemaError(ValueError):
+    """El esquema está mal definido"""
+
+
+class SchemaViolation(AssertionError):
+    """El payload no cumple el esquema (incluye todas las violaciones encontradas)"""
+
+    def __init__(self, name, violations):
+        shown = "\n".join(f"  - {violation}" for violation in violations[:MAX_REPORTED])
+        extra = len(violations) - MAX_REPORTED
+        super().__init__(f"El payload no cumple el esquema '{name}' ({len(violations)} violaciones):\n"
+                         f"{shown}" + (f"\n  ... y {extra} más" if extra > 0 else ""))
+        self.name = name
+        self.violations = violations
+
+
+class _Compiler:
+    """
+    Genera el código Python de un validador: los chequeos quedan en línea
+    (sin una llamada por nodo) y las rutas de las violaciones solo se arman
+    cuando hay una violación
+    """
+
+    def __init__(self):
+        self.lines = []
+        self.constants = {}
+        self._names = 0
+
+    def name(self, prefix):
+        self._names += 1
+        return f"{prefix}{self._names}"
+
+    def constant(self, value):
+        name = self.name("c")
+        self.constants[name] = value
+        return name
+
+    def emit(self, indent, line):
+        self.lines.append("    " * indent + line)
+
+    def fail(self, indent, path, message):
+        """Agrega la violación: path es una lista de partes (texto literal o ("var", nombre))"""
+        parts = [repr(part) if isinstance(part, str) else f"str({part[1]})" for part in path]
+        self.emit(indent, f"errors.append({' + '.join(parts)} + ': ' + {message})")
+
+    def node(self, schema, var, path, indent):
+        unknown = set(schema) - KEYWORDS
+        if unknown:
+            raise SchemaError(f"Palabras clave no soportadas: {sorted(unknown)}")
+
+        type_names = schema.get("type")
+        if isinstance(type_names, str):
+            type_names = [type_names]
+        if type_names:
+            try:
+                classes = tuple(dict.fromkeys(cls for name in type_names for cls in TYPES[name]))
+            except KeyError as e:
+                raise SchemaError(f"Tipo desconocido: {e.args[0]}") from None
+            # Los valores de json.loads son de las clases exactas (True no pasa por integer)
+            if len(classes) == 1:
+                condition = f"{var}.__class__ is not {self.constant(classes[0])}"
+            else:
+                condition = f"{var}.__class__ not in {self.constant(classes)}"
+            self.emit(indent, f"if {condition}:")
+            self.fail(indent + 1, path, f"'se esperaba {'/'.join(type_names)}, llegó ' + type({var}).__name__")
+            self.emit(indent, "else:")
+            indent += 1
+        start = len(self.lines)
+
+        if "enum" in schema:
+            enum = self.constant(tuple(schema["enum"]))
+            self.emit(indent, f"if {var} not in {enum}:")
+            self.fail(indent + 1, path, f"repr({var}) + ' no es uno de ' + repr(list({enum}))")
+
+        only = set(type_names or ())
+        if "required" in schema or "properties" in schema:
+            self._object(schema, var, path, indent, guarded=only == {"object"})
+        if "items" in schema or "minItems" in schema:
+            self._array(schema, var, path, indent, guarded=only == {"array"})
+        if "minLength" in schema or "pattern" in schema:
+            self._string(schema, var, path, indent, guarded=only == {"string"})
+        if "minimum" in schema:
+            numeric = only and only <= {"integer", "number"}
+            guard = "" if numeric else f"{var}.__class__ in (int, float) and "
+            self.emit(indent, f"if {guard}{var} < {schema['minimum']!r}:")
+            self.fail(indent + 1, path, f"repr({var}) + ' es menor que {schema['minimum']!r}'")
+        if "maximum" in schema:
+            numeric = only and only <= {"integer", "number"}
+            guard = "" if numeric else f"{var}.__class__ in (int, float) and "
+            self.emit(indent, f"if {guard}{var} > {schema['maximum']!r}:")
+            self.fail(indent + 1, path, f"repr({var}) + ' es mayor que {schema['maximum']!r}'")
+
+        if type_names and len(self.lines) == start:
+            # Solo se chequea el tipo: sin rama else vacía
+            self.lines.pop()
+
+    def _block(self, condition, indent, guarded):
+        if guarded:
+            return indent
+        self.emit(indent, f"if {condition}:")
+        return indent + 1
+
+    def _discard_if_empty(self, start, header_lines=1):
+        """Quita las líneas de encabezado (if/for) emitidas desde start si quedaron sin cuerpo"""
+        if len(self.lines) == start + header_lines:
+            del self.lines[start:]
+
+    def _object(self, schema, var, path, indent, guarded):
+        start = len(self.lines)
+        indent = self._block(f"{var}.__class__ is dict", indent, guarded)
+        for key in schema.get("required", ()):
+            self.emit(indent, f"if {key!r} not in {var}:")
+            self.fail(indent + 1, path + [f".{key}"], "'clave requerida ausente'")
+        for key, sub in schema.get("properties", {}).items():
+            child = self.name("v")
+            property_start = len(self.lines)
+            self.emit(indent, f"{child} = {var}.get({key!r}, MISSING)")
+            self.emit(indent, f"if {child} is not MISSING:")
+            self.node(sub, child, path + [f".{key}"], indent + 1)
+            self._discard_if_empty(property_start, header_lines=2)
+        if not guarded:
+            self._discard_if_empty(start)
+
+    def _array(self, schema, var, path, indent, guarded):
+        start = len(self.lines)
+        indent = self._block(f"{var}.__class__ is list", indent, guarded)
+        if "minItems" in schema:
+            self.emit(indent, f"if len({var}) < {schema['minItems']!r}:")
+            self.fail(indent + 1, path, f"'se esperaban al menos {schema['minItems']} elementos, hay ' + "
+                                        f"str(len({var}))")
+        if "items" in schema:
+            index, child = self.name("i"), self.name("v")
+            items_start = len(self.lines)
+            self.emit(indent, f"for {index}, {child} in enumerate({var}):")
+            self.node(schema["items"], child, path + ["[", ("var", index), "]"], indent + 1)
+            self._discard_if_empty(items_start)
+        if not guarded:
+            self._discard_if_empty(start)
+
+    def _string(self, schema, var, path, indent, guarded):
+        indent = self._block(f"{var}.__class__ is str", indent, guarded)
+        if "minLength" in schema:
+            self.emit(indent, f"if len({var}) < {schema['minLength']!r}:")
+            self.fail(indent + 1, path, f"repr({var}) + ' tiene menos de {schema['minLength']} caracteres'")
+        if "pattern" in schema:
+            pattern = self.constant(re.compile(schema["pattern"]))
+            self.emit(indent, f"if {pattern}.search({var}) is None:")
+            self.fail(indent + 1, path, f"repr({var}) + ' no cumple el patrón ' + repr({pattern}.pattern)")
+
+
+def compile_schema(schema):
+    """
+    Compila un esquema a un validador
+    :param schema: Esquema declarativo (dict)
+    :return: Callable(value) que devuelve la lista de violaciones (vacía si es válido)
+    """
+    compiler = _Compiler()
+    compiler.emit(0, "def validate(v0):")
+    compiler.emit(1, "errors = []")
+    compiler.node(schema, "v0", ["$"], 1)
+    compiler.emit(1, "return errors")
+
+    namespace = {**compiler.constants, "MISSING": object()}
+    exec(compile("\n".join(compiler.lines), "<schema>", "exec"), namespace)
+    return namespace["validate"]
+
+
+class SchemaRegistry:
+    """Esquemas por nombre, compilados la primera vez que se usan"""
+
+    def __init__(self, schemas=None):
+        self._schemas = dict(schemas or {})
+        self._compiled = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, schema):
+        """Registra (o reemplaza) un esquema"""
+        with self._lock:
+            self._schemas[name] = schema
+            self._compiled = {key: value for key, value in self._compiled.items() if key[0] != name}
+
+    def validator(self, schema, many=False):
+        """
+        Validador compilado (cacheado)
+        :param schema: Nombre de un esquema registrado o esquema en línea (dict)
+        :param many: Validar una lista de registros del esquema
+        """
+        if isinstance(schema, str):
+            key = (schema, many)
+        else:
+            key = (json.dumps(schema, sort_keys=True), many)
+        with self._lock:
+            validator = self._compiled.get(key)
+            if validator is None:
+                definition = self._schemas[schema] if isinstance(schema, str) else schema
+                if many:
+                    definition = {"type": "array", "items": definition}
+                validator = self._compiled[key] = compile_schema(definition)
+        return validator
+
+    def errors(self, schema, data, many=False):
+        """Todas las violaciones del payload (lista vacía si es válido)"""
+        return self.validator(schema, many)(data)
+
+    def validate(self, schema, data, many=False):
+        """Lanza SchemaViolation con todas las violaciones si el payload no cumple el esquema"""
+        errors = self.errors(schema, data, many)
+        if errors:
+            raise SchemaViolation(schema if isinstance(schema, str) else "en línea", errors)
+
+
+NON_EMPTY_STRING = {"type": "string", "minLength": 1}
+POSITIVE_ID = {"type": "integer", "minimum": 1}
+
+REQRES_USER = {
+    "type": "object",
+    "required": ["id", "email", "first_name", "last_name", "avatar"],
+    "properties": {
+        "id": POSITIVE_ID,
+        "email": NON_EMPTY_STRING,
+        "first_name": NON_EMPTY_STRING,
+        "last_name": NON_EMPTY_STRING,
+        "avatar": {"type": "string", "pattern": r"\.jpg$"},
+    },
+}
+
+SCHEMAS = SchemaRegistry({
+    # JSONPlaceholder
+    "post": {
+        "type": "object",
+        "required": ["id", "title", "body", "userId"],
+        "properties": {"id": POSITIVE_ID, "title": {"type": "string"}, "body": {"type": "string"},
+                       "userId": POSITIVE_ID},
+    },
+    "photo": {
+        "type": "object",
+        "required": ["albumId", "id", "title", "url", "thumbnailUrl"],
+        "properties": {"albumId": POSITIVE_ID, "id": POSITIVE_ID, "title": {"type": "string"},
+                       "url": {"type": "string", "pattern": r"^https?://"},
+                       "thumbnailUrl": {"type": "string", "pattern": r"^https?://"}},
+    },
+    # ReqRes
+    "user": REQRES_USER,
+    "single_user": {"type": "object", "required": ["data"], "properties": {"data": REQRES_USER}},
+    "users_page": {
+        "type": "object",
+        "required": ["page", "per_page", "total", "total_pages", "data"],
+        "properties": {
+            "page": POSITIVE_ID,
+            "per_page": POSITIVE_ID,
+            "total": {"type": "integer", "minimum": 0},
+            "total_pages": {"type": "integer", "minimum": 0},
+            "data": {"type": "array", "items": REQRES_USER},
+        },
+    },
+    "created_user": {
+        "type": "object",
+        "required": ["name", "job", "id", "createdAt"],
+        "properties": {"name": {"type": "string"}, "job": {"type": "string"},
+                       "id": {"type": ["string", "integer"]}, "createdAt": NON_EMPTY_STRING},
+    },
+})
@@ -0,0 +1,238 @@
+"""
+Tiempos por request de APIClient, medidos con reloj monotónico (time.perf_counter)
+Cada request se descompone en espera del pool de conexiones, conexión (TCP + TLS),
+tiempo hasta el primer byte (servidor) y descarga del body; lo que resta del total
+es tiempo del propio cliente (reintentos, cassettes, caché, serialización)
+"""
+import random
+import re
+import threading
+import time
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+PHASES = ("pool_wait", "connect", "ttfb", "download")
+
+_current = threading.local()
+
+
+def endpoint_name(method, endpoint):
+    """Agrupa las requests por método y path con los ids reemplazados (/posts/{id})"""
+    path = re.sub(r"/\d+(?=/|$)", "/{id}", urlsplit(endpoint).path or endpoint)
+    return f"{method.upper()} {path}"
+
+
+def current():
+    """Tiempos de la request en curso en este hilo (None fuera de APIClient)"""
+    return getattr(_current, "timing", None)
+
+
+class RequestTiming:
+    """
+    Tiempos (en segundos) de una request; con reintentos se suman los intentos
+    (la descarga es la del último: la de los anteriores queda como tiempo del cliente)
+    """
+
+    def __init__(self, method, endpoint):
+        self.endpoint = endpoint_name(method, endpoint)
+        self.status = None
+        # network, cache o cassette (de dónde salió la respuesta)
+        self.source = "network"
+        self.attempts = 0
+        self.new_connections = 0
+        self.pool_wait = 0.0
+        self.connect = 0.0
+        self.ttfb = 0.0
+        self.download = 0.0
+        self.total = 0.0
+        self._start = None
+        self._request_start = None
+        self._connect_before = 0.0
+        self._headers_at = None
+
+    @property
+    def client(self):
+        """Tiempo fuera de la red: reintentos, cassettes, caché y procesamiento del cliente"""
+        return max(0.0, self.total - self.pool_wait - self.connect - self.ttfb - self.download)
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        self._previous = current()
+        _current.timing = self
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter()
+        self.total = end - self._start
+        if self._headers_at is not None:
+            # requests lee el body completo antes de devolver la respuesta
+            self.download += end - self._headers_at
+            self._headers_at = None
+        _current.timing = self._previous
+        return False
+
+    def as_dict(self):
+        data = {"endpoint": self.endpoint, "status": self.status, "source": self.source,
+                "attempts": self.attempts, "new_connections": self.new_connections}
+        for phase in PHASES + ("client", "total"):
+            data[phase] = round(getattr(self, phase) * 1000, 3)
+        return data
+
+    def __repr__(self):
+        phases = " ".join(f"{phase}={getattr(self, phase) * 1000:.1f}ms" for phase in PHASES)
+        return f"<RequestTiming {self.endpoint} {self.status} {self.source} {phases} total={self.total * 1000:.1f}ms>"
+
+
+class _TimedConnectionMixin:
+    """Mide conexión (TCP + TLS) y tiempo hasta el primer byte de cada intento"""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            timing = current()
+            if timing is not None:
+                timing.connect += time.perf_counter() - start
+                timing.new_connections += 1
+
+    def request(self, *args, **kwargs):
+        timing = current()
+        if timing is not None:
+            timing._request_start = time.perf_counter()
+            timing._connect_before = timing.connect
+        return super().request(*args, **kwargs)
+
+    def getresponse(self, *args, **kwargs):
+        response = super().getresponse(*args, **kwargs)
+        timing = current()
+        if timing is not None and timing._request_start is not None:
+            now = time.perf_counter()
+            # Si la conexión se abrió dentro de request() (HTTP sin TLS) no es tiempo del servidor
+            timing.ttfb += now - timing._request_start - (timing.connect - timing._connect_before)
+            timing._headers_at = now
+            timing._request_start = None
+            timing.attempts += 1
+        return response
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedPoolMixin:
+    """Mide la espera por una conexión libre del pool"""
+
+    def _get_conn(self, timeout=None):
+        start = time.perf_counter()
+        try:
+            return super()._get_conn(timeout)
+        finally:
+            timing = current()
+            if timing is not None:
+                timing.pool_wait += time.perf_counter() - start
+
+
+class TimedHTTPConnectionPool(_TimedPoolMixin, HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(_TimedPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter cuyos pools y conexiones registran los tiempos de cada fase"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+
+def percentile(values, pct):
+    """Percentil por rango más cercano (0.0 sin valores); el mismo criterio en todos los resúmenes"""
+    values = sorted(values)
+    return values[max(0, -(-len(values) * pct // 100) - 1)] if values else 0.0
+
+
+# Totales que se guardan por endpoint para los percentiles (muestreo de reservorio)
+SAMPLE_SIZE = 1000
+
+
+class EndpointTimings:
+    """
+    Agregado de las requests de un endpoint: cantidad, suma de cada fase y una muestra
+    acotada de los totales; la memoria no crece con la cantidad de requests
+    """
+
+    def __init__(self, sample_size=SAMPLE_SIZE, seed=0):
+        self.count = 0
+        self.sums = dict.fromkeys(PHASES + ("client",), 0.0)
+        self.sample = []
+        self.sample_size = sample_size
+        self._random = random.Random(seed)
+
+    def add(self, timing):
+        self.count += 1
+        for phase in self.sums:
+            self.sums[phase] += getattr(timing, phase)
+        if len(self.sample) < self.sample_size:
+            self.sample.append(timing.total)
+        else:
+            slot = self._random.randrange(self.count)
+            if slot < self.sample_size:
+                self.sample[slot] = timing.total
+
+    def mean(self, phase):
+        return self.sums[phase] / self.count if self.count else 0.0
+
+
+class TimingStats:
+    """Tiempos de la ejecución por endpoint (agregados) y de las requests del test en curso"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.by_endpoint = {}
+        self.test_timings = []
+
+    def add(self, timing):
+        with self._lock:
+            endpoint = self.by_endpoint.get(timing.endpoint)
+            if endpoint is None:
+                endpoint = self.by_endpoint[timing.endpoint] = EndpointTimings()
+            endpoint.add(timing)
+            self.test_timings.append(timing)
+
+    def begin_test(self):
+        """Empieza a juntar las requests de un nuevo test"""
+        with self._lock:
+            self.test_timings = []
+
+    @property
+    def active(self):
+        return bool(self.by_endpoint)
+
+    def resumen_por_endpoint(self):
+        """Una línea por endpoint con p50 del total y la media de cada fase (ms)"""
+        lines = []
+        with self._lock:
+            endpoints = sorted(self.by_endpoint.items())
+        for endpoint, timings in endpoints:
+            means = " | ".join(f"{phase} {timings.mean(phase) * 1000:.1f}" for phase in PHASES + ("client",))
+            p50 = percentile(timings.sample, 50) * 1000
+            p95 = percentile(timings.sample, 95) * 1000
+            lines.append(f"{endpoint}: n={timings.count} | total p50 {p50:.1f} / p95 {p95:.1f} | media: {means}")
+        return lines
+
+
+TIMING_STATS = TimingStats()
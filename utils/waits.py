@@ -0,0 +1,129 @@
+"""
+Motor de esperas por postcondición
+Cada acción declara qué espera que ocurra (cambio de URL, aparición de un
+elemento, cambio del contador del carrito...) y se espera exactamente eso,
+en lugar de pausas fijas con time.sleep
+"""
+import time
+from contextlib import contextmanager
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from utils import config
+
+
+DEFAULT_TIMEOUT = 15
+# Espera corta para verificar que algo está presente (las ausencias responden con el DOM actual)
+PRESENCE_TIMEOUT = 3
+POLL_FREQUENCY = 0.1
+
+CART_BADGE = (By.CLASS_NAME, "shopping_cart_badge")
+
+
+class Expect:
+    """Postcondiciones reutilizables (callables que reciben el driver, como expected_conditions)"""
+
+    @staticmethod
+    def url_contains(fragment):
+        """La URL actual contiene el fragmento"""
+        return EC.url_contains(fragment)
+
+    @staticmethod
+    def url_changes(url):
+        """La URL actual es distinta de la indicada"""
+        return EC.url_changes(url)
+
+    @staticmethod
+    def element_present(locator):
+        """El elemento existe en el DOM"""
+        return EC.presence_of_element_located(locator)
+
+    @staticmethod
+    def element_visible(locator):
+        """El elemento es visible"""
+        return EC.visibility_of_element_located(locator)
+
+    @staticmethod
+    def element_absent(locator):
+        """El elemento ya no existe en el DOM"""
+        return lambda driver: len(driver.find_elements(*locator)) == 0
+
+    @staticmethod
+    def element_count_changes(locator, previous_count):
+        """La cantidad de elementos que coinciden con el locator cambió"""
+        return lambda driver: len(driver.find_elements(*locator)) != previous_count
+
+    @staticmethod
+    def value_equals(locator, text):
+        """El campo de entrada contiene exactamente el texto"""
+        return lambda driver: driver.find_element(*locator).get_attribute("value") == text
+
+    @staticmethod
+    def badge_count(expected):
+        """El contador del carrito muestra la cantidad esperada (0 = sin badge)"""
+        def _condition(driver):
+            badges = driver.find_elements(*CART_BADGE)
+            count = int(badges[0].text) if badges and badges[0].text else 0
+            return count == expected
+        return _condition
+
+    @staticmethod
+    def any_of(*conditions):
+        """Se cumple alguna de las postcondiciones"""
+        return EC.any_of(*conditions)
+
+
+@contextmanager
+def without_implicit_wait(driver):
+    """
+    Desactiva temporalmente la espera implícita (solo si está configurada, ver
+    config.implicit_wait) para que las consultas respondan con el DOM actual
+    """
+    implicit = config.implicit_wait()
+    if implicit:
+        driver.implicitly_wait(0)
+    try:
+        yield
+    finally:
+        if implicit:
+            driver.implicitly_wait(implicit)
+
+
+def demo_pause(seconds=1.0):
+    """Pausa visual solo en modo demo (DEMO_MODE=true), para seguir la ejecución a ojo"""
+    if config.demo_mode():
+        time.sleep(seconds)
+
+
+class WaitEngine:
+    """Espera centralizada de postcondiciones para las acciones de los Page Objects"""
+
+    def __init__(self, driver, timeout=DEFAULT_TIMEOUT, poll_frequency=POLL_FREQUENCY, on_settle=None):
+        """
+        :param on_settle: Callable sin argumentos llamado cuando una acción terminó de asentarse
+        """
+        self.driver = driver
+        self.wait = WebDriverWait(driver, timeout, poll_frequency=poll_frequency)
+        self.on_settle = on_settle
+
+    def until(self, condition, message=""):
+        """
+        Espera a que se cumpla la postcondición
+        :param condition: Callable que recibe el driver (ver Expect)
+        :param message: Mensaje de la TimeoutException si no se cumple
+        :return: Valor devuelto por la condición
+        """
+        # Las condiciones de ausencia no deben bloquearse en la espera implícita
+        with without_implicit_wait(self.driver):
+            return self.wait.until(condition, message)
+
+    def settle(self, expect=None, demo_seconds=1.0):
+        """
+        Cierra una acción: espera su postcondición (si la declaró) y,
+        en modo demo, agrega la pausa visual
+        """
+        result = self.until(expect) if expect is not None else None
+        demo_pause(demo_seconds)
+        if self.on_settle is not None:
+            self.on_settle()
+        return result